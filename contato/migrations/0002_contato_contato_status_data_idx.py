@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-19 05:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contato', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contato',
+            index=models.Index(fields=['status', '-data_criacao'], name='contato_status_data_idx'),
+        ),
+    ]
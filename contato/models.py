@@ -94,6 +94,9 @@ class Contato(models.Model):
         verbose_name = "Contato"
         verbose_name_plural = "Contatos"
         ordering = ['-data_criacao']
+        indexes = [
+            models.Index(fields=['status', '-data_criacao'], name='contato_status_data_idx'),
+        ]
         
     def __str__(self):
         return f"{self.nome} - {self.get_assunto_display()} ({self.data_criacao.strftime('%d/%m/%Y %H:%M')})"
@@ -1,3 +1,83 @@
-from django.test import TestCase
+import json
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from django.core import mail
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from .models import Contato
+
+
+@skipUnless(connection.vendor == 'sqlite', 'Plano de execução verificado no SQLite')
+class IndicesConsultasTests(TestCase):
+    """A listagem de contatos por status usa índice"""
+
+    def test_contatos_por_status(self):
+        plano = Contato.objects.filter(status='novo').order_by('-data_criacao').explain()
+        self.assertIn('USING INDEX contato_status_data_idx', plano, plano)
+
+
+class LimiteEnviosTests(TestCase):
+    """Envios acima do limite recebem 429 sem tocar no banco nem no e-mail"""
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        # Não escreve no contatos.log versionado
+        patcher = mock.patch('contato.views.logger')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def enviar(self, email, ip='10.0.0.1', **extra):
+        return self.client.post(
+            reverse('contato:processar'),
+            data=json.dumps({'name': 'Fulano', 'email': email, 'message': 'Olá'}),
+            content_type='application/json',
+            HTTP_X_REQUESTED_WITH='XMLHttpRequest',
+            REMOTE_ADDR=ip,
+            **extra,
+        )
+
+    def test_limite_por_email(self):
+        for _ in range(5):
+            self.assertEqual(self.enviar('fulano@example.com', ip='10.0.0.1').status_code, 200)
+
+        # Mesmo e-mail de outro IP continua bloqueado
+        with self.assertNumQueries(0):
+            response = self.enviar('Fulano@Example.com ', ip='10.0.0.2')
+        self.assertEqual(response.status_code, 429)
+        self.assertIn('Retry-After', response)
+        self.assertFalse(response.json()['success'])
+        self.assertEqual(Contato.objects.count(), 5)
+        self.assertEqual(len(mail.outbox), 5)
+
+    def test_limite_por_ip(self):
+        for numero in range(5):
+            self.assertEqual(self.enviar(f'pessoa{numero}@example.com').status_code, 200)
+
+        self.assertEqual(self.enviar('outra@example.com').status_code, 429)
+        self.assertEqual(self.enviar('outra@example.com', ip='10.0.0.9').status_code, 200)
+
+    def test_x_forwarded_for_do_cliente_nao_muda_o_ip(self):
+        for numero in range(5):
+            response = self.enviar(f'pessoa{numero}@example.com', HTTP_X_FORWARDED_FOR=f'203.0.113.{numero}')
+            self.assertEqual(response.status_code, 200)
+
+        response = self.enviar('outra@example.com', HTTP_X_FORWARDED_FOR='203.0.113.99')
+        self.assertEqual(response.status_code, 429)
+
+    @override_settings(PROXIES_CONFIAVEIS=1)
+    def test_ip_acrescentado_pelo_proxy(self):
+        # O proxy acrescenta o IP real ao fim; o item forjado pelo cliente fica à esquerda
+        for numero in range(5):
+            response = self.enviar(
+                f'pessoa{numero}@example.com', HTTP_X_FORWARDED_FOR=f'203.0.113.{numero}, 198.51.100.7',
+            )
+            self.assertEqual(response.status_code, 200)
+
+        response = self.enviar('outra@example.com', HTTP_X_FORWARDED_FOR='198.51.100.7')
+        self.assertEqual(response.status_code, 429)
+        response = self.enviar('outra@example.com', HTTP_X_FORWARDED_FOR='198.51.100.8')
+        self.assertEqual(response.status_code, 200)
@@ -10,23 +10,23 @@ from django.utils import timezone
 import json
 import logging
 
+from core.limites import campo, email_normalizado, ip_cliente, limitar_envios
 from .models import Contato
 
 logger = logging.getLogger(__name__)
 
 
 def get_client_ip(request):
-    """Obtém o IP real do cliente"""
-    x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-    if x_forwarded_for:
-        ip = x_forwarded_for.split(',')[0]
-    else:
-        ip = request.META.get('REMOTE_ADDR')
-    return ip
+    """Obtém o IP real do cliente (ver core.limites.ip_cliente)"""
+    return ip_cliente(request)
 
 
 @csrf_exempt
 @require_http_methods(["POST"])
+@limitar_envios('contato', limite=5, periodo=10 * 60, chaves={
+    'ip': ip_cliente,
+    'email': campo('email', email_normalizado),
+})
 def processar_contato(request):
     """
     View para processar o formulário de contato via AJAX
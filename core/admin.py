@@ -1,7 +1,7 @@
 from django.contrib import admin
 from django.http import HttpResponseRedirect
 from django.urls import path
-from .models import SessaoQuemSomos, CardQuemSomos, SessaoOndeAtuamos, AreaAtuacao, Configuracoes
+from .models import SessaoQuemSomos, CardQuemSomos, SessaoOndeAtuamos, AreaAtuacao, Configuracoes, TarefaPDF
 
 # Register your models here.
 
@@ -294,3 +294,30 @@ class ConfiguracoesAdmin(admin.ModelAdmin):
         css = {
             'all': ('admin/css/custom_admin.css',)
         }
+
+
+
+@admin.register(TarefaPDF)
+class TarefaPDFAdmin(admin.ModelAdmin):
+    """
+    Acompanhamento da fila de PDFs (comando processar_pdfs)
+    """
+    list_display = ('titulo', 'tipo', 'versao', 'status', 'tamanho', 'criado_em', 'concluido_em')
+    list_filter = ('status', 'tipo')
+    search_fields = ('titulo',)
+    readonly_fields = (
+        'tipo', 'objeto_id', 'versao', 'titulo', 'status', 'tamanho', 'erro',
+        'criado_em', 'iniciado_em', 'concluido_em',
+    )
+    exclude = ('conteudo',)
+    actions = ['reenfileirar']
+
+    def has_add_permission(self, request):
+        return False
+
+    @admin.action(description="Reenfileirar tarefas com erro")
+    def reenfileirar(self, request, queryset):
+        total = queryset.filter(status=TarefaPDF.ERRO).filter(conteudo__isnull=False).update(
+            status=TarefaPDF.PENDENTE, erro='',
+        )
+        self.message_user(request, f'{total} tarefa(s) devolvida(s) para a fila.')
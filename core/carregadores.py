@@ -0,0 +1,27 @@
+"""
+Loader de templates que remove a indentação das linhas da página inicial.
+
+A página inicial é longa e muito aninhada: a indentação chegava a um terço
+do HTML entregue. O navegador colapsa espaços em branco entre elementos, então
+tirar os espaços do começo de cada linha não muda a renderização. A remoção
+acontece ao ler o arquivo, antes da compilação; com o cached.Loader ela roda
+uma vez por worker, e não a cada requisição.
+"""
+import re
+
+from django.template.loaders.app_directories import Loader
+
+INDENTACAO = re.compile(r'\n[ \t]+')
+
+
+class CarregadorCompacto(Loader):
+    """app_directories.Loader que remove a indentação dos templates em `prefixos`"""
+
+    # Sem <pre> nem <textarea> com conteúdo nesses templates
+    prefixos = ('core/index.html', 'core/inicio/')
+
+    def get_contents(self, origin):
+        conteudo = super().get_contents(origin)
+        if origin.template_name and origin.template_name.startswith(self.prefixos):
+            return INDENTACAO.sub('\n', conteudo)
+        return conteudo
@@ -0,0 +1,7 @@
+from django.db.backends.mysql import base
+
+from core.db.instrumentacao import ConexaoInstrumentadaMixin
+
+
+class DatabaseWrapper(ConexaoInstrumentadaMixin, base.DatabaseWrapper):
+    pass
@@ -0,0 +1,106 @@
+import os
+import threading
+import time
+
+from django.conf import settings
+from django.db import connections
+
+_trava = threading.Lock()
+_metricas = {}
+
+
+def _metricas_vazias():
+    return {
+        'aberturas': 0,
+        'fechamentos': 0,
+        'latencia_total': 0.0,
+        'latencia_maxima': 0.0,
+        'latencia_ultima': 0.0,
+    }
+
+
+def _metricas_alias(alias):
+    if alias not in _metricas:
+        _metricas[alias] = _metricas_vazias()
+    return _metricas[alias]
+
+
+def registrar_abertura(alias, duracao):
+    with _trava:
+        metricas = _metricas_alias(alias)
+        metricas['aberturas'] += 1
+        metricas['latencia_total'] += duracao
+        metricas['latencia_maxima'] = max(metricas['latencia_maxima'], duracao)
+        metricas['latencia_ultima'] = duracao
+
+
+def registrar_fechamento(alias):
+    with _trava:
+        _metricas_alias(alias)['fechamentos'] += 1
+
+
+class ConexaoInstrumentadaMixin:
+    """
+    Mede o tempo de abertura das conexões e quantas estão abertas no
+    processo. Usado pelos backends em core.db.backends.
+
+    Com pool nativo (PostgreSQL) a "abertura" é a retirada de uma conexão
+    do pool, então a latência medida é a de espera pelo pool.
+    """
+
+    def get_new_connection(self, conn_params):
+        inicio = time.perf_counter()
+        conexao = super().get_new_connection(conn_params)
+        registrar_abertura(self.alias, time.perf_counter() - inicio)
+        return conexao
+
+    def _close(self):
+        if self.connection is not None:
+            registrar_fechamento(self.alias)
+        return super()._close()
+
+
+def estatisticas_pool(conexao):
+    """Ocupação do pool nativo (psycopg_pool) ou None se não houver pool"""
+    if not conexao.settings_dict.get('OPTIONS', {}).get('pool'):
+        return None
+
+    estatisticas = conexao.pool.get_stats()
+    tamanho = estatisticas.get('pool_size', 0)
+    disponiveis = estatisticas.get('pool_available', 0)
+    return {
+        'tamanho': tamanho,
+        'disponiveis': disponiveis,
+        'em_uso': tamanho - disponiveis,
+        'minimo': estatisticas.get('pool_min'),
+        'maximo': estatisticas.get('pool_max'),
+        'aguardando': estatisticas.get('requests_waiting', 0),
+    }
+
+
+def estatisticas_conexoes():
+    """Métricas de conexão de cada banco configurado, neste processo"""
+    with _trava:
+        copia = {alias: dict(metricas) for alias, metricas in _metricas.items()}
+
+    bancos = {}
+    for alias in settings.DATABASES:
+        conexao = connections[alias]
+        metricas = copia.get(alias) or _metricas_vazias()
+        aberturas = metricas['aberturas']
+        bancos[alias] = {
+            'vendor': conexao.vendor,
+            'conn_max_age': conexao.settings_dict.get('CONN_MAX_AGE'),
+            'conn_health_checks': conexao.settings_dict.get('CONN_HEALTH_CHECKS'),
+            'conexoes_abertas': aberturas - metricas['fechamentos'],
+            'aberturas': aberturas,
+            'fechamentos': metricas['fechamentos'],
+            'latencia_abertura_ms': {
+                'media': round(metricas['latencia_total'] / aberturas * 1000, 2) if aberturas else None,
+                'maxima': round(metricas['latencia_maxima'] * 1000, 2),
+                'ultima': round(metricas['latencia_ultima'] * 1000, 2),
+            },
+            'pool': estatisticas_pool(conexao),
+        }
+
+    return {'pid': os.getpid(), 'bancos': bancos}
@@ -0,0 +1,129 @@
+"""
+Fila de geração de PDFs.
+
+As views chamam preparar(): o conteúdo do documento é montado (consultas
+leves: um edital e seus anexos, um projeto e suas entregas e riscos), a
+versão é o hash desse conteúdo e a tarefa é enfileirada uma vez por
+versão. Se o PDF daquela versão já existe, a view só mostra o link; nada é
+renderizado durante a requisição.
+
+O comando processar_pdfs reserva as tarefas pendentes e renderiza cada uma
+em um ProcessPoolExecutor (core.pdf.gravar não usa o Django nem o banco);
+o processo principal só atualiza o status das tarefas.
+
+As fontes de conteúdo ficam nos apps e são registradas em FONTES: uma
+função que recebe o objeto e retorna (título, blocos).
+"""
+from datetime import timedelta
+from pathlib import Path
+
+from django.conf import settings
+from django.http import FileResponse
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from . import pdf
+from .models import TarefaPDF
+
+FONTES = {
+    'edital': 'editais.pdf.conteudo_edital',
+    'projeto': 'projetos.pdf.conteudo_projeto',
+}
+
+
+def diretorio():
+    return Path(settings.RELATORIOS_DIR) / 'pdf'
+
+
+def caminho(tarefa):
+    return diretorio() / tarefa.tipo / f'{tarefa.objeto_id}-{tarefa.versao}.pdf'
+
+
+def preparar(tipo, objeto, refazer_erro=False):
+    """
+    Tarefa da versão atual do documento, enfileirada se ainda não existir.
+    Uma tarefa concluída cujo arquivo sumiu do disco volta para a fila, e
+    uma que falhou também, com `refazer_erro` (o pedido de download é a
+    nova tentativa). O erro anterior fica em tarefa.erro até a conclusão.
+    """
+    titulo, blocos = import_string(FONTES[tipo])(objeto)
+    # get_or_create trata a corrida de duas requisições pela mesma versão
+    tarefa, _ = TarefaPDF.objects.get_or_create(
+        tipo=tipo, objeto_id=objeto.pk, versao=pdf.versao_conteudo(blocos),
+        defaults={'titulo': titulo[:200], 'conteudo': blocos},
+    )
+
+    arquivo_sumiu = tarefa.pronta and not caminho(tarefa).exists()
+    if arquivo_sumiu or (refazer_erro and tarefa.status == TarefaPDF.ERRO):
+        tarefa.conteudo = blocos
+        tarefa.status = TarefaPDF.PENDENTE
+        tarefa.save(update_fields=['conteudo', 'status'])
+    return tarefa
+
+
+def reservar(limite):
+    """
+    Passa até `limite` tarefas pendentes para 'processando'. A troca de
+    status é um UPDATE condicional por tarefa, então dois workers nunca
+    pegam a mesma.
+    """
+    reservadas = []
+    pendentes = TarefaPDF.objects.filter(status=TarefaPDF.PENDENTE).order_by('criado_em')
+    for tarefa_id in pendentes.values_list('id', flat=True)[:limite]:
+        if TarefaPDF.objects.filter(pk=tarefa_id, status=TarefaPDF.PENDENTE).update(
+            status=TarefaPDF.PROCESSANDO, iniciado_em=timezone.now(),
+        ):
+            reservadas.append(TarefaPDF.objects.get(pk=tarefa_id))
+    return reservadas
+
+
+def concluir(tarefa, tamanho):
+    mesmo_documento = TarefaPDF.objects.filter(tipo=tarefa.tipo, objeto_id=tarefa.objeto_id)
+    if mesmo_documento.filter(pk__gt=tarefa.pk, status=TarefaPDF.CONCLUIDA).exists():
+        # Uma versão mais nova terminou antes desta, que já nasce obsoleta
+        caminho(tarefa).unlink(missing_ok=True)
+        tarefa.delete()
+        return
+
+    tarefa.status = TarefaPDF.CONCLUIDA
+    tarefa.tamanho = tamanho
+    tarefa.conteudo = None
+    tarefa.erro = ''
+    tarefa.concluido_em = timezone.now()
+    tarefa.save(update_fields=['status', 'tamanho', 'conteudo', 'erro', 'concluido_em'])
+
+    # Versões anteriores deixam de ser servidas; as que outro worker ainda
+    # está processando são descartadas quando terminarem (acima)
+    antigas = mesmo_documento.filter(pk__lt=tarefa.pk).exclude(status=TarefaPDF.PROCESSANDO)
+    for antiga in antigas.filter(status=TarefaPDF.CONCLUIDA):
+        caminho(antiga).unlink(missing_ok=True)
+    antigas.delete()
+
+
+def falhar(tarefa, erro):
+    tarefa.status = TarefaPDF.ERRO
+    tarefa.erro = str(erro)
+    tarefa.concluido_em = timezone.now()
+    tarefa.save(update_fields=['status', 'erro', 'concluido_em'])
+
+
+def liberar_travadas(minutos):
+    """Devolve para a fila tarefas em processamento há mais de `minutos` (worker interrompido)"""
+    limite = timezone.now() - timedelta(minutes=minutos)
+    return TarefaPDF.objects.filter(status=TarefaPDF.PROCESSANDO, iniciado_em__lt=limite).update(
+        status=TarefaPDF.PENDENTE,
+    )
+
+
+def resposta(tarefa, objeto, nome_arquivo):
+    """
+    FileResponse do PDF da tarefa concluída, ou None se o arquivo foi
+    apagado depois do preparar (uma versão mais nova concluiu nesse meio
+    tempo); nesse caso a versão atual volta para a fila.
+    """
+    try:
+        aberto = open(caminho(tarefa), 'rb')
+    except FileNotFoundError:
+        preparar(tarefa.tipo, objeto)
+        return None
+    return FileResponse(aberto, content_type='application/pdf', as_attachment=True, filename=nome_arquivo)
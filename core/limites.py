@@ -0,0 +1,131 @@
+"""
+Limite de envios dos formulários públicos (contato, notificações de editais).
+
+Janela fixa: cada chave da requisição (o IP e um campo do formulário, como
+o e-mail ou o CPF) tem um contador por janela de `periodo` segundos, e o
+envio que passa de `limite` na janela é recusado até a janela seguinte. O
+contador fica no cache e é incrementado com cache.incr, atômico no Redis e
+no Memcached, então workers diferentes dividem o mesmo contador quando o
+cache é compartilhado. Acima do limite a view nem é chamada: a resposta 429
+sai antes de qualquer consulta ao banco ou envio de e-mail.
+
+O IP vem de ip_cliente, que só confia no X-Forwarded-For acrescentado pelos
+proxies de PROXIES_CONFIAVEIS; o cabeçalho enviado pelo próprio cliente não
+muda a chave.
+"""
+from functools import wraps
+import hashlib
+import json
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse, JsonResponse
+
+MENSAGEM = 'Muitas solicitações em pouco tempo. Aguarde alguns minutos e tente novamente.'
+
+
+def ip_cliente(request):
+    """
+    IP de quem fez a requisição. Sem proxy (PROXIES_CONFIAVEIS = 0) é o
+    REMOTE_ADDR; com N proxies na frente, é o endereço que o mais externo
+    deles acrescentou ao X-Forwarded-For (o N-ésimo a partir do fim). Os
+    itens à esquerda vêm do cliente e podem ser qualquer coisa.
+    """
+    saltos = settings.PROXIES_CONFIAVEIS
+    encaminhado = request.META.get('HTTP_X_FORWARDED_FOR', '')
+    enderecos = [endereco.strip() for endereco in encaminhado.split(',') if endereco.strip()]
+    if not saltos or not enderecos:
+        return request.META.get('REMOTE_ADDR')
+    return enderecos[-min(saltos, len(enderecos))]
+
+
+def dados_enviados(request):
+    """Campos do envio, em JSON (AJAX) ou formulário"""
+    if request.content_type == 'application/json':
+        try:
+            dados = json.loads(request.body)
+        except ValueError:
+            return {}
+        return dados if isinstance(dados, dict) else {}
+    return request.POST
+
+
+def campo(nome, normalizar=str.strip):
+    """Chave a partir de um campo do envio; envios sem o campo não contam nessa chave"""
+    def valor(request):
+        conteudo = dados_enviados(request).get(nome)
+        if not isinstance(conteudo, str):
+            return None
+        return normalizar(conteudo) or None
+    return valor
+
+
+def email_normalizado(valor):
+    return valor.strip().lower()
+
+
+def apenas_digitos(valor):
+    return ''.join(caractere for caractere in valor if caractere.isdigit())
+
+
+def consumir(escopo, nome, valor, limite, periodo):
+    """
+    Conta um envio na janela atual; retorna os segundos até a próxima
+    janela se o limite foi ultrapassado, ou None.
+    """
+    agora = int(time.time())
+    janela = agora // periodo
+    # O valor vai como hash: e-mails e CPFs não ficam legíveis no cache
+    resumo = hashlib.sha1(str(valor).encode('utf-8')).hexdigest()[:16]
+    chave = f'limite:{escopo}:{nome}:{resumo}:{janela}'
+
+    # add só cria a chave se ela não existir; o incr a seguir é atômico
+    cache.add(chave, 0, timeout=periodo)
+    try:
+        usadas = cache.incr(chave)
+    except ValueError:
+        # A chave expirou entre o add e o incr: nova janela
+        cache.add(chave, 1, timeout=periodo)
+        usadas = 1
+    if usadas > limite:
+        return (janela + 1) * periodo - agora
+    return None
+
+
+def _resposta_limite(request, espera):
+    if request.content_type == 'application/json' or request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+        # Os formulários do site leem 'error' (contato) ou 'message' (editais)
+        response = JsonResponse(
+            {'success': False, 'error': MENSAGEM, 'message': MENSAGEM}, status=429,
+        )
+    else:
+        response = HttpResponse(MENSAGEM, status=429, content_type='text/plain; charset=utf-8')
+    response['Retry-After'] = str(espera)
+    return response
+
+
+def limitar_envios(escopo, limite, periodo, chaves, metodos=('POST',)):
+    """
+    Decorator de views públicas. `chaves` é um dicionário {nome: função}
+    em que cada função recebe a requisição e retorna o valor da chave (ou
+    None para não contar). Só as requisições com método em `metodos` contam.
+
+        @limitar_envios('contato', limite=5, periodo=600, chaves={
+            'ip': ip_cliente, 'email': campo('email', email_normalizado),
+        })
+    """
+    def decorator(view):
+        @wraps(view)
+        def _view(request, *args, **kwargs):
+            if request.method in metodos:
+                for nome, obter in chaves.items():
+                    valor = obter(request)
+                    if valor is None:
+                        continue
+                    espera = consumir(escopo, nome, valor, limite, periodo)
+                    if espera is not None:
+                        return _resposta_limite(request, espera)
+            return view(request, *args, **kwargs)
+        return _view
+    return decorator
@@ -0,0 +1,140 @@
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = (
+        'Compara a vazão de leituras e escritas concorrentes no SQLite com os '
+        'padrões do Django e com o perfil otimizado (SQLITE_PRAGMAS)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--segundos', type=float, default=5, help='Duração de cada rodada')
+        parser.add_argument('--leitores', type=int, default=4, help='Threads de leitura')
+        parser.add_argument('--escritores', type=int, default=2, help='Threads de escrita')
+        parser.add_argument('--linhas', type=int, default=20000, help='Linhas iniciais da tabela')
+
+    def handle(self, *args, **options):
+        perfis = [
+            ('padrão', {'pragmas': {}, 'timeout': 5, 'begin': 'BEGIN'}),
+            ('otimizado', {
+                # O banco é temporário: mede o WAL mesmo em DEBUG
+                'pragmas': {**settings.SQLITE_PRAGMAS, 'journal_mode': 'WAL'},
+                'timeout': settings.SQLITE_BUSY_TIMEOUT,
+                'begin': 'BEGIN IMMEDIATE',
+            }),
+        ]
+
+        resultados = {}
+        with tempfile.TemporaryDirectory() as diretorio:
+            for nome, perfil in perfis:
+                caminho = os.path.join(diretorio, f'{nome}.sqlite3')
+                self.preparar(caminho, perfil, options['linhas'])
+                self.stdout.write(f'Rodando perfil {nome}...')
+                resultados[nome] = self.rodar(caminho, perfil, options)
+
+        self.stdout.write('')
+        self.stdout.write(f"{'perfil':<10} {'leituras/s':>12} {'escritas/s':>12} {'bloqueios':>10}")
+        for nome, resultado in resultados.items():
+            self.stdout.write(
+                f"{nome:<10} {resultado['leituras']:>12.0f} "
+                f"{resultado['escritas']:>12.0f} {resultado['bloqueios']:>10}"
+            )
+
+        padrao, otimizado = resultados['padrão'], resultados['otimizado']
+        for tipo in ('leituras', 'escritas'):
+            if padrao[tipo]:
+                self.stdout.write(self.style.SUCCESS(
+                    f'{tipo.capitalize()}: {otimizado[tipo] / padrao[tipo]:.1f}x'
+                ))
+
+    def conectar(self, caminho, perfil):
+        # isolation_level=None: as transações são abertas explicitamente,
+        # como o backend do Django faz
+        conexao = sqlite3.connect(
+            caminho, timeout=perfil['timeout'], isolation_level=None, check_same_thread=False,
+        )
+        for pragma, valor in perfil['pragmas'].items():
+            conexao.execute(f'PRAGMA {pragma}={valor}')
+        return conexao
+
+    def preparar(self, caminho, perfil, linhas):
+        conexao = self.conectar(caminho, perfil)
+        conexao.execute(
+            'CREATE TABLE contato (id INTEGER PRIMARY KEY, nome TEXT, email TEXT, '
+            'mensagem TEXT, status TEXT, data_criacao REAL)'
+        )
+        conexao.execute('CREATE INDEX contato_status ON contato (status, data_criacao)')
+        conexao.execute('BEGIN')
+        conexao.executemany(
+            'INSERT INTO contato (nome, email, mensagem, status, data_criacao) VALUES (?, ?, ?, ?, ?)',
+            (
+                (f'Pessoa {i}', f'pessoa{i}@exemplo.com', 'Mensagem ' * 20, 'novo', time.time())
+                for i in range(linhas)
+            ),
+        )
+        conexao.execute('COMMIT')
+        conexao.close()
+
+    def rodar(self, caminho, perfil, options):
+        contadores = {'leituras': 0, 'escritas': 0, 'bloqueios': 0}
+        trava = threading.Lock()
+        fim = time.monotonic() + options['segundos']
+
+        def somar(chave):
+            with trava:
+                contadores[chave] += 1
+
+        def leitor():
+            conexao = self.conectar(caminho, perfil)
+            while time.monotonic() < fim:
+                try:
+                    conexao.execute(
+                        'SELECT id, nome, email FROM contato WHERE status = ? '
+                        'ORDER BY data_criacao DESC LIMIT 50', ('novo',)
+                    ).fetchall()
+                    somar('leituras')
+                except sqlite3.OperationalError:
+                    somar('bloqueios')
+            conexao.close()
+
+        def escritor():
+            conexao = self.conectar(caminho, perfil)
+            while time.monotonic() < fim:
+                try:
+                    conexao.execute(perfil['begin'])
+                    conexao.execute(
+                        'INSERT INTO contato (nome, email, mensagem, status, data_criacao) '
+                        'VALUES (?, ?, ?, ?, ?)',
+                        ('Nova pessoa', 'nova@exemplo.com', 'Mensagem', 'novo', time.time()),
+                    )
+                    conexao.execute('COMMIT')
+                    somar('escritas')
+                except sqlite3.OperationalError:
+                    if conexao.in_transaction:
+                        conexao.execute('ROLLBACK')
+                    somar('bloqueios')
+            conexao.close()
+
+        threads = (
+            [threading.Thread(target=leitor) for _ in range(options['leitores'])]
+            + [threading.Thread(target=escritor) for _ in range(options['escritores'])]
+        )
+        inicio = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        duracao = time.monotonic() - inicio
+
+        return {
+            'leituras': contadores['leituras'] / duracao,
+            'escritas': contadores['escritas'] / duracao,
+            'bloqueios': contadores['bloqueios'],
+        }
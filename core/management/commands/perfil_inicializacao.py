@@ -0,0 +1,233 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+from datetime import datetime
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Executado em um processo novo com -X importtime: o processo do manage.py
+# já está inicializado e não serve para medir o boot
+SCRIPT_MEDICAO = r'''
+import json, sys, time
+
+inicio_total = time.perf_counter()
+
+from django.apps import AppConfig
+
+tempos_ready = {}
+criar_original = AppConfig.create
+
+
+def criar_medindo(entry):
+    config = criar_original(entry)
+    ready = config.ready
+
+    def ready_medido():
+        inicio = time.perf_counter()
+        ready()
+        tempos_ready[config.label] = (time.perf_counter() - inicio) * 1000
+
+    config.ready = ready_medido
+    return config
+
+
+AppConfig.create = staticmethod(criar_medindo)
+
+import django
+
+inicio = time.perf_counter()
+django.setup()
+setup_ms = (time.perf_counter() - inicio) * 1000
+
+from django.urls import get_resolver
+
+inicio = time.perf_counter()
+resolver = get_resolver()
+resolver.url_patterns
+resolver._populate()
+urlconf_ms = (time.perf_counter() - inicio) * 1000
+
+sys.stdout.write(json.dumps({
+    'setup_ms': setup_ms,
+    'ready_ms': tempos_ready,
+    'urlconf_ms': urlconf_ms,
+    'total_ms': (time.perf_counter() - inicio_total) * 1000,
+}))
+'''
+
+
+class Command(BaseCommand):
+    help = (
+        'Mede o custo de inicialização (django.setup, AppConfig.ready, imports e '
+        'URLconf); com --comparar, compara com a linha de base gravada'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repeticoes', type=int, default=5, help='Processos medidos (usa a mediana)')
+        parser.add_argument('--top', type=int, default=15, help='Módulos mais caros exibidos')
+        # Os tempos dependem da máquina: a linha de base é local (fora do git)
+        parser.add_argument(
+            '--arquivo',
+            default=str(settings.BASE_DIR / 'perfil_inicializacao.json'),
+            help='Arquivo JSON da linha de base',
+        )
+        parser.add_argument('--salvar', action='store_true', help='Grava a medição como nova linha de base')
+        parser.add_argument(
+            '--comparar', action='store_true',
+            help='Compara com a linha de base e falha se houver regressão',
+        )
+        parser.add_argument(
+            '--tolerancia', type=float, default=30,
+            help='Aumento percentual acima do qual a comparação acusa regressão',
+        )
+        parser.add_argument(
+            '--minimo-ms', type=float, default=5,
+            help='Aumento absoluto mínimo para contar como regressão (descarta ruído)',
+        )
+
+    def handle(self, *args, **options):
+        if options['repeticoes'] < 1:
+            raise CommandError('--repeticoes deve ser maior que zero')
+
+        medicoes = [self.medir() for _ in range(options['repeticoes'])]
+        perfil = self.consolidar(medicoes)
+
+        self.exibir(perfil, options['top'])
+
+        base = self.carregar_base(options['arquivo']) if options['comparar'] else None
+        regressoes = []
+        if base:
+            regressoes = self.comparar(base, perfil, options['tolerancia'], options['minimo_ms'])
+
+        if options['salvar']:
+            perfil['gerado_em'] = datetime.now().isoformat(timespec='seconds')
+            perfil['python'] = sys.version.split()[0]
+            with open(options['arquivo'], 'w') as arquivo:
+                json.dump(perfil, arquivo, indent=2, ensure_ascii=False, sort_keys=True)
+                arquivo.write('\n')
+            self.stdout.write(self.style.SUCCESS(f"Linha de base gravada em {options['arquivo']}"))
+        elif regressoes:
+            raise CommandError(f'{len(regressoes)} regressões de inicialização acima de {options["tolerancia"]}%')
+
+    def medir(self):
+        """Roda o script de medição em um processo novo e devolve os tempos"""
+        resultado = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', SCRIPT_MEDICAO],
+            capture_output=True,
+            text=True,
+            cwd=str(settings.BASE_DIR),
+        )
+        if resultado.returncode != 0:
+            raise CommandError(f'Falha ao medir a inicialização:\n{resultado.stderr[-2000:]}')
+
+        tempos = json.loads(resultado.stdout.strip().splitlines()[-1])
+        tempos['imports_ms'] = self.ler_importtime(resultado.stderr)
+        return tempos
+
+    def ler_importtime(self, saida):
+        """Converte a saída do -X importtime em {módulo: (próprio_ms, acumulado_ms)}"""
+        modulos = {}
+        for linha in saida.splitlines():
+            if not linha.startswith('import time:') or 'self [us]' in linha:
+                continue
+            proprio, acumulado, nome = linha[len('import time:'):].split('|')
+            modulos[nome.strip()] = (int(proprio) / 1000, int(acumulado) / 1000)
+        return modulos
+
+    def consolidar(self, medicoes):
+        """Mediana de cada tempo entre as repetições"""
+        def mediana(valores):
+            return round(statistics.median(valores), 2)
+
+        apps = sorted({label for medicao in medicoes for label in medicao['ready_ms']})
+        modulos = sorted({nome for medicao in medicoes for nome in medicao['imports_ms']})
+
+        imports = {}
+        for nome in modulos:
+            valores = [medicao['imports_ms'][nome] for medicao in medicoes if nome in medicao['imports_ms']]
+            imports[nome] = {
+                'proprio_ms': mediana([proprio for proprio, _ in valores]),
+                'acumulado_ms': mediana([acumulado for _, acumulado in valores]),
+            }
+
+        # Custo próprio somado por pacote de primeiro nível (projetos, editais, django...)
+        pacotes = {}
+        for nome, tempos in imports.items():
+            pacote = nome.split('.')[0]
+            pacotes[pacote] = round(pacotes.get(pacote, 0) + tempos['proprio_ms'], 2)
+
+        return {
+            'repeticoes': len(medicoes),
+            'setup_ms': mediana([medicao['setup_ms'] for medicao in medicoes]),
+            'urlconf_ms': mediana([medicao['urlconf_ms'] for medicao in medicoes]),
+            'total_ms': mediana([medicao['total_ms'] for medicao in medicoes]),
+            'ready_ms': {
+                label: mediana([medicao['ready_ms'].get(label, 0) for medicao in medicoes])
+                for label in apps
+            },
+            'pacotes_ms': dict(sorted(pacotes.items(), key=lambda item: -item[1])),
+            # Módulos abaixo de 1 ms só aumentariam o diff da linha de base
+            'imports_ms': {
+                nome: tempos for nome, tempos in imports.items() if tempos['acumulado_ms'] >= 1
+            },
+        }
+
+    def exibir(self, perfil, top):
+        self.stdout.write(f"Mediana de {perfil['repeticoes']} processos")
+        self.stdout.write(f"  django.setup():  {perfil['setup_ms']:8.1f} ms")
+        self.stdout.write(f"  URLconf:         {perfil['urlconf_ms']:8.1f} ms")
+        self.stdout.write(f"  Total:           {perfil['total_ms']:8.1f} ms")
+
+        self.stdout.write('\nAppConfig.ready por app')
+        for label, tempo in sorted(perfil['ready_ms'].items(), key=lambda item: -item[1]):
+            self.stdout.write(f'  {label:<24} {tempo:8.2f} ms')
+
+        self.stdout.write('\nImport por pacote (tempo próprio)')
+        for pacote, tempo in list(perfil['pacotes_ms'].items())[:top]:
+            self.stdout.write(f'  {pacote:<24} {tempo:8.1f} ms')
+
+        self.stdout.write('\nMódulos mais caros (acumulado)')
+        mais_caros = sorted(perfil['imports_ms'].items(), key=lambda item: -item[1]['acumulado_ms'])
+        for nome, tempos in mais_caros[:top]:
+            self.stdout.write(f"  {nome:<48} {tempos['acumulado_ms']:8.1f} ms")
+
+    def carregar_base(self, caminho):
+        if not os.path.exists(caminho):
+            self.stdout.write(self.style.WARNING('\nSem linha de base; use --salvar para gravar uma.'))
+            return None
+        with open(caminho) as arquivo:
+            return json.load(arquivo)
+
+    def comparar(self, base, perfil, tolerancia, minimo_ms):
+        """Lista as métricas que pioraram além da tolerância em relação à base"""
+        metricas = [(chave, base.get(chave), perfil[chave]) for chave in ('setup_ms', 'urlconf_ms', 'total_ms')]
+        metricas += [
+            (f'ready:{label}', base.get('ready_ms', {}).get(label), tempo)
+            for label, tempo in perfil['ready_ms'].items()
+        ]
+        metricas += [
+            (f'pacote:{pacote}', base.get('pacotes_ms', {}).get(pacote), tempo)
+            for pacote, tempo in perfil['pacotes_ms'].items()
+        ]
+
+        self.stdout.write('\nComparação com a linha de base')
+        regressoes = []
+        for nome, anterior, atual in metricas:
+            if anterior is None or atual - anterior < minimo_ms:
+                continue
+            variacao = (atual - anterior) / anterior * 100 if anterior else 100
+            if variacao > tolerancia:
+                regressoes.append(nome)
+                self.stdout.write(self.style.ERROR(
+                    f'  {nome:<32} {anterior:8.1f} -> {atual:8.1f} ms (+{variacao:.0f}%)'
+                ))
+
+        novos = [pacote for pacote in perfil['pacotes_ms'] if pacote not in base.get('pacotes_ms', {})]
+        if novos:
+            self.stdout.write(self.style.WARNING(f"  Pacotes novos no boot: {', '.join(novos)}"))
+        if not regressoes:
+            self.stdout.write(self.style.SUCCESS('  Nenhuma regressão acima da tolerância'))
+        return regressoes
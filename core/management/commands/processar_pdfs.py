@@ -0,0 +1,79 @@
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import multiprocessing
+import os
+import time
+
+from django.core.management.base import BaseCommand
+
+from core import fila_pdf, pdf
+
+
+class Command(BaseCommand):
+    help = (
+        'Worker da fila de PDFs: renderiza as tarefas pendentes (editais e projetos) '
+        'em um pool de processos'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--processos',
+            type=int,
+            default=os.cpu_count() or 1,
+            help='Processos de renderização (padrão: número de CPUs)',
+        )
+        parser.add_argument(
+            '--intervalo',
+            type=float,
+            default=5.0,
+            help='Segundos entre consultas à fila quando ela está vazia',
+        )
+        parser.add_argument(
+            '--uma-vez',
+            action='store_true',
+            help='Processa as tarefas pendentes e termina',
+        )
+        parser.add_argument(
+            '--travadas-minutos',
+            type=int,
+            default=15,
+            help='Tarefas em processamento há mais tempo que isso voltam para a fila',
+        )
+
+    def handle(self, *args, **options):
+        liberadas = fila_pdf.liberar_travadas(options['travadas_minutos'])
+        if liberadas:
+            self.stdout.write(f'{liberadas} tarefas interrompidas voltaram para a fila')
+
+        processos = max(options['processos'], 1)
+        # spawn: os filhos não herdam as conexões de banco do processo principal
+        contexto = multiprocessing.get_context('spawn')
+        em_andamento = {}
+        concluidas = 0
+        with ProcessPoolExecutor(max_workers=processos, mp_context=contexto) as executor:
+            while True:
+                vagas = processos * 2 - len(em_andamento)
+                if vagas > 0:
+                    for tarefa in fila_pdf.reservar(vagas):
+                        futuro = executor.submit(pdf.gravar, tarefa.conteudo, str(fila_pdf.caminho(tarefa)))
+                        em_andamento[futuro] = tarefa
+
+                if not em_andamento:
+                    if options['uma_vez']:
+                        break
+                    time.sleep(options['intervalo'])
+                    continue
+
+                prontos, _ = wait(em_andamento, timeout=options['intervalo'], return_when=FIRST_COMPLETED)
+                for futuro in prontos:
+                    tarefa = em_andamento.pop(futuro)
+                    try:
+                        tamanho = futuro.result()
+                    except Exception as erro:
+                        fila_pdf.falhar(tarefa, erro)
+                        self.stderr.write(f'Erro em {tarefa}: {erro}')
+                    else:
+                        fila_pdf.concluir(tarefa, tamanho)
+                        concluidas += 1
+                        self.stdout.write(f'{tarefa.titulo}: {tamanho} bytes')
+
+        self.stdout.write(self.style.SUCCESS(f'{concluidas} PDFs gerados'))
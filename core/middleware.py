@@ -0,0 +1,187 @@
+import mimetypes
+import os
+import posixpath
+import re
+from urllib.parse import unquote
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, HttpResponse, HttpResponseNotModified, StreamingHttpResponse
+from django.utils._os import safe_join
+from django.utils.http import http_date
+from django.views.static import was_modified_since
+
+
+class ArquivosEstaticosMiddleware:
+    """
+    Serve os arquivos do STATIC_ROOT diretamente pelo Django, sem depender
+    de um servidor web na frente da aplicação.
+
+    Arquivos versionados pelo collectstatic (nome com hash) recebem cache de
+    longa duração com `immutable`; quando o navegador aceita, a variante
+    .br ou .gz gerada pelo ArmazenamentoEstaticoComprimido é enviada no lugar
+    do original. Deve ficar logo após o SecurityMiddleware.
+    """
+
+    codificacoes = (('br', '.br'), ('gzip', '.gz'))
+    tamanho_bloco = 64 * 1024
+    padrao_range = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.prefixo = '/' + settings.STATIC_URL.lstrip('/') if settings.STATIC_URL else None
+        self.raiz = str(settings.STATIC_ROOT) if settings.STATIC_ROOT else None
+        self.max_age = getattr(settings, 'STATIC_CACHE_MAX_AGE', 60 * 60 * 24 * 365)
+        self.max_age_nao_versionado = getattr(settings, 'STATIC_CACHE_MAX_AGE_NAO_VERSIONADO', 60)
+        # Metadados dos arquivos já servidos; o STATIC_ROOT só muda entre deploys
+        self.arquivos = {}
+
+    def __call__(self, request):
+        if (
+            self.raiz
+            and self.prefixo
+            and request.method in ('GET', 'HEAD')
+            and request.path_info.startswith(self.prefixo)
+        ):
+            resposta = self.servir(request, request.path_info[len(self.prefixo):])
+            if resposta is not None:
+                return resposta
+
+        return self.get_response(request)
+
+    @property
+    def nomes_versionados(self):
+        """Nomes com hash listados no staticfiles.json"""
+        if not hasattr(self, '_nomes_versionados'):
+            self._nomes_versionados = set(getattr(staticfiles_storage, 'hashed_files', {}).values())
+        return self._nomes_versionados
+
+    def obter_arquivo(self, nome):
+        """Retorna (e memoriza) os metadados do arquivo ou None se não existir"""
+        if nome in self.arquivos:
+            return self.arquivos[nome]
+
+        try:
+            caminho = safe_join(self.raiz, nome)
+        except SuspiciousFileOperation:
+            return None
+
+        if not os.path.isfile(caminho):
+            return None
+
+        estado = os.stat(caminho)
+        content_type, _ = mimetypes.guess_type(caminho)
+        variantes = {}
+        for codificacao, sufixo in self.codificacoes:
+            if os.path.isfile(caminho + sufixo):
+                variantes[codificacao] = (caminho + sufixo, os.path.getsize(caminho + sufixo))
+
+        arquivo = {
+            'caminho': caminho,
+            'tamanho': estado.st_size,
+            'mtime': estado.st_mtime,
+            'content_type': content_type or 'application/octet-stream',
+            'variantes': variantes,
+            'versionado': nome in self.nomes_versionados,
+        }
+        self.arquivos[nome] = arquivo
+        return arquivo
+
+    def escolher_codificacao(self, request, arquivo):
+        """Escolhe a melhor variante aceita pelo cliente (br antes de gzip)"""
+        aceitas = {
+            token.split(';')[0].strip().lower()
+            for token in request.META.get('HTTP_ACCEPT_ENCODING', '').split(',')
+        }
+        for codificacao, _ in self.codificacoes:
+            if codificacao in aceitas and codificacao in arquivo['variantes']:
+                return codificacao
+        return None
+
+    def servir(self, request, nome):
+        nome = posixpath.normpath(unquote(nome)).lstrip('/')
+        arquivo = self.obter_arquivo(nome)
+        if arquivo is None:
+            return None
+
+        if not was_modified_since(request.META.get('HTTP_IF_MODIFIED_SINCE'), arquivo['mtime']):
+            resposta = HttpResponseNotModified()
+            self.aplicar_cabecalhos_cache(resposta, arquivo)
+            return resposta
+
+        intervalo = request.META.get('HTTP_RANGE')
+        codificacao = None if intervalo else self.escolher_codificacao(request, arquivo)
+
+        if intervalo:
+            resposta = self.servir_intervalo(request, arquivo, intervalo)
+        elif request.method == 'HEAD':
+            resposta = HttpResponse(content_type=arquivo['content_type'])
+            tamanho = arquivo['variantes'][codificacao][1] if codificacao else arquivo['tamanho']
+            resposta['Content-Length'] = tamanho
+        else:
+            caminho = arquivo['variantes'][codificacao][0] if codificacao else arquivo['caminho']
+            resposta = FileResponse(open(caminho, 'rb'), content_type=arquivo['content_type'])
+            # O FileResponse deduz um Content-Disposition a partir do nome (.gz/.br)
+            if 'Content-Disposition' in resposta:
+                del resposta['Content-Disposition']
+
+        if codificacao:
+            resposta['Content-Encoding'] = codificacao
+        if arquivo['variantes']:
+            resposta['Vary'] = 'Accept-Encoding'
+        resposta['Accept-Ranges'] = 'bytes'
+        self.aplicar_cabecalhos_cache(resposta, arquivo)
+        return resposta
+
+    def servir_intervalo(self, request, arquivo, intervalo):
+        """Atende requisições Range (necessárias para o <video> em alguns navegadores)"""
+        tamanho = arquivo['tamanho']
+        correspondencia = self.padrao_range.match(intervalo.strip())
+        if not correspondencia or correspondencia.groups() == ('', ''):
+            resposta = HttpResponse(status=416)
+            resposta['Content-Range'] = f'bytes */{tamanho}'
+            return resposta
+
+        inicio, fim = correspondencia.groups()
+        if inicio == '':
+            # bytes=-N: últimos N bytes
+            inicio, fim = max(tamanho - int(fim), 0), tamanho - 1
+        else:
+            inicio = int(inicio)
+            fim = min(int(fim), tamanho - 1) if fim else tamanho - 1
+
+        if inicio >= tamanho or inicio > fim:
+            resposta = HttpResponse(status=416)
+            resposta['Content-Range'] = f'bytes */{tamanho}'
+            return resposta
+
+        comprimento = fim - inicio + 1
+        if request.method == 'HEAD':
+            resposta = HttpResponse(status=206, content_type=arquivo['content_type'])
+        else:
+            resposta = StreamingHttpResponse(
+                self.ler_intervalo(arquivo['caminho'], inicio, comprimento),
+                status=206,
+                content_type=arquivo['content_type'],
+            )
+        resposta['Content-Length'] = comprimento
+        resposta['Content-Range'] = f'bytes {inicio}-{fim}/{tamanho}'
+        return resposta
+
+    def ler_intervalo(self, caminho, inicio, comprimento):
+        with open(caminho, 'rb') as origem:
+            origem.seek(inicio)
+            while comprimento > 0:
+                bloco = origem.read(min(self.tamanho_bloco, comprimento))
+                if not bloco:
+                    break
+                comprimento -= len(bloco)
+                yield bloco
+
+    def aplicar_cabecalhos_cache(self, resposta, arquivo):
+        resposta['Last-Modified'] = http_date(arquivo['mtime'])
+        if arquivo['versionado']:
+            resposta['Cache-Control'] = f'public, max-age={self.max_age}, immutable'
+        else:
+            resposta['Cache-Control'] = f'public, max-age={self.max_age_nao_versionado}'
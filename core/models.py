@@ -598,3 +598,62 @@ class Configuracoes(models.Model):
     
     def __str__(self):
         return "Configurações do Site"
+
+
+class TarefaPDF(models.Model):
+    """
+    Fila de geração de PDFs (core.fila_pdf). Cada tarefa guarda o conteúdo
+    já montado e a versão dele; o comando processar_pdfs renderiza as
+    pendentes em um pool de processos.
+    """
+    PENDENTE = 'pendente'
+    PROCESSANDO = 'processando'
+    CONCLUIDA = 'concluida'
+    ERRO = 'erro'
+    STATUS_CHOICES = [
+        (PENDENTE, 'Pendente'),
+        (PROCESSANDO, 'Processando'),
+        (CONCLUIDA, 'Concluída'),
+        (ERRO, 'Erro'),
+    ]
+
+    tipo = models.CharField(max_length=20, verbose_name="Tipo")
+    objeto_id = models.PositiveBigIntegerField(verbose_name="ID do Objeto")
+    versao = models.CharField(max_length=16, verbose_name="Versão do Conteúdo")
+    titulo = models.CharField(max_length=200, verbose_name="Título")
+    conteudo = models.JSONField(
+        null=True,
+        blank=True,
+        verbose_name="Conteúdo",
+        help_text="Blocos de core.pdf; descartado depois que o arquivo é gerado"
+    )
+    status = models.CharField(
+        max_length=15,
+        choices=STATUS_CHOICES,
+        default=PENDENTE,
+        verbose_name="Status"
+    )
+    tamanho = models.PositiveIntegerField(default=0, verbose_name="Tamanho (bytes)")
+    erro = models.TextField(blank=True, verbose_name="Erro")
+    criado_em = models.DateTimeField(auto_now_add=True, verbose_name="Criado em")
+    iniciado_em = models.DateTimeField(null=True, blank=True, verbose_name="Iniciado em")
+    concluido_em = models.DateTimeField(null=True, blank=True, verbose_name="Concluído em")
+
+    class Meta:
+        verbose_name = "Tarefa de PDF"
+        verbose_name_plural = "Tarefas de PDF"
+        ordering = ['-criado_em']
+        constraints = [
+            models.UniqueConstraint(fields=['tipo', 'objeto_id', 'versao'], name='tarefa_pdf_versao_unica'),
+        ]
+        indexes = [
+            # Consulta do worker: pendentes na ordem de chegada
+            models.Index(fields=['status', 'criado_em'], name='tarefa_pdf_fila_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.titulo} ({self.get_status_display()})"
+
+    @property
+    def pronta(self):
+        return self.status == self.CONCLUIDA
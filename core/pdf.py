@@ -0,0 +1,228 @@
+"""
+Gerador mínimo de PDF (texto, títulos e tabelas), sem dependências.
+
+O conteúdo é uma lista de blocos simples, serializável em JSON, o que
+permite guardá-lo na fila (core.TarefaPDF), calcular a versão a partir
+dele e renderizá-lo em outro processo:
+
+    ['titulo', texto]
+    ['subtitulo', texto]
+    ['paragrafo', texto]
+    ['campos', [[rotulo, valor], ...]]
+    ['tabela', [cabecalho, ...], [[celula, ...], ...]]
+
+As páginas são A4 em Helvetica (fontes padrão do PDF, sem embutir) com
+codificação WinAnsi, que cobre a acentuação do português. A largura do
+texto é estimada por um fator médio da fonte, suficiente para quebrar
+linhas e truncar células sem medir cada caractere. O rodapé de cada página
+traz a data de geração, que fica fora dos blocos e portanto da versão.
+"""
+from datetime import date
+import hashlib
+import json
+import os
+import tempfile
+import zlib
+
+LARGURA_PAGINA, ALTURA_PAGINA = 595, 842
+MARGEM = 50
+LARGURA_UTIL = LARGURA_PAGINA - 2 * MARGEM
+
+# (fonte, tamanho, espaço antes) de cada estilo
+ESTILOS = {
+    'titulo': ('F2', 16, 6),
+    'subtitulo': ('F2', 12, 14),
+    'texto': ('F1', 10, 2),
+    'rotulo': ('F2', 10, 2),
+    'tabela': ('F1', 8, 1),
+    'cabecalho': ('F2', 8, 4),
+}
+# Largura média de um caractere em relação ao tamanho da fonte
+FATOR_LARGURA = {'F1': 0.5, 'F2': 0.55}
+
+
+def versao_conteudo(blocos):
+    """Hash curto do conteúdo; muda sempre que algum texto muda"""
+    serializado = json.dumps(blocos, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha1(serializado.encode('utf-8')).hexdigest()[:16]
+
+
+def _capacidade(largura, fonte, tamanho):
+    return max(int(largura / (tamanho * FATOR_LARGURA[fonte])), 1)
+
+
+def _quebrar(texto, capacidade):
+    """Linhas de até `capacidade` caracteres, quebrando nos espaços"""
+    linhas = []
+    for paragrafo in str(texto).splitlines() or ['']:
+        atual = ''
+        for palavra in paragrafo.split():
+            while len(palavra) > capacidade:
+                if atual:
+                    linhas.append(atual)
+                    atual = ''
+                linhas.append(palavra[:capacidade])
+                palavra = palavra[capacidade:]
+            if atual and len(atual) + 1 + len(palavra) > capacidade:
+                linhas.append(atual)
+                atual = palavra
+            else:
+                atual = f'{atual} {palavra}' if atual else palavra
+        linhas.append(atual)
+    return linhas
+
+
+def _truncar(texto, capacidade):
+    texto = ' '.join(str(texto).split())
+    return texto if len(texto) <= capacidade else texto[:capacidade - 1] + '…'
+
+
+def _literal(texto):
+    dados = texto.encode('cp1252', errors='replace')
+    return b'(' + dados.replace(b'\\', b'\\\\').replace(b'(', b'\\(').replace(b')', b'\\)') + b')'
+
+
+class _Paginas:
+    """Posiciona as linhas de texto e abre páginas novas quando a atual acaba"""
+
+    def __init__(self):
+        self.paginas = []
+        self.nova_pagina()
+
+    def nova_pagina(self):
+        self.atual = []
+        self.paginas.append(self.atual)
+        self.y = ALTURA_PAGINA - MARGEM
+
+    def reservar(self, altura):
+        if self.y - altura < MARGEM + 20 and self.atual:
+            self.nova_pagina()
+        self.y -= altura
+        return self.y
+
+    def texto(self, x, y, texto, fonte, tamanho):
+        self.atual.append((x, y, fonte, tamanho, texto))
+
+    def linha(self, estilo, texto, x=MARGEM):
+        fonte, tamanho, espaco = ESTILOS[estilo]
+        y = self.reservar(tamanho + espaco)
+        self.texto(x, y, texto, fonte, tamanho)
+
+    def colunas(self, estilo, celulas, larguras):
+        fonte, tamanho, espaco = ESTILOS[estilo]
+        y = self.reservar(tamanho + espaco + 2)
+        x = MARGEM
+        for celula, largura in zip(celulas, larguras):
+            self.texto(x, y, _truncar(celula, _capacidade(largura - 4, fonte, tamanho)), fonte, tamanho)
+            x += largura
+
+
+def _paginar(blocos):
+    paginas = _Paginas()
+    for bloco in blocos:
+        tipo = bloco[0]
+        if tipo in ('titulo', 'subtitulo', 'paragrafo'):
+            estilo = 'texto' if tipo == 'paragrafo' else tipo
+            fonte, tamanho, _ = ESTILOS[estilo]
+            for linha in _quebrar(bloco[1], _capacidade(LARGURA_UTIL, fonte, tamanho)):
+                paginas.linha(estilo, linha)
+        elif tipo == 'campos':
+            largura_rotulo = 150
+            fonte, tamanho, _ = ESTILOS['texto']
+            capacidade = _capacidade(LARGURA_UTIL - largura_rotulo, fonte, tamanho)
+            for rotulo, valor in bloco[1]:
+                for posicao, linha in enumerate(_quebrar(valor, capacidade)):
+                    if posicao == 0:
+                        paginas.linha('rotulo', _truncar(rotulo, 28))
+                        paginas.texto(MARGEM + largura_rotulo, paginas.y, linha, fonte, tamanho)
+                    else:
+                        paginas.linha('texto', linha, x=MARGEM + largura_rotulo)
+        elif tipo == 'tabela':
+            cabecalho, linhas = bloco[1], bloco[2]
+            larguras = [LARGURA_UTIL / len(cabecalho)] * len(cabecalho)
+            paginas.colunas('cabecalho', cabecalho, larguras)
+            for linha in linhas:
+                if paginas.y - 12 < MARGEM + 20:
+                    # Tabela continua na página seguinte com o cabeçalho repetido
+                    paginas.nova_pagina()
+                    paginas.colunas('cabecalho', cabecalho, larguras)
+                paginas.colunas('tabela', linha, larguras)
+        else:
+            raise ValueError(f'Bloco desconhecido: {tipo}')
+    return paginas.paginas
+
+
+def renderizar(blocos, gerado_em=None):
+    """Bytes do PDF com o conteúdo dos blocos, com a data de geração no rodapé"""
+    gerado_em = (gerado_em or date.today()).strftime('%d/%m/%Y')
+    paginas = _paginar(blocos)
+    total = len(paginas)
+
+    objetos = []
+
+    def adicionar(conteudo):
+        objetos.append(conteudo)
+        return len(objetos)
+
+    catalogo = adicionar(None)
+    raiz_paginas = adicionar(None)
+    fontes = {
+        nome: adicionar(
+            f'<< /Type /Font /Subtype /Type1 /BaseFont /{base} /Encoding /WinAnsiEncoding >>'.encode()
+        )
+        for nome, base in (('F1', 'Helvetica'), ('F2', 'Helvetica-Bold'))
+    }
+    recursos = ' '.join(f'/{nome} {numero} 0 R' for nome, numero in fontes.items())
+
+    filhas = []
+    for numero_pagina, textos in enumerate(paginas, 1):
+        rodape = (MARGEM, MARGEM - 20, 'F1', 8, f'Gerado em {gerado_em} - Página {numero_pagina} de {total}')
+        comandos = []
+        for x, y, fonte, tamanho, texto in textos + [rodape]:
+            comandos.append(b'BT /%s %d Tf %.1f %.1f Td %s Tj ET' % (
+                fonte.encode(), tamanho, x, y, _literal(texto),
+            ))
+        fluxo = zlib.compress(b'\n'.join(comandos))
+        conteudo = adicionar(
+            b'<< /Length %d /Filter /FlateDecode >>\nstream\n' % len(fluxo) + fluxo + b'\nendstream'
+        )
+        filhas.append(adicionar((
+            f'<< /Type /Page /Parent {raiz_paginas} 0 R /MediaBox [0 0 {LARGURA_PAGINA} {ALTURA_PAGINA}] '
+            f'/Resources << /Font << {recursos} >> >> /Contents {conteudo} 0 R >>'
+        ).encode()))
+
+    objetos[catalogo - 1] = f'<< /Type /Catalog /Pages {raiz_paginas} 0 R >>'.encode()
+    objetos[raiz_paginas - 1] = (
+        f"<< /Type /Pages /Kids [{' '.join(f'{numero} 0 R' for numero in filhas)}] /Count {total} >>"
+    ).encode()
+
+    saida = bytearray(b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n')
+    posicoes = []
+    for numero, conteudo in enumerate(objetos, 1):
+        posicoes.append(len(saida))
+        saida += b'%d 0 obj\n' % numero + conteudo + b'\nendobj\n'
+    inicio_xref = len(saida)
+    saida += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objetos) + 1)
+    saida += b''.join(b'%010d 00000 n \n' % posicao for posicao in posicoes)
+    saida += b'trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (
+        len(objetos) + 1, catalogo, inicio_xref,
+    )
+    return bytes(saida)
+
+
+def gravar(blocos, destino, gerado_em=None):
+    """
+    Renderiza e grava o PDF em `destino` (temporário + os.replace). Não usa
+    o Django: é executado nos processos do worker. Retorna o tamanho.
+    """
+    dados = renderizar(blocos, gerado_em)
+    os.makedirs(os.path.dirname(destino), exist_ok=True)
+    descritor, temporario = tempfile.mkstemp(dir=os.path.dirname(destino), prefix='.', suffix='.tmp')
+    try:
+        with os.fdopen(descritor, 'wb') as arquivo:
+            arquivo.write(dados)
+        os.replace(temporario, destino)
+    except BaseException:
+        os.unlink(temporario)
+        raise
+    return len(dados)
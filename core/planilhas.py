@@ -0,0 +1,18 @@
+"""
+Células de CSV aberto em planilha (Excel, LibreOffice, Google Sheets).
+
+Um texto que começa com =, +, -, @, tabulação ou retorno de carro é lido
+como fórmula pela planilha: um nome cadastrado como "=HYPERLINK(...)" vira
+um link (ou um comando) no computador de quem abriu a exportação. Com o
+apóstrofo na frente a célula é exibida como texto. Só textos são alterados;
+números negativos continuam números.
+"""
+
+PREFIXOS_FORMULA = ('=', '+', '-', '@', '\t', '\r')
+
+
+def celula_segura(valor):
+    """`valor` com um apóstrofo na frente se a planilha o leria como fórmula"""
+    if isinstance(valor, str) and valor.startswith(PREFIXOS_FORMULA):
+        return "'" + valor
+    return valor
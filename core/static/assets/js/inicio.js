@@ -0,0 +1,716 @@
+/*
+ * Scripts da página inicial (core/index.html), um bloco por seção.
+ */
+
+/* ===== Notificações (Django messages) ===== */
+
+// Auto-remover notificações Django após 5 segundos
+document.addEventListener('DOMContentLoaded', function() {
+    const notifications = document.querySelectorAll('.django-notification');
+    notifications.forEach(function(notification, index) {
+        setTimeout(function() {
+            if (notification.parentElement) {
+                notification.remove();
+            }
+        }, 5000 + (index * 100)); // Escalonar a remoção se houver múltiplas notificações
+    });
+});
+
+/* ===== Quem Somos ===== */
+
+document.addEventListener('DOMContentLoaded', function() {
+    // Animação de entrada para os cartões
+    const aboutCards = document.querySelectorAll('#about div:is(.pi-12, .pi-17, .pi-106, .pi-148, .pi-190, .pi-191, .pi-196, .pi-212, .pi-216) > div');
+
+    aboutCards.forEach((card, index) => {
+        card.style.opacity = '0';
+        card.style.transform = 'translateY(60px)';
+        card.style.animation = `fadeInUp 0.8s ease-out forwards`;
+        card.style.animationDelay = `${0.2 + index * 0.2}s`;
+    });
+
+    // Efeito parallax suave para elementos decorativos
+    const aboutSection = document.querySelector('#about');
+    const decorativeElements = aboutSection.querySelectorAll('div:is(.pi-24, .pi-42, .pi-232, .pi-233, .pi-238, .pi-239)');
+
+    window.addEventListener('scroll', function() {
+        const scrolled = window.pageYOffset;
+        const rect = aboutSection.getBoundingClientRect();
+
+        if (rect.top < window.innerHeight && rect.bottom > 0) {
+            decorativeElements.forEach((element, index) => {
+                const speed = 0.1 + (index * 0.05);
+                const yPos = scrolled * speed;
+                element.style.transform += ` translateY(${yPos}px)`;
+            });
+        }
+    });
+
+    // Intersection Observer para animações suaves
+    const observer = new IntersectionObserver((entries) => {
+        entries.forEach(entry => {
+            if (entry.isIntersecting) {
+                entry.target.style.opacity = '1';
+                entry.target.style.transform = 'translateY(0)';
+            }
+        });
+    }, { threshold: 0.1 });
+
+    // Observar elementos para animação
+    const elementsToAnimate = aboutSection.querySelectorAll('div:is(.pi-28, .pi-52, .pi-105, .pi-126, .pi-131, .pi-185, .pi-204, .pi-243), div:is(.pi-12, .pi-17, .pi-106, .pi-148, .pi-190, .pi-191, .pi-196, .pi-212, .pi-216)');
+    elementsToAnimate.forEach(el => observer.observe(el));
+});
+
+/* ===== Liderança ===== */
+
+document.addEventListener('DOMContentLoaded', function() {
+    // Efeito parallax suave nos elementos decorativos
+    const leadershipSection = document.querySelector('.leadership');
+    const decorativeElements = leadershipSection.querySelectorAll('div:is(.pi-4, .pi-24, .pi-34, .pi-40, .pi-42, .pi-48, .pi-54, .pi-57, .pi-115, .pi-120, .pi-187, .pi-214, .pi-230, .pi-231, .pi-232, .pi-233, .pi-237, .pi-238, .pi-239, .pi-244, .pi-245, .pi-246)');
+
+    let ticking = false;
+
+    function updateParallax() {
+        const scrolled = window.pageYOffset;
+        const rect = leadershipSection.getBoundingClientRect();
+
+        if (rect.top < window.innerHeight && rect.bottom > 0) {
+            decorativeElements.forEach((element, index) => {
+                const speed = (index + 1) * 0.2;
+                const yPos = scrolled * speed * 0.05;
+                element.style.transform += ` translateY(${yPos}px)`;
+            });
+        }
+
+        ticking = false;
+    }
+
+    function requestTick() {
+        if (!ticking) {
+            requestAnimationFrame(updateParallax);
+            ticking = true;
+        }
+    }
+
+    window.addEventListener('scroll', requestTick);
+
+    // Observer para animações quando elementos entram na tela
+    const leaderCards = leadershipSection.querySelectorAll('div[style*="backdrop-filter: blur(25px)"]');
+    const observer = new IntersectionObserver((entries) => {
+        entries.forEach(entry => {
+            if (entry.isIntersecting) {
+                entry.target.style.opacity = '1';
+                entry.target.style.transform = 'translateY(0)';
+            }
+        });
+    }, { 
+        threshold: 0.1,
+        rootMargin: '0px 0px -50px 0px'
+    });
+
+    leaderCards.forEach(card => {
+        card.style.opacity = '0';
+        card.style.transform = 'translateY(50px)';
+        card.style.transition = 'all 0.8s ease-out';
+        observer.observe(card);
+    });
+
+    // Efeito de contagem animada nas estatísticas
+    const stats = leadershipSection.querySelectorAll('div:is(.pi-56, .pi-80, .pi-174)');
+    const statsObserver = new IntersectionObserver((entries) => {
+        entries.forEach(entry => {
+            if (entry.isIntersecting) {
+                const target = entry.target;
+                const text = target.textContent;
+                const numbers = text.match(/\d+/);
+
+                if (numbers) {
+                    const finalNumber = parseInt(numbers[0]);
+                    let current = 0;
+                    const increment = finalNumber / 30;
+                    const timer = setInterval(() => {
+                        current += increment;
+                        if (current >= finalNumber) {
+                            target.textContent = text;
+                            clearInterval(timer);
+                        } else {
+                            target.textContent = text.replace(/\d+/, Math.floor(current));
+                        }
+                    }, 50);
+                }
+            }
+        });
+    }, { threshold: 0.5 });
+
+    stats.forEach(stat => statsObserver.observe(stat));
+});
+
+/* ===== Onde Atuamos ===== */
+
+document.addEventListener('DOMContentLoaded', function() {
+    const servicesSection = document.getElementById('services');
+
+    // Observer para animações quando elementos entram na tela
+    const serviceCards = servicesSection.querySelectorAll('div:is(.pi-21, .pi-106, .pi-119, .pi-186, .pi-197)');
+    const observer = new IntersectionObserver((entries) => {
+        entries.forEach(entry => {
+            if (entry.isIntersecting) {
+                entry.target.style.opacity = '1';
+                entry.target.style.transform = 'translateY(0)';
+            }
+        });
+    }, { 
+        threshold: 0.1,
+        rootMargin: '0px 0px -50px 0px'
+    });
+
+    serviceCards.forEach(card => {
+        card.style.opacity = '0';
+        card.style.transform = 'translateY(50px)';
+        card.style.transition = 'all 0.8s ease-out';
+        observer.observe(card);
+    });
+
+    // Efeito de contagem animada nas estatísticas
+    const stats = servicesSection.querySelectorAll('div:is(.pi-56, .pi-80, .pi-174)');
+    const statsObserver = new IntersectionObserver((entries) => {
+        entries.forEach(entry => {
+            if (entry.isIntersecting) {
+                const target = entry.target;
+                const text = target.textContent;
+                const numbers = text.match(/\d+/);
+
+                if (numbers) {
+                    const finalNumber = parseInt(numbers[0]);
+                    let current = 0;
+                    const increment = finalNumber / 30;
+                    const timer = setInterval(() => {
+                        current += increment;
+                        if (current >= finalNumber) {
+                            target.textContent = text;
+                            clearInterval(timer);
+                        } else {
+                            const newText = text.replace(/\d+/, Math.floor(current));
+                            target.textContent = newText;
+                        }
+                    }, 50);
+                }
+            }
+        });
+    }, { threshold: 0.5 });
+
+    stats.forEach(stat => statsObserver.observe(stat));
+
+    // Efeito parallax suave nos elementos decorativos
+    const decorativeElements = servicesSection.querySelectorAll('div:is(.pi-4, .pi-24, .pi-34, .pi-40, .pi-42, .pi-48, .pi-54, .pi-57, .pi-115, .pi-120, .pi-187, .pi-214, .pi-230, .pi-231, .pi-232, .pi-233, .pi-237, .pi-238, .pi-239, .pi-244, .pi-245, .pi-246)');
+    let ticking = false;
+
+    function updateParallax() {
+        const scrolled = window.pageYOffset;
+        const rect = servicesSection.getBoundingClientRect();
+
+        if (rect.top < window.innerHeight && rect.bottom > 0) {
+            decorativeElements.forEach((element, index) => {
+                const speed = (index + 1) * 0.15;
+                const yPos = scrolled * speed * 0.03;
+                element.style.transform += ` translateY(${yPos}px)`;
+            });
+        }
+
+        ticking = false;
+    }
+
+    function requestTick() {
+        if (!ticking) {
+            requestAnimationFrame(updateParallax);
+            ticking = true;
+        }
+    }
+
+    window.addEventListener('scroll', requestTick);
+});
+
+/* ===== Nossa Equipe ===== */
+
+document.addEventListener('DOMContentLoaded', function() {
+    // Funcionalidade de troca de membros
+    const memberItems = document.querySelectorAll('.team-member-item');
+    const memberDetails = document.querySelectorAll('.member-details');
+
+    memberItems.forEach((item, index) => {
+        item.addEventListener('click', function() {
+            // Remove active de todos
+            memberItems.forEach(mi => mi.classList.remove('active'));
+            memberDetails.forEach(md => {
+                md.style.display = 'none';
+                md.classList.remove('active');
+            });
+
+            // Adiciona active ao clicado
+            this.classList.add('active');
+            const targetDetail = document.querySelector(`.member-details[data-member="${this.dataset.member}"]`);
+
+            if (targetDetail) {
+                targetDetail.style.display = 'block';
+                setTimeout(() => {
+                    targetDetail.classList.add('active');
+                }, 50);
+            }
+        });
+    });
+
+    // Ativa o primeiro membro por padrão
+    if (memberItems.length > 0) {
+        memberItems[0].classList.add('active');
+        if (memberDetails.length > 0) {
+            memberDetails[0].style.display = 'block';
+            setTimeout(() => {
+                memberDetails[0].classList.add('active');
+            }, 100);
+        }
+    }
+
+    // Efeito parallax suave nos elementos decorativos
+    const teamSection = document.getElementById('team');
+    const decorativeElements = teamSection.querySelectorAll('div:is(.pi-4, .pi-24, .pi-34, .pi-40, .pi-42, .pi-48, .pi-54, .pi-57, .pi-115, .pi-120, .pi-187, .pi-214, .pi-230, .pi-231, .pi-232, .pi-233, .pi-237, .pi-238, .pi-239, .pi-244, .pi-245, .pi-246)');
+    let ticking = false;
+
+    function updateParallax() {
+        const scrolled = window.pageYOffset;
+        const rect = teamSection.getBoundingClientRect();
+
+        if (rect.top < window.innerHeight && rect.bottom > 0) {
+            decorativeElements.forEach((element, index) => {
+                const speed = (index + 1) * 0.1;
+                const yPos = scrolled * speed * 0.03;
+                element.style.transform = `translateY(${yPos}px)`;
+            });
+        }
+
+        ticking = false;
+    }
+
+    function requestTick() {
+        if (!ticking) {
+            requestAnimationFrame(updateParallax);
+            ticking = true;
+        }
+    }
+
+    window.addEventListener('scroll', requestTick);
+});
+
+document.addEventListener('DOMContentLoaded', function() {
+    const teamSection = document.getElementById('team');
+
+    // Efeito parallax suave nos elementos decorativos
+    const decorativeElements = teamSection.querySelectorAll('div:is(.pi-4, .pi-24, .pi-34, .pi-40, .pi-42, .pi-48, .pi-54, .pi-57, .pi-115, .pi-120, .pi-187, .pi-214, .pi-230, .pi-231, .pi-232, .pi-233, .pi-237, .pi-238, .pi-239, .pi-244, .pi-245, .pi-246):not(:is(.pi-7, .pi-21, .pi-26, .pi-44, .pi-106, .pi-119, .pi-186, .pi-193, .pi-194, .pi-197, .pi-210, .pi-225))');
+    let ticking = false;
+
+    function updateParallax() {
+        const scrolled = window.pageYOffset;
+        const rect = teamSection.getBoundingClientRect();
+
+        if (rect.top < window.innerHeight && rect.bottom > 0) {
+            decorativeElements.forEach((element, index) => {
+                const speed = (index + 1) * 0.2;
+                const yPos = scrolled * speed * 0.05;
+                element.style.transform += ` translateY(${yPos}px)`;
+            });
+        }
+
+        ticking = false;
+    }
+
+    function requestTick() {
+        if (!ticking) {
+            requestAnimationFrame(updateParallax);
+            ticking = true;
+        }
+    }
+
+    window.addEventListener('scroll', requestTick);
+
+    // Observer para animações quando elementos entram na tela
+    const teamCards = teamSection.querySelectorAll('div[style*="backdrop-filter: blur(25px)"]');
+    const observer = new IntersectionObserver((entries) => {
+        entries.forEach((entry, index) => {
+            if (entry.isIntersecting) {
+                setTimeout(() => {
+                    entry.target.style.opacity = '1';
+                    entry.target.style.transform = 'translateY(0)';
+                }, index * 100);
+            }
+        });
+    }, { 
+        threshold: 0.1,
+        rootMargin: '0px 0px -50px 0px'
+    });
+
+    teamCards.forEach((card, index) => {
+        // Preparar cards para animação
+        if (index > 5) { // Apenas para cards além dos 6 primeiros (que já têm animação CSS)
+            card.style.opacity = '0';
+            card.style.transform = 'translateY(50px)';
+            card.style.transition = 'all 0.8s ease-out';
+            observer.observe(card);
+        }
+    });
+
+    // Efeito de hover melhorado para cards
+    teamCards.forEach(card => {
+        let isHovered = false;
+
+        card.addEventListener('mouseenter', function() {
+            isHovered = true;
+
+            // Efeito de brilho
+            const shineEffect = this.querySelector('div[style*="background: linear-gradient(45deg, transparent, rgba(255, 255, 255, 0.1)"]');
+            if (shineEffect) {
+                shineEffect.style.animation = 'shine 0.8s ease-out';
+            }
+
+            // Efeito na imagem
+            const img = this.querySelector('img');
+            if (img) {
+                img.style.transform = 'scale(1.1)';
+            }
+
+            // Efeito no overlay da imagem
+            const overlay = this.querySelector('div:is(.pi-34, .pi-57, .pi-115)');
+            if (overlay) {
+                overlay.style.opacity = '1';
+            }
+        });
+
+        card.addEventListener('mouseleave', function() {
+            isHovered = false;
+
+            setTimeout(() => {
+                if (!isHovered) {
+                    // Reset da imagem
+                    const img = this.querySelector('img');
+                    if (img) {
+                        img.style.transform = 'scale(1)';
+                    }
+
+                    // Reset do overlay
+                    const overlay = this.querySelector('div:is(.pi-34, .pi-57, .pi-115)');
+                    if (overlay) {
+                        overlay.style.opacity = '0';
+                    }
+                }
+            }, 100);
+        });
+    });
+
+    // Efeito de typing para biografia (opcional - descomente para ativar)
+    /*
+    const biographies = teamSection.querySelectorAll('p:is(.pi-10, .pi-11, .pi-18, .pi-39, .pi-50, .pi-59, .pi-85, .pi-102, .pi-111, .pi-123)');
+    biographies.forEach(bio => {
+        const originalText = bio.textContent;
+        bio.textContent = '';
+
+        const observer = new IntersectionObserver((entries) => {
+            entries.forEach(entry => {
+                if (entry.isIntersecting && !bio.dataset.typed) {
+                    bio.dataset.typed = 'true';
+                    let i = 0;
+                    const typeTimer = setInterval(() => {
+                        bio.textContent = originalText.slice(0, i);
+                        i++;
+                        if (i > originalText.length) {
+                            clearInterval(typeTimer);
+                        }
+                    }, 20);
+                }
+            });
+        }, { threshold: 0.8 });
+
+        observer.observe(bio);
+    });
+    */
+});
+
+/* ===== Projetos ===== */
+
+document.addEventListener('DOMContentLoaded', function() {
+    const projectsSection = document.getElementById('projects');
+
+    // Observer para animações quando elementos entram na tela
+    const projectCards = projectsSection.querySelectorAll('div:is(.pi-21, .pi-106, .pi-119, .pi-186, .pi-197)');
+    const observer = new IntersectionObserver((entries) => {
+        entries.forEach(entry => {
+            if (entry.isIntersecting) {
+                entry.target.style.opacity = '1';
+                entry.target.style.transform = 'translateY(0)';
+            }
+        });
+    }, { 
+        threshold: 0.1,
+        rootMargin: '0px 0px -50px 0px'
+    });
+
+    projectCards.forEach(card => {
+        card.style.opacity = '0';
+        card.style.transform = 'translateY(50px)';
+        card.style.transition = 'all 0.8s ease-out';
+        observer.observe(card);
+    });
+
+    // Efeito parallax suave nos elementos decorativos
+    const decorativeElements = projectsSection.querySelectorAll('div:is(.pi-4, .pi-24, .pi-34, .pi-40, .pi-42, .pi-48, .pi-54, .pi-57, .pi-115, .pi-120, .pi-187, .pi-214, .pi-230, .pi-231, .pi-232, .pi-233, .pi-237, .pi-238, .pi-239, .pi-244, .pi-245, .pi-246)');
+    let ticking = false;
+
+    function updateParallax() {
+        const scrolled = window.pageYOffset;
+        const rect = projectsSection.getBoundingClientRect();
+
+        if (rect.top < window.innerHeight && rect.bottom > 0) {
+            decorativeElements.forEach((element, index) => {
+                const speed = (index + 1) * 0.15;
+                const yPos = scrolled * speed * 0.03;
+                element.style.transform += ` translateY(${yPos}px)`;
+            });
+        }
+
+        ticking = false;
+    }
+
+    function requestTick() {
+        if (!ticking) {
+            requestAnimationFrame(updateParallax);
+            ticking = true;
+        }
+    }
+
+    window.addEventListener('scroll', requestTick);
+});
+
+/* ===== Editais ===== */
+
+document.addEventListener('DOMContentLoaded', function() {
+    const editalsSection = document.getElementById('editals');
+
+    // Efeito parallax suave nos elementos decorativos
+    const decorativeElements = editalsSection.querySelectorAll('div:is(.pi-4, .pi-24, .pi-34, .pi-40, .pi-42, .pi-48, .pi-54, .pi-57, .pi-115, .pi-120, .pi-187, .pi-214, .pi-230, .pi-231, .pi-232, .pi-233, .pi-237, .pi-238, .pi-239, .pi-244, .pi-245, .pi-246):not(:is(.pi-7, .pi-21, .pi-26, .pi-44, .pi-106, .pi-119, .pi-186, .pi-193, .pi-194, .pi-197, .pi-210, .pi-225))');
+    let ticking = false;
+
+    function updateParallax() {
+        const scrolled = window.pageYOffset;
+        const rect = editalsSection.getBoundingClientRect();
+
+        if (rect.top < window.innerHeight && rect.bottom > 0) {
+            decorativeElements.forEach((element, index) => {
+                if (getComputedStyle(element).animationName === 'float') {
+                    const speed = (index + 1) * 0.15;
+                    const yPos = scrolled * speed * 0.03;
+                    const currentTransform = element.style.transform || '';
+                    if (!currentTransform.includes('translateY')) {
+                        element.style.transform = currentTransform + ` translateY(${yPos}px)`;
+                    }
+                }
+            });
+        }
+
+        ticking = false;
+    }
+
+    function requestTick() {
+        if (!ticking) {
+            requestAnimationFrame(updateParallax);
+            ticking = true;
+        }
+    }
+
+    window.addEventListener('scroll', requestTick);
+
+    // Linhas da tabela entram em sequência quando a seção aparece na tela
+    const tableContainer = editalsSection.querySelector('#editals-table');
+    if (tableContainer) {
+        const rows = tableContainer.querySelectorAll('.edital-row');
+        rows.forEach(row => {
+            row.style.opacity = '0';
+            row.style.transform = 'translateX(-30px)';
+            row.style.transition = 'all 0.5s ease-out';
+        });
+
+        const observer = new IntersectionObserver((entries) => {
+            entries.forEach(entry => {
+                if (entry.isIntersecting) {
+                    rows.forEach((row, index) => {
+                        setTimeout(() => {
+                            row.style.opacity = '1';
+                            row.style.transform = 'translateX(0)';
+                        }, index * 150);
+                    });
+                    observer.unobserve(entry.target);
+                }
+            });
+        }, {
+            threshold: 0.1,
+            rootMargin: '0px 0px -50px 0px'
+        });
+        observer.observe(tableContainer);
+    }
+});
+
+/* ===== Contato e rodapé ===== */
+
+document.addEventListener('DOMContentLoaded', function() {
+    const contactForm = document.getElementById('contact-form');
+    const submitButton = contactForm.querySelector('button[type="submit"]');
+    const originalButtonText = submitButton.innerHTML;
+
+    contactForm.addEventListener('submit', async function(e) {
+        e.preventDefault();
+
+        // Desabilitar botão e mostrar loading
+        submitButton.disabled = true;
+        submitButton.innerHTML = '<i class="fas fa-spinner fa-spin" style="margin-right: 10px;"></i>Enviando...';
+        submitButton.style.opacity = '0.7';
+
+        // Coletar dados do formulário
+        const formData = {
+            name: document.getElementById('name').value.trim(),
+            email: document.getElementById('email').value.trim(),
+            phone: document.getElementById('phone').value.trim(),
+            message: document.getElementById('message').value.trim(),
+            subject: 'geral'
+        };
+
+        try {
+            // Enviar dados via AJAX
+            const response = await fetch('/contato/processar/', {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json',
+                    'X-Requested-With': 'XMLHttpRequest',
+                    'X-CSRFToken': getCookie('csrftoken')
+                },
+                body: JSON.stringify(formData)
+            });
+
+            const result = await response.json();
+
+            if (result.success) {
+                // Sucesso - mostrar mensagem e limpar formulário
+                showNotification(result.message, 'success');
+                contactForm.reset();
+            } else {
+                // Erro - mostrar mensagem de erro
+                showNotification(result.error || 'Erro ao enviar mensagem. Tente novamente.', 'error');
+
+                // Destacar campo com erro se especificado
+                if (result.field) {
+                    const field = document.getElementById(result.field);
+                    if (field) {
+                        field.style.borderColor = '#ef4444';
+                        field.focus();
+                        setTimeout(() => {
+                            field.style.borderColor = '#e5e7eb';
+                        }, 3000);
+                    }
+                }
+            }
+
+        } catch (error) {
+            console.error('Erro:', error);
+            showNotification('Erro de conexão. Verifique sua internet e tente novamente.', 'error');
+        }
+
+        // Reabilitar botão
+        submitButton.disabled = false;
+        submitButton.innerHTML = originalButtonText;
+        submitButton.style.opacity = '1';
+    });
+
+    // Função para mostrar notificações
+    function showNotification(message, type = 'info') {
+        // Remover notificação existente se houver
+        const existingNotification = document.querySelector('.contact-notification');
+        if (existingNotification) {
+            existingNotification.remove();
+        }
+
+        // Criar elemento de notificação
+        const notification = document.createElement('div');
+        notification.className = 'contact-notification';
+        notification.style.cssText = `
+            position: fixed;
+            top: 20px;
+            right: 20px;
+            z-index: 10000;
+            padding: 16px 24px;
+            border-radius: 12px;
+            color: white;
+            font-weight: 600;
+            box-shadow: 0 10px 25px rgba(0, 0, 0, 0.2);
+            transform: translateX(400px);
+            transition: all 0.3s ease;
+            max-width: 400px;
+            backdrop-filter: blur(10px);
+        `;
+
+        // Definir cor baseada no tipo
+        if (type === 'success') {
+            notification.style.background = 'linear-gradient(135deg, #10b981, #059669)';
+        } else if (type === 'error') {
+            notification.style.background = 'linear-gradient(135deg, #ef4444, #dc2626)';
+        } else if (type === 'warning') {
+            notification.style.background = 'linear-gradient(135deg, #f59e0b, #d97706)';
+        } else {
+            notification.style.background = 'linear-gradient(135deg, #3b82f6, #1d4ed8)';
+        }
+
+        notification.innerHTML = `
+            <div style="display: flex; align-items: center; gap: 12px;">
+                <i class="fas fa-${type === 'success' ? 'check-circle' : type === 'error' ? 'exclamation-circle' : type === 'warning' ? 'exclamation-triangle' : 'info-circle'}" style="font-size: 1.2rem;"></i>
+                <span>${message}</span>
+                <button onclick="this.parentElement.parentElement.remove()" style="background: none; border: none; color: white; font-size: 1.2rem; cursor: pointer; padding: 0; margin-left: auto;">
+                    <i class="fas fa-times"></i>
+                </button>
+            </div>
+        `;
+
+        document.body.appendChild(notification);
+
+        // Animar entrada
+        setTimeout(() => {
+            notification.style.transform = 'translateX(0)';
+        }, 100);
+
+        // Remover automaticamente após 5 segundos
+        setTimeout(() => {
+            notification.style.transform = 'translateX(400px)';
+            setTimeout(() => {
+                if (notification.parentElement) {
+                    notification.remove();
+                }
+            }, 300);
+        }, 5000);
+    }
+
+    // Função para obter cookie CSRF
+    function getCookie(name) {
+        let cookieValue = null;
+        if (document.cookie && document.cookie !== '') {
+            const cookies = document.cookie.split(';');
+            for (let i = 0; i < cookies.length; i++) {
+                const cookie = cookies[i].trim();
+                if (cookie.substring(0, name.length + 1) === (name + '=')) {
+                    cookieValue = decodeURIComponent(cookie.substring(name.length + 1));
+                    break;
+                }
+            }
+        }
+        return cookieValue;
+    }
+});
+
+function scrollFullViewport() {
+    window.scrollTo({
+        top: window.innerHeight,
+        behavior: 'smooth'
+    });
+}
@@ -0,0 +1,102 @@
+import gzip
+import logging
+
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+
+class ArmazenamentoEstaticoComprimido(ManifestStaticFilesStorage):
+    """
+    Storage dos arquivos estáticos usado pelo collectstatic.
+
+    Grava cada arquivo com o hash do conteúdo no nome (styles.3f2a9c1b.css),
+    mantém o staticfiles.json com o mapeamento original -> versionado e gera
+    as variantes .gz e .br dos arquivos de texto, servidas depois pelo
+    ArquivosEstaticosMiddleware.
+
+    Sem o manifesto (collectstatic ainda não rodou, como nos testes) ou com
+    um arquivo fora dele, o {% static %} usa o nome original em vez de
+    derrubar a página com "Missing staticfiles manifest entry".
+    """
+
+    manifest_strict = False
+
+    # Somente formatos textuais ganham com compressão; imagens e vídeos já
+    # são comprimidos na origem
+    extensoes_comprimiveis = (
+        '.css', '.js', '.mjs', '.json', '.map', '.svg', '.txt', '.html', '.xml', '.ico',
+    )
+    tamanho_minimo_compressao = 256
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._avisou_manifesto = False
+
+    def stored_name(self, name):
+        try:
+            return super().stored_name(name)
+        except ValueError:
+            # Com manifest_strict = False o Django ainda tenta calcular o hash
+            # lendo o arquivo do STATIC_ROOT, que pode não existir
+            if not self._avisou_manifesto:
+                self._avisou_manifesto = True
+                logger.warning(f"Arquivo estático fora do manifesto ({name}); rode o collectstatic")
+            return name
+
+    def url_converter(self, name, hashed_files, template=None):
+        """Mantém referências url() para arquivos inexistentes em vez de abortar o collectstatic"""
+        converter = super().url_converter(name, hashed_files, template)
+
+        def converter_tolerante(matchobj):
+            try:
+                return converter(matchobj)
+            except ValueError as e:
+                logger.warning(f"Referência estática não encontrada em {name}: {e}")
+                return matchobj.group('matched')
+
+        return converter_tolerante
+
+    def post_process(self, paths, dry_run=False, **options):
+        yield from super().post_process(paths, dry_run, **options)
+
+        if dry_run:
+            return
+
+        for nome in sorted(set(self.hashed_files.values())):
+            for variante in self.comprimir(nome):
+                yield nome, variante, True
+
+    def comprimir(self, nome):
+        """Gera as variantes .gz/.br de um arquivo e retorna os nomes gravados"""
+        if not nome.lower().endswith(self.extensoes_comprimiveis):
+            return []
+
+        with self.open(nome) as arquivo:
+            conteudo = arquivo.read()
+
+        if len(conteudo) < self.tamanho_minimo_compressao:
+            return []
+
+        variantes = []
+        # mtime=0 deixa o .gz determinístico entre deploys
+        comprimidos = [('.gz', gzip.compress(conteudo, compresslevel=9, mtime=0))]
+        if brotli is not None:
+            comprimidos.append(('.br', brotli.compress(conteudo, quality=11)))
+
+        for sufixo, dados in comprimidos:
+            # Não vale a pena servir uma variante que não economiza bytes
+            if len(dados) >= len(conteudo):
+                continue
+            caminho = self.path(nome + sufixo)
+            with open(caminho, 'wb') as destino:
+                destino.write(dados)
+            variantes.append(nome + sufixo)
+
+        return variantes
+
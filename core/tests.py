@@ -1,3 +1,337 @@
-from django.test import TestCase
+from datetime import date, timedelta
+import gzip
+from io import StringIO
+import os
+from pathlib import Path
+import re
+import tempfile
+from types import SimpleNamespace
+from unittest import mock
+import warnings
+import zlib
 
-# Create your tests here.
+from django.apps import apps
+from django.contrib.auth.models import User
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+
+from editais.models import AnexoEdital, CategoriaEdital, Edital
+from ponti_hub_inovacao import envvars
+from . import aquecimento, fila_pdf, pdf
+from .middleware import ArquivosEstaticosMiddleware
+from .planilhas import celula_segura
+from .models import TarefaPDF
+
+
+class PDFTests(SimpleTestCase):
+    """Gerador mínimo de PDF (core.pdf)"""
+
+    def test_estrutura_e_texto(self):
+        blocos = [
+            ['titulo', 'Edital (teste) – Inovação'],
+            ['campos', [['Status', 'Aberto']]],
+            ['tabela', ['Título', 'Tipo'], [[f'Anexo {numero}', 'Arquivo'] for numero in range(200)]],
+        ]
+        dados = pdf.renderizar(blocos, gerado_em=date(2025, 3, 7))
+        self.assertTrue(dados.startswith(b'%PDF-1.4'))
+        self.assertTrue(dados.endswith(b'%%EOF\n'))
+
+        # Cada entrada da tabela xref aponta para o objeto certo
+        inicio_xref = int(dados.rsplit(b'startxref\n', 1)[1].split(b'\n')[0])
+        posicoes = re.findall(rb'(\d{10}) 00000 n', dados[inicio_xref:])
+        for numero, posicao in enumerate(posicoes, 1):
+            self.assertTrue(dados[int(posicao):].startswith(b'%d 0 obj' % numero))
+
+        paginas = [zlib.decompress(fluxo) for fluxo in re.findall(rb'stream\n(.*?)\nendstream', dados, re.S)]
+        self.assertGreater(len(paginas), 1)
+        self.assertIn(b'(Edital \\(teste\\) \x96 Inova\xe7\xe3o)', paginas[0])
+        # O cabeçalho da tabela se repete na página seguinte
+        self.assertIn(b'(T\xedtulo)', paginas[1])
+        # A data de geração vai no rodapé, fora dos blocos
+        self.assertIn(b'(Gerado em 07/03/2025 - P\xe1gina 1 de ', paginas[0])
+
+    def test_versao_muda_com_o_conteudo(self):
+        self.assertEqual(pdf.versao_conteudo([['titulo', 'A']]), pdf.versao_conteudo([['titulo', 'A']]))
+        self.assertNotEqual(pdf.versao_conteudo([['titulo', 'A']]), pdf.versao_conteudo([['titulo', 'B']]))
+
+
+class FilaPDFTests(TestCase):
+    """Fila de PDFs (core.fila_pdf) e o worker processar_pdfs"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.usuario = User.objects.create_user('admin', is_staff=True)
+        categoria = CategoriaEdital.objects.create(nome='Inovação', slug='inovacao')
+        cls.edital = Edital.objects.create(
+            titulo='Edital de Inovação', numero_edital='SECTIDE-001/2025', subtitulo='Chamada',
+            descricao_completa='<p>Descrição</p>', categoria=categoria,
+            data_encerramento=timezone.now() + timedelta(days=30),
+        )
+        AnexoEdital.objects.create(
+            edital=cls.edital, tipo='link', titulo='Formulário', link_url='https://exemplo.org/formulario',
+        )
+
+    def setUp(self):
+        diretorio = tempfile.TemporaryDirectory()
+        self.addCleanup(diretorio.cleanup)
+        configuracao = self.settings(RELATORIOS_DIR=diretorio.name)
+        configuracao.enable()
+        self.addCleanup(configuracao.disable)
+
+    def test_uma_tarefa_por_versao(self):
+        tarefa = fila_pdf.preparar('edital', self.edital)
+        self.assertEqual(tarefa.status, TarefaPDF.PENDENTE)
+        self.assertEqual(fila_pdf.preparar('edital', self.edital), tarefa)
+
+        self.edital.subtitulo = 'Chamada pública'
+        self.edital.save()
+        self.assertNotEqual(fila_pdf.preparar('edital', self.edital).versao, tarefa.versao)
+        self.assertEqual(TarefaPDF.objects.count(), 2)
+
+    def test_reserva_exclusiva(self):
+        fila_pdf.preparar('edital', self.edital)
+        self.assertEqual(len(fila_pdf.reservar(5)), 1)
+        self.assertEqual(fila_pdf.reservar(5), [])
+
+    def test_worker_gera_o_pdf_e_descarta_versoes_antigas(self):
+        antiga = fila_pdf.preparar('edital', self.edital)
+        self.edital.subtitulo = 'Chamada pública'
+        self.edital.save()
+        atual = fila_pdf.preparar('edital', self.edital)
+
+        call_command('processar_pdfs', processos=1, uma_vez=True, stdout=StringIO())
+
+        atual.refresh_from_db()
+        self.assertTrue(atual.pronta)
+        self.assertIsNone(atual.conteudo)
+        self.assertTrue(fila_pdf.caminho(atual).read_bytes().startswith(b'%PDF'))
+        self.assertFalse(TarefaPDF.objects.filter(pk=antiga.pk).exists())
+        self.assertFalse(fila_pdf.caminho(antiga).exists())
+
+        # Com o arquivo pronto, a view do edital serve o PDF
+        self.client.force_login(self.usuario)
+        resposta = self.client.get(f'/editais/admin/editais/{self.edital.id}/pdf/')
+        self.assertEqual(resposta['Content-Type'], 'application/pdf')
+
+    def test_arquivo_apagado_antes_de_abrir(self):
+        tarefa = fila_pdf.preparar('edital', self.edital)
+        call_command('processar_pdfs', processos=1, uma_vez=True, stdout=StringIO())
+        tarefa.refresh_from_db()
+        fila_pdf.caminho(tarefa).unlink()
+
+        self.assertIsNone(fila_pdf.resposta(tarefa, self.edital, 'edital.pdf'))
+        tarefa.refresh_from_db()
+        self.assertEqual(tarefa.status, TarefaPDF.PENDENTE)
+        self.assertIsNotNone(tarefa.conteudo)
+
+    def test_tarefa_com_erro_volta_para_a_fila_no_download(self):
+        tarefa = fila_pdf.preparar('edital', self.edital)
+        fila_pdf.falhar(tarefa, 'disco cheio')
+        # Só a visualização não refaz a tarefa
+        self.assertEqual(fila_pdf.preparar('edital', self.edital).status, TarefaPDF.ERRO)
+
+        self.client.force_login(self.usuario)
+        resposta = self.client.get(f'/editais/admin/editais/{self.edital.id}/pdf/', follow=True)
+        self.assertContains(resposta, 'falhou e foi reiniciada')
+        tarefa.refresh_from_db()
+        self.assertEqual(tarefa.status, TarefaPDF.PENDENTE)
+
+        call_command('processar_pdfs', processos=1, uma_vez=True, stdout=StringIO())
+        tarefa.refresh_from_db()
+        self.assertTrue(tarefa.pronta)
+        self.assertEqual(tarefa.erro, '')
+
+
+class PlanilhasTests(SimpleTestCase):
+
+    def test_celula_segura(self):
+        for texto in ('=1+1', '+55', '-2', '@SUM(A1)', '\tx', '\rx'):
+            self.assertEqual(celula_segura(texto), "'" + texto)
+        self.assertEqual(celula_segura('Projeto'), 'Projeto')
+        self.assertEqual(celula_segura(-2), -2)
+        self.assertIsNone(celula_segura(None))
+
+
+class ArquivosEstaticosTests(TestCase):
+    """Storage dos estáticos (core.storage) sem o collectstatic"""
+
+    @override_settings(DEBUG=False)
+    def test_paginas_sem_manifesto(self):
+        for url in ['/', '/projetos/', '/projetos/relatorios/alocacao/']:
+            with self.subTest(url=url):
+                self.client.force_login(User.objects.create_user(f'usuario{len(url)}', is_staff=True))
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                self.assertContains(response, '/static/')
+
+
+class ArquivosEstaticosMiddlewareTests(SimpleTestCase):
+    """Entrega do STATIC_ROOT pelo ArquivosEstaticosMiddleware"""
+
+    conteudo = b'body { color: #123456; }\n' * 20
+
+    def setUp(self):
+        diretorio = tempfile.TemporaryDirectory()
+        self.addCleanup(diretorio.cleanup)
+        raiz = Path(diretorio.name)
+        for nome in ('site.0123456789ab.css', 'site.css'):
+            (raiz / nome).write_bytes(self.conteudo)
+        (raiz / 'site.0123456789ab.css.gz').write_bytes(gzip.compress(self.conteudo))
+        (raiz / 'site.0123456789ab.css.br').write_bytes(b'br')
+
+        configuracao = self.settings(STATIC_ROOT=diretorio.name, STATIC_URL='/static/')
+        configuracao.enable()
+        self.addCleanup(configuracao.disable)
+        storage = mock.patch('core.middleware.staticfiles_storage', SimpleNamespace(
+            hashed_files={'site.css': 'site.0123456789ab.css'},
+        ))
+        storage.start()
+        self.addCleanup(storage.stop)
+
+        self.middleware = ArquivosEstaticosMiddleware(lambda request: HttpResponse('view'))
+        self.fabrica = RequestFactory()
+
+    def get(self, caminho, **cabecalhos):
+        return self.middleware(self.fabrica.get(caminho, **cabecalhos))
+
+    def test_codificacao_pelo_accept_encoding(self):
+        resposta = self.get('/static/site.0123456789ab.css', HTTP_ACCEPT_ENCODING='gzip, deflate, br')
+        self.assertEqual(resposta['Content-Encoding'], 'br')
+        self.assertEqual(resposta['Vary'], 'Accept-Encoding')
+        self.assertEqual(b''.join(resposta.streaming_content), b'br')
+
+        resposta = self.get('/static/site.0123456789ab.css', HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(resposta['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(b''.join(resposta.streaming_content)), self.conteudo)
+
+        resposta = self.get('/static/site.0123456789ab.css')
+        self.assertNotIn('Content-Encoding', resposta)
+        self.assertEqual(resposta['Vary'], 'Accept-Encoding')
+        self.assertEqual(resposta['Content-Type'], 'text/css')
+        self.assertEqual(b''.join(resposta.streaming_content), self.conteudo)
+
+    def test_range(self):
+        tamanho = len(self.conteudo)
+        resposta = self.get('/static/site.css', HTTP_RANGE='bytes=5-9', HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(resposta.status_code, 206)
+        self.assertEqual(resposta['Content-Range'], f'bytes 5-9/{tamanho}')
+        self.assertNotIn('Content-Encoding', resposta)
+        self.assertEqual(b''.join(resposta.streaming_content), self.conteudo[5:10])
+
+        resposta = self.get('/static/site.css', HTTP_RANGE='bytes=-4')
+        self.assertEqual(b''.join(resposta.streaming_content), self.conteudo[-4:])
+
+        for intervalo in (f'bytes={tamanho}-', 'bytes=9-5', 'linhas=1-2'):
+            with self.subTest(intervalo=intervalo):
+                resposta = self.get('/static/site.css', HTTP_RANGE=intervalo)
+                self.assertEqual(resposta.status_code, 416)
+                self.assertEqual(resposta['Content-Range'], f'bytes */{tamanho}')
+
+    def test_if_modified_since(self):
+        ultima = self.get('/static/site.css')['Last-Modified']
+        resposta = self.get('/static/site.css', HTTP_IF_MODIFIED_SINCE=ultima)
+        self.assertEqual(resposta.status_code, 304)
+        self.assertIn('Cache-Control', resposta)
+
+        resposta = self.get('/static/site.css', HTTP_IF_MODIFIED_SINCE='Mon, 01 Jan 2001 00:00:00 GMT')
+        self.assertEqual(resposta.status_code, 200)
+
+    def test_cache_control(self):
+        resposta = self.get('/static/site.0123456789ab.css')
+        self.assertEqual(resposta['Cache-Control'], f'public, max-age={60 * 60 * 24 * 365}, immutable')
+        resposta = self.get('/static/site.css')
+        self.assertEqual(resposta['Cache-Control'], 'public, max-age=60')
+
+    def test_fora_do_static_root(self):
+        for caminho in ('/static/nao-existe.css', '/static/../settings.py', '/pagina/'):
+            with self.subTest(caminho=caminho):
+                self.assertEqual(self.get(caminho).content, b'view')
+
+
+class AquecimentoTests(SimpleTestCase):
+    """Pré-compilação dos templates só no boot do servidor"""
+
+    @override_settings(TEMPLATES_AQUECER=True)
+    def test_so_no_ponto_de_entrada_do_servidor(self):
+        with mock.patch.object(aquecimento, 'aquecer_templates') as aquecer:
+            # O ready roda em todo comando do manage.py
+            apps.get_app_config('core').ready()
+            aquecer.assert_not_called()
+            aquecimento.aquecer_no_boot()
+            aquecer.assert_called_once_with()
+
+    @override_settings(TEMPLATES_AQUECER=False)
+    def test_desligado(self):
+        with mock.patch.object(aquecimento, 'aquecer_templates') as aquecer:
+            aquecimento.aquecer_no_boot()
+        aquecer.assert_not_called()
+
+
+class EnvvarsTests(SimpleTestCase):
+    """Leitura tipada do .envvars.yaml (ponti_hub_inovacao.envvars)"""
+
+    def setUp(self):
+        diretorio = tempfile.TemporaryDirectory()
+        self.addCleanup(diretorio.cleanup)
+        self.base_dir = Path(diretorio.name)
+        self.arquivo = self.base_dir / envvars.ARQUIVO
+
+    def carregar(self, conteudo, **ambiente):
+        self.arquivo.write_text(conteudo)
+        variaveis = {envvars.PREFIXO_AMBIENTE + chave.upper(): valor for chave, valor in ambiente.items()}
+        variaveis[envvars.PREFIXO_AMBIENTE + 'ENVVARS'] = str(self.arquivo)
+        with mock.patch.dict(os.environ, variaveis):
+            return envvars.load_envars(self.base_dir)
+
+    def test_journal_mode_pelo_ambiente(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            self.assertEqual(self.carregar('sqlite_journal_mode: DELETE\n')['sqlite_journal_mode'], 'DELETE')
+        dados = self.carregar('sqlite_journal_mode: DELETE\n', sqlite_journal_mode='WAL')
+        self.assertEqual(dados['sqlite_journal_mode'], 'WAL')
+
+    def test_tipo_errado(self):
+        with self.assertRaisesMessage(ImproperlyConfigured, 'debug_mode'):
+            self.carregar('debug_mode: "false"\n')
+        with self.assertRaises(ImproperlyConfigured):
+            self.carregar('db_port: true\n')
+
+    def test_conversao_do_ambiente(self):
+        dados = self.carregar(
+            'debug_mode: true\n', debug_mode='false', db_port='5433', sqlite_busy_timeout='2.5',
+            cache_timeout='none', db_pool='min_size: 2',
+        )
+        self.assertIs(dados['debug_mode'], False)
+        self.assertEqual(dados['db_port'], 5433)
+        self.assertEqual(dados['sqlite_busy_timeout'], 2.5)
+        self.assertIsNone(dados['cache_timeout'])
+        self.assertEqual(dados['db_pool'], {'min_size': 2})
+        with self.assertRaises(ImproperlyConfigured):
+            self.carregar('', db_port='porta')
+
+    def test_chave_desconhecida(self):
+        with self.assertWarnsMessage(RuntimeWarning, 'Chave desconhecida'):
+            dados = self.carregar('debug_mod: false\n')
+        self.assertEqual(dados['debug_mod'], False)
+
+    def test_cache_refeito_quando_o_yaml_muda(self):
+        cache_yaml = self.base_dir / envvars.ARQUIVO_CACHE
+        self.assertEqual(self.carregar('db_name: valor_a\n')['db_name'], 'valor_a')
+        self.assertTrue(cache_yaml.exists())
+
+        # Com o mesmo mtime e tamanho, o YAML nem é lido
+        with mock.patch.object(envvars, 'ler_yaml') as ler_yaml:
+            self.assertEqual(envvars.ler_com_cache(self.arquivo, cache_yaml)['db_name'], 'valor_a')
+        ler_yaml.assert_not_called()
+
+        # Mesmo tamanho, outro mtime: o cache é refeito
+        self.arquivo.write_text('db_name: valor_b\n')
+        estado = os.stat(self.arquivo)
+        os.utime(self.arquivo, ns=(estado.st_atime_ns, estado.st_mtime_ns + 10**9))
+        self.assertEqual(envvars.ler_com_cache(self.arquivo, cache_yaml)['db_name'], 'valor_b')
+        with mock.patch.object(envvars, 'ler_yaml') as ler_yaml:
+            self.assertEqual(envvars.ler_com_cache(self.arquivo, cache_yaml)['db_name'], 'valor_b')
+        ler_yaml.assert_not_called()
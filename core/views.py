@@ -38,10 +38,11 @@ def index(request):
         'destaque', 'ordem_exibicao', 'cargo__nivel_hierarquico'
     )
     
-    # Carregar editais ativos e em destaque - incluindo encerrados para mostrar histórico
+    # Carregar editais ativos e em destaque - incluindo encerrados para mostrar histórico.
+    # A página inicial só mostra o resumo; o restante fica em editais:detalhe
     editais = Edital.objects.filter(
         status__in=['em_breve', 'aberto', 'encerrado']
-    ).select_related('categoria').prefetch_related('areas_interesse').order_by(
+    ).select_related('categoria').order_by(
         '-destaque', '-data_criacao'
     )[:10]  # Limitar a 10 editais mais recentes
     
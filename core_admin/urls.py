@@ -18,4 +18,7 @@ urlpatterns = [
     path('ajax/area/<int:area_id>/toggle/', views.toggle_area_status, name='toggle_area_status'),
     path('ajax/card/<int:card_id>/delete/', views.delete_card, name='delete_card'),
     path('ajax/area/<int:area_id>/delete/', views.delete_area, name='delete_area'),
+
+    # Instrumentação (JSON)
+    path('instrumentacao/', views.instrumentacao, name='instrumentacao'),
 ]
\ No newline at end of file
@@ -9,6 +9,7 @@ from core.models import (
     SessaoOndeAtuamos, AreaAtuacao, 
     Configuracoes
 )
+from core.db.instrumentacao import estatisticas_conexoes
 
 # Decorator para verificar se o usuário é staff
 def staff_required(user):
@@ -387,3 +388,14 @@ def delete_area(request, area_id):
             'success': False,
             'message': f'Erro ao deletar área: {e}'
         })
+
+
+@login_required
+@user_passes_test(staff_required)
+@require_http_methods(["GET"])
+def instrumentacao(request):
+    """Métricas de conexão com o banco de dados do processo que atendeu a requisição"""
+    return JsonResponse({
+        'success': True,
+        'banco_de_dados': estatisticas_conexoes(),
+    })
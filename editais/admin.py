@@ -1,8 +1,12 @@
+import re
+
 from django.contrib import admin
 from django.utils.html import format_html
 from django.utils import timezone
 from django.urls import reverse
 from django.http import HttpResponseRedirect
+from django import forms
+from .cpf import formatar as formatar_cpf, normalizar as normalizar_cpf
 from .models import Edital, CategoriaEdital, AreaInteresse, NotificacaoEdital, AnexoEdital
 
 
@@ -47,8 +51,29 @@ class AreaInteresseAdmin(admin.ModelAdmin):
     cor_display.short_description = 'Cor'
 
 
+class CPFInput(forms.TextInput):
+    """Exibe o CPF gravado (11 dígitos) como xxx.xxx.xxx-xx"""
+
+    def format_value(self, value):
+        return super().format_value(formatar_cpf(value) if value else value)
+
+
+class NotificacaoEditalAdminForm(forms.ModelForm):
+    """Aceita o CPF com ou sem pontuação; o model grava só os dígitos"""
+
+    cpf = forms.CharField(max_length=14, label='CPF', widget=CPFInput(attrs={'placeholder': '000.000.000-00'}))
+
+    class Meta:
+        model = NotificacaoEdital
+        fields = '__all__'
+
+    def clean_cpf(self):
+        return normalizar_cpf(self.cleaned_data.get('cpf'))
+
+
 class NotificacaoEditalInline(admin.TabularInline):
     model = NotificacaoEdital
+    form = NotificacaoEditalAdminForm
     extra = 0
     readonly_fields = ['data_solicitacao', 'data_notificacao', 'ip_endereco', 'user_agent']
     fields = ['cpf', 'nome_completo', 'email', 'telefone_whatsapp', 'data_solicitacao', 'notificado', 'data_notificacao']
@@ -257,9 +282,22 @@ class NotificacaoEditalAdmin(admin.ModelAdmin):
     search_fields = ['nome_completo', 'email', 'cpf', 'edital__titulo']
     date_hierarchy = 'data_solicitacao'
     readonly_fields = ['data_solicitacao']
+    form = NotificacaoEditalAdminForm
     
     actions = ['marcar_como_notificado', 'enviar_notificacoes']
     
+    # Só dígitos, ponto, hífen e espaço: o termo pode ser um CPF digitado
+    # com pontuação, que não casa com os 11 dígitos gravados
+    TERMO_CPF = re.compile(r'^[\d.\-\s]+$')
+    
+    def get_search_results(self, request, queryset, search_term):
+        resultado, pode_duplicar = super().get_search_results(request, queryset, search_term)
+        termo = search_term.strip()
+        digitos = normalizar_cpf(termo)
+        if digitos and digitos != termo and self.TERMO_CPF.match(termo):
+            resultado |= queryset.filter(cpf__startswith=digitos)
+        return resultado, pode_duplicar
+    
     def notificado_display(self, obj):
         if obj.notificado:
             return format_html('<span style="color: #10b981;">✅ SIM</span>')
@@ -0,0 +1,65 @@
+"""
+Mudança automática de status dos editais pelas datas.
+
+Editais em breve abrem quando data_abertura passa; editais em breve ou
+abertos encerram quando data_encerramento passa. Rascunhos, suspensos e
+cancelados dependem da equipe e não mudam aqui.
+
+Cada transição é um único UPDATE sobre os editais vencidos, localizados
+pelos índices parciais (status, data_abertura) dos editais em breve e
+(status, data_encerramento) dos abertos. O update() não passa pelo save(), então
+data_atualizacao (usada no ETag das páginas públicas) e data_publicacao são
+gravadas junto. Ao final de cada lote o sinal
+editais.signals.status_atualizado é enviado uma vez com todos os editais
+que mudaram.
+"""
+from django.db import transaction
+from django.db.models import Q, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .models import Edital
+from .signals import status_atualizado
+
+
+def a_encerrar(agora):
+    # Um ramo por status (e não status__in) para cada um usar o seu índice parcial
+    return Edital.objects.filter(
+        Q(status='aberto', data_encerramento__lte=agora)
+        | Q(status='em_breve', data_encerramento__lte=agora)
+    ).order_by()
+
+
+def a_abrir(agora):
+    return Edital.objects.filter(
+        status='em_breve', data_abertura__lte=agora, data_encerramento__gt=agora,
+    ).order_by()
+
+
+def _transicao(editais, novo_status, agora, **campos):
+    """Passa os editais para `novo_status` em um UPDATE; retorna os ids alterados"""
+    with transaction.atomic():
+        ids = list(editais.select_for_update().values_list('id', flat=True))
+        if ids:
+            Edital.objects.filter(pk__in=ids).update(status=novo_status, data_atualizacao=agora, **campos)
+
+    if ids:
+        status_atualizado.send(sender=Edital, status=novo_status, editais_ids=ids, agora=agora)
+    return ids
+
+
+def atualizar_status(agora=None):
+    """
+    Encerra e abre os editais cujas datas já passaram.
+    Retorna {'encerrado': [ids], 'aberto': [ids]}.
+    """
+    agora = agora or timezone.now()
+
+    # Encerrar primeiro: um edital em breve com as duas datas vencidas vai
+    # direto para encerrado
+    encerrados = _transicao(a_encerrar(agora), 'encerrado', agora)
+    abertos = _transicao(
+        a_abrir(agora), 'aberto', agora,
+        data_publicacao=Coalesce('data_publicacao', Value(agora)),
+    )
+    return {'encerrado': encerrados, 'aberto': abertos}
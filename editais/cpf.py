@@ -0,0 +1,46 @@
+"""
+CPF: armazenado só com os 11 dígitos; pontuação e máscara são de exibição.
+
+A validação dos dígitos verificadores acontece uma vez, no formulário
+(NotificacaoEditalForm.clean_cpf). O model apenas garante o formato
+canônico antes de gravar.
+"""
+from django.core.exceptions import ValidationError
+
+
+def normalizar(valor):
+    """Apenas os dígitos do CPF digitado (com ou sem pontuação)"""
+    return ''.join(caractere for caractere in str(valor or '') if caractere.isdigit())
+
+
+def _digito_verificador(digitos):
+    soma = sum(int(digito) * peso for digito, peso in zip(digitos, range(len(digitos) + 1, 1, -1)))
+    resto = soma % 11
+    return '0' if resto < 2 else str(11 - resto)
+
+
+def validar(valor):
+    """CPF normalizado; ValidationError se não tiver 11 dígitos ou os verificadores não baterem"""
+    cpf = normalizar(valor)
+    if len(cpf) != 11:
+        raise ValidationError('CPF deve ter 11 dígitos.')
+    # Sequências como 111.111.111-11 passam no cálculo mas não são válidas
+    if cpf == cpf[0] * 11:
+        raise ValidationError('CPF inválido.')
+    if cpf[9] != _digito_verificador(cpf[:9]) or cpf[10] != _digito_verificador(cpf[:10]):
+        raise ValidationError('CPF inválido.')
+    return cpf
+
+
+def formatar(cpf):
+    """xxx.xxx.xxx-xx"""
+    if not cpf or len(cpf) != 11:
+        return cpf or ''
+    return f'{cpf[:3]}.{cpf[3:6]}.{cpf[6:9]}-{cpf[9:]}'
+
+
+def mascarar(cpf):
+    """xxx.***.***-xx, para listagens"""
+    if not cpf or len(cpf) != 11:
+        return cpf or ''
+    return f'{cpf[:3]}.***.***-{cpf[9:]}'
@@ -0,0 +1,90 @@
+"""
+Exportação dos interessados de um edital (NotificacaoEdital) em CSV e JSONL.
+
+As linhas vêm de values_list().iterator(chunk_size=...), sem instanciar os
+models nem carregar a lista inteira, e são enviadas por um
+StreamingHttpResponse à medida que o banco as entrega: a memória fica
+constante mesmo com dezenas de milhares de inscritos.
+"""
+import json
+
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+
+from core.planilhas import celula_segura
+
+from .cpf import formatar as formatar_cpf
+from .models import NotificacaoEdital
+
+TAMANHO_LOTE = 2000
+
+COLUNAS = [
+    ('nome_completo', 'Nome'),
+    ('cpf', 'CPF'),
+    ('email', 'E-mail'),
+    ('telefone_whatsapp', 'Telefone/WhatsApp'),
+    ('data_solicitacao', 'Data da Solicitação'),
+    ('notificado', 'Notificado'),
+    ('data_notificacao', 'Data da Notificação'),
+]
+
+FORMATOS = {
+    'csv': 'text/csv; charset=utf-8',
+    'jsonl': 'application/x-ndjson; charset=utf-8',
+}
+
+
+def _data(valor):
+    return timezone.localtime(valor).isoformat(timespec='seconds') if valor else None
+
+
+def registros(edital):
+    """Dicionários com as colunas de cada interessado, na ordem de solicitação"""
+    campos = [campo for campo, _ in COLUNAS]
+    linhas = NotificacaoEdital.objects.filter(edital=edital).order_by(
+        'data_solicitacao', 'id',
+    ).values_list(*campos).iterator(chunk_size=TAMANHO_LOTE)
+    for linha in linhas:
+        registro = dict(zip(campos, linha))
+        registro['cpf'] = formatar_cpf(registro['cpf'])
+        registro['data_solicitacao'] = _data(registro['data_solicitacao'])
+        registro['data_notificacao'] = _data(registro['data_notificacao'])
+        yield registro
+
+
+class _Eco:
+    """Destino do csv.writer: writerow devolve a linha em vez de guardá-la"""
+
+    def write(self, valor):
+        return valor
+
+
+def gerar_csv(edital):
+    """Pedaços (bytes) do CSV; o BOM faz o Excel abrir o arquivo como UTF-8"""
+    # Importado só na exportação: o módulo é carregado com as views
+    import csv
+
+    escritor = csv.writer(_Eco(), delimiter=';')
+    yield ('\ufeff' + escritor.writerow([titulo for _, titulo in COLUNAS])).encode('utf-8')
+    for registro in registros(edital):
+        registro['notificado'] = 'Sim' if registro['notificado'] else 'Não'
+        yield escritor.writerow(
+            ['' if registro[campo] is None else celula_segura(registro[campo]) for campo, _ in COLUNAS]
+        ).encode('utf-8')
+
+
+def gerar_jsonl(edital):
+    """Um objeto JSON por linha"""
+    for registro in registros(edital):
+        yield (json.dumps(registro, ensure_ascii=False) + '\n').encode('utf-8')
+
+
+GERADORES = {'csv': gerar_csv, 'jsonl': gerar_jsonl}
+
+
+def resposta(edital, formato):
+    response = StreamingHttpResponse(GERADORES[formato](edital), content_type=FORMATOS[formato])
+    response['Content-Disposition'] = (
+        f'attachment; filename="interessados-{edital.slug}-{timezone.localdate():%Y%m%d}.{formato}"'
+    )
+    return response
@@ -1,5 +1,6 @@
 from django import forms
 from django.core.exceptions import ValidationError
+from .cpf import validar as validar_cpf
 from .models import NotificacaoEdital
 import re
 
@@ -64,38 +65,8 @@ class NotificacaoEditalForm(forms.ModelForm):
         fields = ['cpf', 'nome_completo', 'email', 'telefone_whatsapp']
     
     def clean_cpf(self):
-        """Validação do CPF"""
-        cpf = self.cleaned_data.get('cpf')
-        if not cpf:
-            raise ValidationError('CPF é obrigatório.')
-        
-        # Remove caracteres especiais
-        cpf_limpo = re.sub(r'[^0-9]', '', cpf)
-        
-        # Verifica se tem 11 dígitos
-        if len(cpf_limpo) != 11:
-            raise ValidationError('CPF deve ter 11 dígitos.')
-        
-        # Verifica se não são todos os números iguais
-        if cpf_limpo == cpf_limpo[0] * 11:
-            raise ValidationError('CPF inválido.')
-        
-        # Algoritmo de validação do CPF
-        def calcular_digito(cpf_parcial, peso_inicial):
-            soma = sum(int(digito) * peso for digito, peso in zip(cpf_parcial, range(peso_inicial, 1, -1)))
-            resto = soma % 11
-            return 0 if resto < 2 else 11 - resto
-        
-        # Validar primeiro dígito
-        if int(cpf_limpo[9]) != calcular_digito(cpf_limpo[:9], 10):
-            raise ValidationError('CPF inválido.')
-        
-        # Validar segundo dígito
-        if int(cpf_limpo[10]) != calcular_digito(cpf_limpo[:10], 11):
-            raise ValidationError('CPF inválido.')
-        
-        # Formatar CPF
-        return f"{cpf_limpo[:3]}.{cpf_limpo[3:6]}.{cpf_limpo[6:9]}-{cpf_limpo[9:]}"
+        """Validação do CPF (dígitos verificadores); retorna só os 11 dígitos"""
+        return validar_cpf(self.cleaned_data.get('cpf'))
     
     def clean_telefone_whatsapp(self):
         """Validação do telefone"""
@@ -115,17 +86,3 @@ class NotificacaoEditalForm(forms.ModelForm):
             return f"({telefone_limpo[:2]}) {telefone_limpo[2:6]}-{telefone_limpo[6:]}"
         else:
             return f"({telefone_limpo[:2]}) {telefone_limpo[2:7]}-{telefone_limpo[7:]}"
-    
-    def clean(self):
-        """Validação geral do formulário"""
-        cleaned_data = super().clean()
-        cpf = cleaned_data.get('cpf')
-        email = cleaned_data.get('email')
-        edital = getattr(self.instance, 'edital', None)
-        
-        # Verificar se já existe notificação para este CPF e edital
-        if cpf and edital:
-            if NotificacaoEdital.objects.filter(cpf=cpf, edital=edital).exists():
-                raise ValidationError('Você já solicitou notificação para este edital com este CPF.')
-        
-        return cleaned_data
\ No newline at end of file
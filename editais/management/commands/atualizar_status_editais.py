@@ -0,0 +1,33 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from editais import agendamento
+
+
+class Command(BaseCommand):
+    help = (
+        'Abre e encerra os editais cujas datas de abertura e encerramento já passaram '
+        '(executar periodicamente, ex.: a cada minuto pelo cron)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--intervalo',
+            type=float,
+            default=0,
+            help='Repete a verificação a cada N segundos (padrão: executa uma vez)',
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            alterados = agendamento.atualizar_status()
+            for status, ids in alterados.items():
+                if ids:
+                    self.stdout.write(f'{len(ids)} edital(is) {status}(s)')
+
+            if not options['intervalo']:
+                break
+            time.sleep(options['intervalo'])
+
+        self.stdout.write(self.style.SUCCESS('Status dos editais atualizado'))
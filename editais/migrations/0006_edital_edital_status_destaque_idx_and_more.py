@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-19 05:28
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('editais', '0005_anexoedital'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='edital',
+            index=models.Index(fields=['status', '-destaque', '-data_criacao'], name='edital_status_destaque_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notificacaoedital',
+            index=models.Index(condition=models.Q(('notificado', False)), fields=['edital'], name='notificacao_pendente_idx'),
+        ),
+    ]
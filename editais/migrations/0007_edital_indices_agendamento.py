@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:14
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('editais', '0006_edital_edital_status_destaque_idx_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='edital',
+            index=models.Index(condition=models.Q(('status', 'em_breve')), fields=['status', 'data_abertura'], name='edital_abertura_pendente_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='edital',
+            index=models.Index(condition=models.Q(('status', 'aberto')), fields=['status', 'data_encerramento'], name='edital_encerram_pendente_idx'),
+        ),
+    ]
@@ -0,0 +1,67 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:18
+
+from django.db import migrations, models
+
+
+def _digitos(valor):
+    return ''.join(caractere for caractere in valor if caractere.isdigit())
+
+
+def cpf_somente_digitos(apps, schema_editor):
+    """
+    Reescreve os CPFs gravados como xxx.xxx.xxx-xx, antes do AlterField que
+    reduz a coluna para 11 caracteres. Se dois registros do mesmo edital
+    ficarem com o mesmo CPF, fica o que já estava só com dígitos ou, entre
+    os formatados, o mais antigo.
+    """
+    NotificacaoEdital = apps.get_model('editais', 'NotificacaoEdital')
+    vistos = set(
+        NotificacaoEdital.objects.exclude(cpf__contains='.').exclude(cpf__contains='-').exclude(
+            cpf=None,
+        ).values_list('edital_id', 'cpf')
+    )
+    alterados, repetidos = [], []
+    formatados = NotificacaoEdital.objects.filter(
+        models.Q(cpf__contains='.') | models.Q(cpf__contains='-')
+    ).only('id', 'edital_id', 'cpf').order_by('data_solicitacao', 'id')
+    for notificacao in formatados.iterator(chunk_size=2000):
+        notificacao.cpf = _digitos(notificacao.cpf)
+        if (notificacao.edital_id, notificacao.cpf) in vistos:
+            repetidos.append(notificacao.id)
+            continue
+        vistos.add((notificacao.edital_id, notificacao.cpf))
+        alterados.append(notificacao)
+
+    NotificacaoEdital.objects.filter(id__in=repetidos).delete()
+    NotificacaoEdital.objects.bulk_update(alterados, ['cpf'], batch_size=500)
+
+
+def cpf_formatado(apps, schema_editor):
+    NotificacaoEdital = apps.get_model('editais', 'NotificacaoEdital')
+    notificacoes = NotificacaoEdital.objects.filter(cpf__regex=r'^[0-9]{11}$').only('id', 'cpf')
+    alterados = []
+    for notificacao in notificacoes.iterator(chunk_size=2000):
+        cpf = notificacao.cpf
+        notificacao.cpf = f'{cpf[:3]}.{cpf[3:6]}.{cpf[6:9]}-{cpf[9:]}'
+        alterados.append(notificacao)
+    NotificacaoEdital.objects.bulk_update(alterados, ['cpf'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('editais', '0007_edital_indices_agendamento'),
+    ]
+
+    operations = [
+        migrations.RunPython(cpf_somente_digitos, cpf_formatado),
+        migrations.AlterField(
+            model_name='notificacaoedital',
+            name='cpf',
+            field=models.CharField(help_text='CPF do interessado, somente os 11 dígitos', max_length=11, null=True, verbose_name='CPF'),
+        ),
+        migrations.AddIndex(
+            model_name='notificacaoedital',
+            index=models.Index(fields=['cpf', 'edital'], name='notificacao_cpf_idx'),
+        ),
+    ]
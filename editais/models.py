@@ -4,6 +4,8 @@ from django.urls import reverse
 from django.core.validators import FileExtensionValidator
 import os
 
+from .cpf import formatar as formatar_cpf, mascarar as mascarar_cpf, normalizar as normalizar_cpf
+
 
 class CategoriaEdital(models.Model):
     """Categorias dos editais (Startups, Aceleração, Fomento, etc.)"""
@@ -284,6 +286,24 @@ class Edital(models.Model):
         verbose_name = "Edital"
         verbose_name_plural = "Editais"
         ordering = ['-data_criacao', '-destaque']
+        indexes = [
+            models.Index(fields=['status', '-destaque', '-data_criacao'], name='edital_status_destaque_idx'),
+            # Editais vencidos procurados pelo agendamento (editais.agendamento).
+            # Parciais: só entram os editais que ainda podem mudar de status, e
+            # as consultas das páginas (vários status) continuam no índice acima.
+            # Uma condição por status: o SQLite não usa um índice parcial com
+            # "status IN (...)" quando os valores vêm como parâmetros
+            models.Index(
+                fields=['status', 'data_abertura'],
+                condition=models.Q(status='em_breve'),
+                name='edital_abertura_pendente_idx',
+            ),
+            models.Index(
+                fields=['status', 'data_encerramento'],
+                condition=models.Q(status='aberto'),
+                name='edital_encerram_pendente_idx',
+            ),
+        ]
     
     def __str__(self):
         return f"{self.titulo} - {self.get_status_display()}"
@@ -400,11 +420,11 @@ class NotificacaoEdital(models.Model):
     
     # Dados pessoais
     cpf = models.CharField(
-        max_length=14,
+        max_length=11,
         blank=False,
         null=True,
         verbose_name="CPF",
-        help_text="CPF do interessado (xxx.xxx.xxx-xx)"
+        help_text="CPF do interessado, somente os 11 dígitos"
     )
     
     nome_completo = models.CharField(
@@ -461,6 +481,18 @@ class NotificacaoEdital(models.Model):
         verbose_name_plural = "Notificações de Editais"
         unique_together = ['edital', 'cpf']
         ordering = ['-data_solicitacao']
+        indexes = [
+            # Pendentes de envio por edital; notificado=False vira "NOT notificado",
+            # que não é usado como chave de busca em um índice composto
+            models.Index(
+                fields=['edital'],
+                condition=models.Q(notificado=False),
+                name='notificacao_pendente_idx',
+            ),
+            # Todas as solicitações de um CPF (a duplicata por edital usa o
+            # índice único de unique_together, que começa pelo edital)
+            models.Index(fields=['cpf', 'edital'], name='notificacao_cpf_idx'),
+        ]
     
     def __str__(self):
         return f"{self.nome_completo} - {self.edital.titulo}"
@@ -468,28 +500,26 @@ class NotificacaoEdital(models.Model):
     def clean(self):
         """Validação customizada"""
         from django.core.exceptions import ValidationError
-        import re
         
-        # Validar CPF (formato básico)
+        # Grava só os dígitos; os verificadores são conferidos no formulário
         if self.cpf:
-            # Remove caracteres especiais
-            cpf_limpo = re.sub(r'[^0-9]', '', self.cpf)
-            if len(cpf_limpo) != 11:
+            self.cpf = normalizar_cpf(self.cpf)
+            if len(self.cpf) != 11:
                 raise ValidationError({'cpf': 'CPF deve ter 11 dígitos.'})
-            
-            # Formatar CPF
-            self.cpf = f"{cpf_limpo[:3]}.{cpf_limpo[3:6]}.{cpf_limpo[6:9]}-{cpf_limpo[9:]}"
     
     def save(self, *args, **kwargs):
         self.clean()
         super().save(*args, **kwargs)
     
+    @property
+    def cpf_formatado(self):
+        """CPF com pontuação (xxx.xxx.xxx-xx) para exibição"""
+        return formatar_cpf(self.cpf)
+    
     @property
     def cpf_mascarado(self):
         """Retorna CPF mascarado para exibição"""
-        if self.cpf:
-            return f"{self.cpf[:3]}.***.**{self.cpf[-2:]}"
-        return ""
+        return mascarar_cpf(self.cpf)
     
     def __str__(self):
         return f"{self.email} - {self.edital.titulo}"
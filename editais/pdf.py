@@ -0,0 +1,55 @@
+"""Conteúdo do resumo do edital em PDF (renderizado pela fila de core.fila_pdf)"""
+from django.utils import timezone
+from django.utils.html import strip_tags
+
+from .models import AnexoEdital
+
+
+def _data(valor):
+    return timezone.localtime(valor).strftime('%d/%m/%Y %H:%M') if valor else '-'
+
+
+def conteudo_edital(edital):
+    """(título, blocos) do resumo do edital com a lista de anexos ativos"""
+    anexos = AnexoEdital.objects.filter(edital=edital, ativo=True).order_by('ordem', 'titulo')
+    areas = ', '.join(edital.areas_interesse.order_by('nome').values_list('nome', flat=True))
+
+    campos = [
+        ['Número', edital.numero_edital],
+        ['Categoria', edital.categoria.nome],
+        ['Modalidade', edital.get_modalidade_display()],
+        ['Status', edital.get_status_display()],
+        ['Publicação', _data(edital.data_publicacao)],
+        ['Abertura', _data(edital.data_abertura)],
+        ['Encerramento', _data(edital.data_encerramento)],
+        ['Áreas de interesse', areas or '-'],
+        ['Desafios', str(edital.numero_desafios or '-')],
+    ]
+    if edital.valor_premio:
+        campos.append(['Valor do prêmio', f'R$ {edital.valor_premio:,.2f}'])
+    if edital.link_inscricao:
+        campos.append(['Inscrição', edital.link_inscricao])
+
+    blocos = [['titulo', edital.titulo]]
+    if edital.subtitulo:
+        blocos.append(['paragrafo', edital.subtitulo])
+    blocos += [
+        ['campos', campos],
+        ['subtitulo', 'Descrição'],
+        ['paragrafo', strip_tags(edital.descricao_completa)],
+        ['subtitulo', 'Anexos'],
+    ]
+    linhas = [
+        [
+            anexo.titulo,
+            anexo.get_tipo_display(),
+            'Sim' if anexo.obrigatorio else 'Não',
+            anexo.arquivo.name.rsplit('/', 1)[-1] if anexo.arquivo else anexo.link_url,
+        ]
+        for anexo in anexos
+    ]
+    if linhas:
+        blocos.append(['tabela', ['Título', 'Tipo', 'Obrigatório', 'Arquivo / Link'], linhas])
+    else:
+        blocos.append(['paragrafo', 'Nenhum anexo.'])
+    return f'Edital {edital.numero_edital}', blocos
@@ -0,0 +1,63 @@
+import logging
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.dispatch import Signal, receiver
+from django.utils import timezone
+
+from .models import NotificacaoEdital
+
+logger = logging.getLogger(__name__)
+
+# Enviado uma vez por lote de editais que mudaram de status pelo agendamento
+# (editais.agendamento), com status, editais_ids e agora
+status_atualizado = Signal()
+
+# Mensagens enviadas (e marcadas como notificadas) por vez
+TAMANHO_LOTE = 100
+
+
+@receiver(status_atualizado)
+def notificar_interessados(sender, status, editais_ids, agora, **kwargs):
+    """
+    Avisa por e-mail quem pediu notificação dos editais que abriram. As
+    mensagens vão em uma conexão SMTP, em lotes de TAMANHO_LOTE, e cada lote
+    é marcado como notificado logo depois de enviado: uma falha no meio não
+    faz reenviar os lotes que já saíram.
+    """
+    if status != 'aberto':
+        return
+
+    pendentes = NotificacaoEdital.objects.filter(
+        edital_id__in=editais_ids, notificado=False,
+    ).select_related('edital').order_by('pk')
+    try:
+        with get_connection() as conexao:
+            ultimo = 0
+            while True:
+                lote = list(pendentes.filter(pk__gt=ultimo)[:TAMANHO_LOTE])
+                if not lote:
+                    return
+                conexao.send_messages([_mensagem(notificacao) for notificacao in lote])
+                NotificacaoEdital.objects.filter(pk__in=[notificacao.pk for notificacao in lote]).update(
+                    notificado=True, data_notificacao=agora,
+                )
+                ultimo = lote[-1].pk
+    except Exception as e:
+        # As do lote que falhou e as seguintes continuam pendentes e podem ser reenviadas pelo admin
+        logger.error(f"Erro ao enviar notificações de abertura de editais: {e}")
+
+
+def _mensagem(notificacao):
+    edital = notificacao.edital
+    return EmailMessage(
+        subject=f'[PONTI] Inscrições abertas: {edital.titulo}',
+        body=(
+            f'Olá, {notificacao.nome_completo or ""}\n\n'
+            f'O edital "{edital.titulo}" que você acompanha está com as inscrições abertas '
+            f'até {timezone.localtime(edital.data_encerramento):%d/%m/%Y %H:%M}.\n\n'
+            f'{edital.link_inscricao or edital.link_mais_informacoes}'
+        ),
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[notificacao.email],
+    )
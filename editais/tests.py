@@ -1,3 +1,423 @@
-from django.test import TestCase
+from datetime import timedelta
+import csv
+import json
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core import mail
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from . import agendamento, cpf
+from .admin import NotificacaoEditalAdminForm
+from .models import AreaInteresse, CategoriaEdital, Edital, NotificacaoEdital
+from .signals import status_atualizado
+
+
+@skipUnless(connection.vendor == 'sqlite', 'Plano de execução verificado no SQLite')
+class IndicesConsultasTests(TestCase):
+    """As consultas da página inicial e do painel de editais usam índice"""
+
+    def assertUsaIndice(self, queryset, indice):
+        plano = queryset.explain()
+        self.assertIn(f'USING INDEX {indice}', plano, plano)
+
+    def test_editais_da_pagina_inicial(self):
+        self.assertUsaIndice(
+            Edital.objects.filter(
+                status__in=['em_breve', 'aberto', 'encerrado']
+            ).order_by('-destaque', '-data_criacao'),
+            'edital_status_destaque_idx',
+        )
+
+    def test_editais_vencidos_do_agendamento(self):
+        agora = timezone.now()
+        self.assertUsaIndice(agendamento.a_abrir(agora), 'edital_abertura_pendente_idx')
+        self.assertUsaIndice(agendamento.a_encerrar(agora), 'edital_encerram_pendente_idx')
+
+    def test_solicitacoes_do_cpf(self):
+        self.assertUsaIndice(
+            NotificacaoEdital.objects.filter(cpf='52998224725').order_by('-data_solicitacao'),
+            'notificacao_cpf_idx',
+        )
+
+    def test_notificacoes_pendentes_do_edital(self):
+        self.assertUsaIndice(
+            NotificacaoEdital.objects.filter(edital_id=1, notificado=False),
+            'notificacao_pendente_idx',
+        )
+
+
+class PaginasPublicasTests(TestCase):
+    """Listagem e detalhe públicos com paginação por cursor e GET condicional"""
+
+    def setUp(self):
+        self.categoria = CategoriaEdital.objects.create(nome='Startups', slug='startups')
+        self.outra_categoria = CategoriaEdital.objects.create(nome='Fomento', slug='fomento')
+        self.area = AreaInteresse.objects.create(nome='Saúde Digital')
+        agora = timezone.now()
+        self.editais = []
+        for numero in range(5):
+            edital = Edital.objects.create(
+                titulo=f'Edital {numero}', numero_edital=f'E-{numero}', subtitulo='Sub',
+                descricao_completa='Descrição', categoria=self.categoria, status='aberto',
+                data_criacao=agora - timedelta(days=numero),
+                data_encerramento=agora + timedelta(days=30),
+            )
+            self.editais.append(edital)
+        self.editais[0].areas_interesse.add(self.area)
+        self.rascunho = Edital.objects.create(
+            titulo='Rascunho', numero_edital='R-1', subtitulo='Sub', descricao_completa='Descrição',
+            categoria=self.outra_categoria, status='rascunho', data_encerramento=agora,
+        )
+
+    def test_lista_paginada_por_cursor(self):
+        with mock.patch('editais.views.EDITAIS_POR_PAGINA', 2):
+            vistos = []
+            url = reverse('editais:lista')
+            while url:
+                response = self.client.get(url)
+                vistos += [edital.pk for edital in response.context['editais']]
+                proxima = response.context['proxima_pagina']
+                url = f"{reverse('editais:lista')}?{proxima}" if proxima else None
+
+        self.assertEqual(vistos, [edital.pk for edital in self.editais])
+
+    def test_lista_filtra_categoria_e_area(self):
+        response = self.client.get(reverse('editais:lista'), {'categoria': 'fomento'})
+        self.assertEqual(list(response.context['editais']), [])
+
+        response = self.client.get(reverse('editais:lista'), {'area': self.area.pk})
+        self.assertEqual(list(response.context['editais']), [self.editais[0]])
+
+    def test_pagina_inicial_mostra_so_o_resumo(self):
+        response = self.client.get('/')
+        self.assertContains(response, f'href="{self.editais[0].get_absolute_url()}"')
+        self.assertNotContains(response, self.rascunho.titulo)
+        self.assertNotContains(response, 'Descrição')
+        self.assertNotContains(response, ' style="background: linear')
+
+    def test_detalhe_de_rascunho_nao_existe(self):
+        response = self.client.get(reverse('editais:detalhe', args=[self.rascunho.slug]))
+        self.assertEqual(response.status_code, 404)
+
+    def test_detalhe_responde_304_sem_renderizar(self):
+        url = self.editais[0].get_absolute_url()
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('public', response['Cache-Control'])
+        self.assertIn('Last-Modified', response)
+
+        with self.assertNumQueries(1):
+            repetida = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(repetida.status_code, 304)
+        self.assertEqual(repetida.templates, [])
+
+        self.editais[0].subtitulo = 'Novo subtítulo'
+        self.editais[0].save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'Novo subtítulo')
+
+    def test_lista_revalida_quando_edital_sai_do_site(self):
+        response = self.client.get(reverse('editais:lista'))
+        etag = response['ETag']
+        self.assertEqual(self.client.get(reverse('editais:lista'), HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        self.editais[1].status = 'suspenso'
+        self.editais[1].save()
+        self.assertEqual(self.client.get(reverse('editais:lista'), HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+
+class AgendamentoStatusTests(TestCase):
+    """Abertura e encerramento automáticos pelas datas do edital"""
+
+    def setUp(self):
+        self.categoria = CategoriaEdital.objects.create(nome='Startups', slug='startups')
+        self.agora = timezone.now()
+
+    def criar_edital(self, numero, status, abertura, encerramento):
+        return Edital.objects.create(
+            titulo=f'Edital {numero}', numero_edital=f'E-{numero}', subtitulo='Sub',
+            descricao_completa='Descrição', categoria=self.categoria, status=status,
+            data_abertura=self.agora + abertura, data_encerramento=self.agora + encerramento,
+        )
+
+    def test_transicoes_em_lote(self):
+        dia = timedelta(days=1)
+        a_abrir = [self.criar_edital(n, 'em_breve', -dia, dia) for n in range(3)]
+        futuro = self.criar_edital(10, 'em_breve', dia, 2 * dia)
+        a_encerrar = self.criar_edital(11, 'aberto', -2 * dia, -dia)
+        vencido_sem_abrir = self.criar_edital(12, 'em_breve', -2 * dia, -dia)
+        rascunho = self.criar_edital(13, 'rascunho', -dia, dia)
+
+        recebidos = []
+
+        def receptor(sender, status, editais_ids, **kwargs):
+            recebidos.append((status, sorted(editais_ids)))
+
+        status_atualizado.connect(receptor)
+        self.addCleanup(status_atualizado.disconnect, receptor)
+
+        # Por status de destino: savepoint, busca, UPDATE e release; mais a
+        # busca de interessados do receptor de abertura
+        with self.assertNumQueries(2 * 4 + 1):
+            alterados = agendamento.atualizar_status(self.agora)
+
+        self.assertEqual(sorted(alterados['aberto']), sorted(edital.pk for edital in a_abrir))
+        self.assertEqual(sorted(alterados['encerrado']), sorted([a_encerrar.pk, vencido_sem_abrir.pk]))
+        self.assertEqual(recebidos, [
+            ('encerrado', sorted([a_encerrar.pk, vencido_sem_abrir.pk])),
+            ('aberto', sorted(edital.pk for edital in a_abrir)),
+        ])
+
+        edital = Edital.objects.get(pk=a_abrir[0].pk)
+        self.assertEqual(edital.status, 'aberto')
+        self.assertEqual(edital.data_publicacao, self.agora)
+        self.assertEqual(edital.data_atualizacao, self.agora)
+        self.assertEqual(Edital.objects.get(pk=futuro.pk).status, 'em_breve')
+        self.assertEqual(Edital.objects.get(pk=rascunho.pk).status, 'rascunho')
+
+        # Sem nada vencido, nenhum UPDATE nem sinal
+        self.assertEqual(agendamento.atualizar_status(self.agora), {'encerrado': [], 'aberto': []})
+        self.assertEqual(len(recebidos), 2)
+
+    def test_interessados_avisados_na_abertura(self):
+        dia = timedelta(days=1)
+        edital = self.criar_edital(1, 'em_breve', -dia, dia)
+        for numero in range(3):
+            NotificacaoEdital.objects.create(
+                edital=edital, cpf=f'{numero:011d}', nome_completo='Fulano',
+                email=f'pessoa{numero}@example.com',
+            )
+
+        agendamento.atualizar_status(self.agora)
+
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertIn(edital.titulo, mail.outbox[0].subject)
+        self.assertFalse(NotificacaoEdital.objects.filter(notificado=False).exists())
+
+    def test_lotes_enviados_ficam_marcados_se_um_lote_falhar(self):
+        dia = timedelta(days=1)
+        edital = self.criar_edital(1, 'em_breve', -dia, dia)
+        for numero in range(5):
+            NotificacaoEdital.objects.create(
+                edital=edital, cpf=f'{numero:011d}', nome_completo='Fulano',
+                email=f'pessoa{numero}@example.com',
+            )
+
+        enviar = mail.get_connection().send_messages
+
+        def falhar_no_segundo_lote(mensagens):
+            if mail.outbox:
+                raise OSError('SMTP indisponível')
+            return enviar(mensagens)
+
+        with mock.patch('editais.signals.TAMANHO_LOTE', 2), \
+                mock.patch('django.core.mail.backends.locmem.EmailBackend.send_messages',
+                           side_effect=falhar_no_segundo_lote), \
+                self.assertLogs('editais.signals', 'ERROR'):
+            agendamento.atualizar_status(self.agora)
+
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertEqual(
+            sorted(NotificacaoEdital.objects.filter(notificado=True).values_list('email', flat=True)),
+            sorted(mensagem.to[0] for mensagem in mail.outbox),
+        )
+        self.assertEqual(NotificacaoEdital.objects.filter(notificado=False).count(), 3)
+
+
+class SolicitacaoNotificacaoTests(TestCase):
+    """Cadastro idempotente: um INSERT, duplicatas classificadas pela restrição única"""
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        categoria = CategoriaEdital.objects.create(nome='Startups', slug='startups')
+        self.edital = Edital.objects.create(
+            titulo='Edital futuro', numero_edital='F-1', subtitulo='Sub', descricao_completa='Descrição',
+            categoria=categoria, status='em_breve', data_encerramento=timezone.now() + timedelta(days=30),
+        )
+
+    def solicitar(self, cpf='529.982.247-25'):
+        return self.client.post(
+            reverse('editais:solicitar_notificacao_ajax'),
+            data=json.dumps({
+                'edital_id': self.edital.pk, 'cpf': cpf, 'nome_completo': 'Fulano de Tal',
+                'email': 'fulano@example.com', 'aceito_termos': True,
+            }),
+            content_type='application/json',
+        ).json()
+
+    def test_duplo_clique_nao_chega_ao_banco(self):
+        self.assertTrue(self.solicitar()['success'])
+
+        # Só a busca do edital: a solicitação recente está no cache
+        with self.assertNumQueries(1):
+            resposta = self.solicitar('52998224725')
+        self.assertFalse(resposta['success'])
+        self.assertEqual(NotificacaoEdital.objects.count(), 1)
+
+    def test_duplicata_classificada_pelo_banco(self):
+        self.assertTrue(self.solicitar()['success'])
+        cache.clear()
+
+        resposta = self.solicitar()
+        self.assertFalse(resposta['success'])
+        self.assertIn('já solicitou', resposta['message'])
+        self.assertEqual(NotificacaoEdital.objects.count(), 1)
+
+    def test_cpf_gravado_somente_com_digitos(self):
+        self.assertTrue(self.solicitar('529.982.247-25')['success'])
+        notificacao = NotificacaoEdital.objects.get()
+        self.assertEqual(notificacao.cpf, '52998224725')
+        self.assertEqual(notificacao.cpf_formatado, '529.982.247-25')
+        self.assertEqual(notificacao.cpf_mascarado, '529.***.***-25')
+
+    def test_cpf_com_verificador_errado(self):
+        resposta = self.solicitar('529.982.247-26')
+        self.assertFalse(resposta['success'])
+        self.assertFalse(NotificacaoEdital.objects.exists())
+
+
+class CPFTests(SimpleTestCase):
+
+    def test_validar(self):
+        self.assertEqual(cpf.validar('529.982.247-25'), '52998224725')
+        for invalido in ('529.982.247-26', '111.111.111-11', '1234'):
+            with self.assertRaises(ValidationError):
+                cpf.validar(invalido)
+
+    def test_exibicao(self):
+        self.assertEqual(cpf.formatar('52998224725'), '529.982.247-25')
+        self.assertEqual(cpf.mascarar('52998224725'), '529.***.***-25')
+
+
+class NotificacoesPorCPFTests(TestCase):
+
+    def test_solicitacoes_de_todos_os_editais(self):
+        categoria = CategoriaEdital.objects.create(nome='Startups', slug='startups')
+        for numero in range(2):
+            edital = Edital.objects.create(
+                titulo=f'Edital {numero}', numero_edital=f'E-{numero}', subtitulo='Sub',
+                descricao_completa='Descrição', categoria=categoria, status='em_breve',
+                data_encerramento=timezone.now(),
+            )
+            NotificacaoEdital.objects.create(edital=edital, cpf='529.982.247-25', email='a@example.com')
+        NotificacaoEdital.objects.create(edital=edital, cpf='11144477735', email='b@example.com')
+
+        self.client.force_login(User.objects.create_user('staff', is_staff=True))
+        response = self.client.get(reverse('editais:admin_notificacoes_cpf'), {'cpf': '529.982.247-25'})
+        self.assertEqual(len(response.context['notificacoes']), 2)
+        self.assertContains(response, 'Edital 1')
+
+
+class NotificacaoAdminTests(TestCase):
+    """Busca e exibição do CPF no admin de notificações"""
+
+    @classmethod
+    def setUpTestData(cls):
+        categoria = CategoriaEdital.objects.create(nome='Startups', slug='startups')
+        cls.edital = Edital.objects.create(
+            titulo='Edital CPF', numero_edital='E-CPF', subtitulo='Sub',
+            descricao_completa='Descrição', categoria=categoria, status='em_breve',
+            data_encerramento=timezone.now(),
+        )
+        NotificacaoEdital.objects.create(
+            edital=cls.edital, cpf='52998224725', nome_completo='Fulano', email='a@example.com',
+        )
+        NotificacaoEdital.objects.create(
+            edital=cls.edital, cpf='11144477735', nome_completo='Beltrano', email='b@example.com',
+        )
+        cls.admin = User.objects.create_superuser('admin', 'admin@example.com', 'senha')
+
+    def setUp(self):
+        self.client.force_login(self.admin)
+
+    def buscar(self, termo):
+        response = self.client.get(reverse('admin:editais_notificacaoedital_changelist'), {'q': termo})
+        return [obj.nome_completo for obj in response.context['cl'].result_list]
+
+    def test_busca_por_cpf_com_pontuacao(self):
+        self.assertEqual(self.buscar('529.982.247-25'), ['Fulano'])
+        self.assertEqual(self.buscar('529.982'), ['Fulano'])
+        self.assertEqual(self.buscar('52998224725'), ['Fulano'])
+        self.assertEqual(self.buscar('Beltrano'), ['Beltrano'])
+
+    def test_cpf_exibido_formatado(self):
+        response = self.client.get(reverse('admin:editais_notificacaoedital_changelist'))
+        self.assertContains(response, '529.***.***-25')
+        response = self.client.get(reverse('admin:editais_edital_change', args=[self.edital.pk]))
+        self.assertContains(response, 'value="529.982.247-25"')
+
+    def test_cpf_com_pontuacao_gravado_como_digitos(self):
+        notificacao = NotificacaoEdital.objects.get(nome_completo='Fulano')
+        form = NotificacaoEditalAdminForm(
+            {'edital': self.edital.pk, 'cpf': '123.456.789-09', 'nome_completo': 'Fulano',
+             'email': 'a@example.com', 'data_solicitacao': timezone.now()},
+            instance=notificacao,
+        )
+        self.assertTrue(form.is_valid(), form.errors)
+        self.assertEqual(form.save().cpf, '12345678909')
+
+
+class InteressadosEditalTests(TestCase):
+
+    def setUp(self):
+        categoria = CategoriaEdital.objects.create(nome='Startups', slug='startups')
+        self.edital = Edital.objects.create(
+            titulo='Edital Popular', numero_edital='E-1', subtitulo='Sub',
+            descricao_completa='Descrição', categoria=categoria, status='em_breve',
+            data_encerramento=timezone.now() + timedelta(days=30),
+        )
+        NotificacaoEdital.objects.bulk_create([
+            NotificacaoEdital(
+                edital=self.edital, nome_completo=f'Pessoa {numero}', cpf=f'{numero:011d}',
+                email=f'pessoa{numero}@example.com', notificado=numero % 2 == 0,
+            )
+            for numero in range(60)
+        ])
+        self.client.force_login(User.objects.create_user('staff', is_staff=True))
+
+    def test_listagem_paginada(self):
+        response = self.client.get(reverse('editais:listar_notificacoes', args=[self.edital.slug]))
+        self.assertEqual(len(response.context['notificacoes']), 50)
+        self.assertEqual(response.context['total_notificacoes'], 60)
+        self.assertEqual(response.context['notificacoes_pendentes'], 30)
+
+        response = self.client.get(reverse('editais:listar_notificacoes', args=[self.edital.slug]), {'page': 2})
+        self.assertEqual(len(response.context['notificacoes']), 10)
+
+    def test_exportacao_csv(self):
+        response = self.client.get(reverse('editais:exportar_notificacoes', args=[self.edital.slug]), {'formato': 'csv'})
+        self.assertTrue(response.streaming)
+        self.assertIn('attachment', response['Content-Disposition'])
+        linhas = b''.join(response.streaming_content).decode('utf-8-sig').splitlines()
+        self.assertEqual(len(linhas), 61)
+        self.assertTrue(linhas[0].startswith('Nome;CPF;E-mail'))
+        self.assertTrue(linhas[1].startswith('Pessoa 0;000.000.000-00;pessoa0@example.com'))
+
+    def test_exportacao_csv_neutraliza_formulas(self):
+        NotificacaoEdital.objects.filter(nome_completo='Pessoa 0').update(
+            nome_completo='=HYPERLINK("http://exemplo.com")', telefone_whatsapp='+55 22 99999-0000',
+        )
+        response = self.client.get(reverse('editais:exportar_notificacoes', args=[self.edital.slug]), {'formato': 'csv'})
+        conteudo = b''.join(response.streaming_content).decode('utf-8-sig')
+        linha = next(csv.reader(conteudo.splitlines()[1:], delimiter=';'))
+        self.assertEqual(linha[0], '\'=HYPERLINK("http://exemplo.com")')
+        self.assertEqual(linha[3], "'+55 22 99999-0000")
+
+    def test_exportacao_jsonl(self):
+        response = self.client.get(reverse('editais:exportar_notificacoes', args=[self.edital.slug]), {'formato': 'jsonl'})
+        registros = [json.loads(linha) for linha in b''.join(response.streaming_content).decode('utf-8').splitlines()]
+        self.assertEqual(len(registros), 60)
+        self.assertEqual(registros[1]['cpf'], '000.000.000-01')
+        self.assertFalse(registros[1]['notificado'])
+
+    def test_formato_invalido(self):
+        response = self.client.get(reverse('editais:exportar_notificacoes', args=[self.edital.slug]), {'formato': 'xlsx'})
+        self.assertEqual(response.status_code, 400)
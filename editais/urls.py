@@ -15,6 +15,7 @@ urlpatterns = [
     path('admin/editais/<int:edital_id>/editar/', views.admin_editar_edital, name='admin_editar_edital'),
     path('admin/editais/<int:edital_id>/visualizar/', views.admin_visualizar_edital, name='admin_visualizar_edital'),
     path('admin/editais/<int:edital_id>/deletar/', views.admin_deletar_edital, name='admin_deletar_edital'),
+    path('admin/editais/<int:edital_id>/pdf/', views.admin_pdf_edital, name='admin_pdf_edital'),
     
     # AJAX
     path('admin/editais/<int:edital_id>/alterar-status/', views.admin_alterar_status_edital, name='admin_alterar_status_edital'),
@@ -29,12 +30,15 @@ urlpatterns = [
     
     # ===== URLS ORIGINAIS (Sistema de Notificações) =====
     
-    # URLs para views que serão criadas futuramente
-    # path('', views.lista_editais, name='lista'),
-    # path('<slug:slug>/', views.detalhe_edital, name='detalhe'),
-    
     # URLs para sistema de notificações
     path('notificar/<slug:edital_slug>/', views.solicitar_notificacao, name='solicitar_notificacao'),
     path('notificar-ajax/', views.solicitar_notificacao_ajax, name='solicitar_notificacao_ajax'),
     path('admin/notificacoes/<slug:edital_slug>/', views.listar_notificacoes_edital, name='listar_notificacoes'),
+    path('admin/notificacoes/<slug:edital_slug>/exportar/', views.exportar_notificacoes_edital, name='exportar_notificacoes'),
+    path('admin/notificacoes-por-cpf/', views.admin_notificacoes_cpf, name='admin_notificacoes_cpf'),
+    
+    # ===== URLS PÚBLICAS =====
+    # Por último: '<slug:slug>/' também casaria com 'notificar-ajax/'
+    path('', views.lista_editais, name='lista'),
+    path('<slug:slug>/', views.detalhe_edital, name='detalhe'),
 ]
\ No newline at end of file
@@ -1,13 +1,24 @@
+from datetime import datetime, timedelta, timezone as dt_timezone
+import hashlib
+from urllib.parse import urlencode
+
 from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.http import JsonResponse
-from django.views.decorators.http import require_http_methods
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition, require_http_methods
 from django.views.decorators.csrf import csrf_protect
 from django.utils import timezone
 from django.core.paginator import Paginator
-from django.db.models import Q, Count
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Q, Count, Max, Prefetch
 from django.utils.text import slugify
+from core import fila_pdf
+from core.limites import apenas_digitos, campo, ip_cliente, limitar_envios
+from . import exportacao
+from .cpf import formatar as formatar_cpf, normalizar as normalizar_cpf
 from .models import Edital, NotificacaoEdital, CategoriaEdital, AreaInteresse, AnexoEdital
 from .forms import NotificacaoEditalForm
 import json
@@ -19,13 +30,42 @@ def staff_required(user):
 
 
 def obter_ip_usuario(request):
-    """Obtém o IP real do usuário"""
-    x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-    if x_forwarded_for:
-        ip = x_forwarded_for.split(',')[0]
-    else:
-        ip = request.META.get('REMOTE_ADDR')
-    return ip
+    """Obtém o IP real do usuário (ver core.limites.ip_cliente)"""
+    return ip_cliente(request)
+
+
+# Solicitações recentes (edital + CPF): um duplo clique não chega ao banco
+TEMPO_SOLICITACAO_RECENTE = 5 * 60
+
+
+def registrar_notificacao(form, edital, request):
+    """
+    Grava a solicitação de notificação com um único INSERT e retorna False
+    se o CPF já estava cadastrado no edital. Quem decide é a restrição
+    unique_together (sem consulta prévia, que não evita a corrida entre
+    dois envios); o banco só é consultado para classificar um IntegrityError.
+    """
+    notificacao = form.save(commit=False)
+    notificacao.edital = edital
+    notificacao.ip_endereco = obter_ip_usuario(request)
+    notificacao.user_agent = request.META.get('HTTP_USER_AGENT', '')
+    
+    chave = f'notificacao:{edital.pk}:{notificacao.cpf}'
+    if not cache.add(chave, True, TEMPO_SOLICITACAO_RECENTE):
+        return False
+    
+    try:
+        with transaction.atomic():
+            notificacao.save()
+    except IntegrityError:
+        if NotificacaoEdital.objects.filter(edital=edital, cpf=notificacao.cpf).exists():
+            return False
+        cache.delete(chave)
+        raise
+    except Exception:
+        cache.delete(chave)
+        raise
+    return True
 
 
 # ===== VIEWS ADMINISTRATIVAS - CRUD EDITAIS =====
@@ -293,11 +333,33 @@ def admin_visualizar_edital(request, edital_id):
         'notificacoes': notificacoes,
         'total_notificacoes': notificacoes.count(),
         'notificacoes_pendentes': notificacoes.filter(notificado=False).count(),
+        # Enfileira o PDF da versão atual; o link só aparece quando ele estiver pronto
+        'pdf': fila_pdf.preparar('edital', edital),
     }
     
     return render(request, 'editais/admin/visualizar.html', context)
 
 
+@login_required
+@user_passes_test(staff_required)
+def admin_pdf_edital(request, edital_id):
+    """Baixar o resumo do edital em PDF, gerado pelo worker processar_pdfs"""
+    
+    edital = get_object_or_404(Edital, id=edital_id)
+    tarefa = fila_pdf.preparar('edital', edital, refazer_erro=True)
+    
+    if tarefa.pronta:
+        response = fila_pdf.resposta(tarefa, edital, f'edital-{edital.slug}.pdf')
+        if response is not None:
+            return response
+    
+    if tarefa.erro:
+        messages.warning(request, 'A geração do PDF deste edital falhou e foi reiniciada. Tente novamente em instantes.')
+    else:
+        messages.info(request, 'O PDF deste edital ainda está sendo gerado. Tente novamente em instantes.')
+    return redirect('editais:admin_visualizar_edital', edital_id=edital.id)
+
+
 @login_required
 @user_passes_test(staff_required)
 def admin_deletar_edital(request, edital_id):
@@ -371,11 +433,188 @@ def admin_toggle_destaque_edital(request, edital_id):
         return JsonResponse({'success': False, 'message': str(e)})
 
 
+# ===== VIEWS PÚBLICAS =====
+
+# Status que aparecem no site (os mesmos da página inicial)
+STATUS_PUBLICOS = ['em_breve', 'aberto', 'encerrado']
+EDITAIS_POR_PAGINA = 12
+ORDEM_PUBLICA = ('-destaque', '-data_criacao', '-id')
+_EPOCA = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+# O navegador revalida sempre (If-None-Match -> 304); o proxy pode servir a
+# mesma resposta por um minuto sem consultar a aplicação
+cache_publico = cache_control(public=True, max_age=0, s_maxage=60, must_revalidate=True)
+
+
+def _cursor(edital):
+    """Posição do edital na ordem da listagem: destaque, data de criação (µs) e id"""
+    microssegundos = (edital.data_criacao - _EPOCA) // timedelta(microseconds=1)
+    return f'{int(edital.destaque)}.{microssegundos}.{edital.id}'
+
+
+def _ler_cursor(valor):
+    try:
+        destaque, microssegundos, edital_id = (int(parte) for parte in valor.split('.'))
+    except ValueError:
+        return None
+    return bool(destaque), _EPOCA + timedelta(microseconds=microssegundos), edital_id
+
+
+def _apos_cursor(destaque, data_criacao, edital_id):
+    """Editais depois da posição do cursor na ordem decrescente da listagem"""
+    return (
+        Q(destaque__lt=destaque)
+        | Q(destaque=destaque, data_criacao__lt=data_criacao)
+        | Q(destaque=destaque, data_criacao=data_criacao, id__lt=edital_id)
+    )
+
+
+def _estado_editais(request):
+    """
+    Contagem e última atualização dos editais, calculadas uma vez por
+    requisição. Inclui os não públicos: um edital que sai do site também
+    precisa invalidar as listagens em cache.
+    """
+    if not hasattr(request, '_estado_editais'):
+        request._estado_editais = Edital.objects.aggregate(
+            total=Count('id'), ultima=Max('data_atualizacao'),
+        )
+    return request._estado_editais
+
+
+def _etag_lista(request):
+    estado = _estado_editais(request)
+    # O dia entra na etag porque os prazos exibidos dependem da data
+    partes = [timezone.localdate().isoformat(), str(estado['total'])]
+    if estado['ultima']:
+        partes.append(estado['ultima'].isoformat())
+    return hashlib.sha1('|'.join(partes).encode()).hexdigest()
+
+
+def _ultima_modificacao_lista(request):
+    return _estado_editais(request)['ultima']
+
+
+def _estado_edital(request, slug):
+    """Última atualização do edital público e dos seus anexos (None se não existir)"""
+    if not hasattr(request, '_estado_edital'):
+        request._estado_edital = Edital.objects.filter(
+            slug=slug, status__in=STATUS_PUBLICOS,
+        ).annotate(
+            total_anexos=Count('anexos'), ultimo_anexo=Max('anexos__data_atualizacao'),
+        ).values(
+            'data_atualizacao', 'data_abertura', 'data_encerramento', 'total_anexos', 'ultimo_anexo',
+        ).first()
+    return request._estado_edital
+
+
+def _etag_edital(request, slug):
+    estado = _estado_edital(request, slug)
+    if estado is None:
+        return None
+    agora = timezone.now()
+    # O botão de inscrição depende de a abertura e o encerramento já terem passado
+    abertura, encerramento = estado['data_abertura'], estado['data_encerramento']
+    partes = [
+        timezone.localdate().isoformat(),
+        str(abertura is None or abertura <= agora),
+        str(encerramento < agora),
+        estado['data_atualizacao'].isoformat(),
+        str(estado['total_anexos']),
+        estado['ultimo_anexo'].isoformat() if estado['ultimo_anexo'] else '',
+    ]
+    return hashlib.sha1('|'.join(partes).encode()).hexdigest()
+
+
+def _ultima_modificacao_edital(request, slug):
+    estado = _estado_edital(request, slug)
+    if estado is None:
+        return None
+    return max(filter(None, [estado['data_atualizacao'], estado['ultimo_anexo']]))
+
+
+@cache_publico
+@condition(etag_func=_etag_lista, last_modified_func=_ultima_modificacao_lista)
+@require_http_methods(["GET", "HEAD"])
+def lista_editais(request):
+    """Listagem pública dos editais, paginada por cursor e filtrável por categoria e área"""
+    
+    editais = Edital.objects.filter(
+        status__in=STATUS_PUBLICOS
+    ).select_related('categoria').prefetch_related('areas_interesse').defer(
+        'descricao_completa'
+    ).order_by(*ORDEM_PUBLICA)
+    
+    categoria = request.GET.get('categoria', '')
+    area = request.GET.get('area', '')
+    
+    if categoria:
+        editais = editais.filter(categoria__slug=categoria)
+    if area.isdigit():
+        editais = editais.filter(areas_interesse__id=area)
+    
+    # Cursor: posição do último edital da página anterior. Um cursor
+    # inválido volta para a primeira página
+    posicao = _ler_cursor(request.GET.get('apos', ''))
+    if posicao:
+        editais = editais.filter(_apos_cursor(*posicao))
+    
+    # Um edital a mais indica se existe próxima página, sem COUNT
+    pagina = list(editais[:EDITAIS_POR_PAGINA + 1])
+    proxima = None
+    if len(pagina) > EDITAIS_POR_PAGINA:
+        pagina = pagina[:EDITAIS_POR_PAGINA]
+        filtros = {'categoria': categoria, 'area': area, 'apos': _cursor(pagina[-1])}
+        proxima = urlencode({chave: valor for chave, valor in filtros.items() if valor})
+    
+    context = {
+        'editais': pagina,
+        'categorias': CategoriaEdital.objects.filter(ativo=True),
+        'areas': AreaInteresse.objects.filter(ativo=True),
+        'categoria_selecionada': categoria,
+        'area_selecionada': area,
+        'proxima_pagina': proxima,
+        'tem_pagina_anterior': posicao is not None,
+    }
+    
+    return render(request, 'editais/lista.html', context)
+
+
+@cache_publico
+@condition(etag_func=_etag_edital, last_modified_func=_ultima_modificacao_edital)
+@require_http_methods(["GET", "HEAD"])
+def detalhe_edital(request, slug):
+    """Página pública do edital com áreas de interesse e anexos ativos"""
+    
+    edital = get_object_or_404(
+        Edital.objects.filter(status__in=STATUS_PUBLICOS).select_related('categoria').prefetch_related(
+            'areas_interesse',
+            Prefetch(
+                'anexos',
+                queryset=AnexoEdital.objects.filter(ativo=True).order_by('ordem', 'titulo'),
+                to_attr='anexos_ativos',
+            ),
+        ),
+        slug=slug,
+    )
+    
+    context = {
+        'edital': edital,
+        'anexos_obrigatorios': sum(1 for anexo in edital.anexos_ativos if anexo.obrigatorio),
+    }
+    
+    return render(request, 'editais/detalhe.html', context)
+
+
 # ===== VIEWS ORIGINAIS =====
 
 
 @csrf_protect
 @require_http_methods(["GET", "POST"])
+@limitar_envios('notificacao', limite=5, periodo=10 * 60, chaves={
+    'ip': ip_cliente,
+    'cpf': campo('cpf', apenas_digitos),
+})
 def solicitar_notificacao(request, edital_slug):
     """View para solicitar notificação de edital"""
     edital = get_object_or_404(Edital, slug=edital_slug)
@@ -390,20 +629,10 @@ def solicitar_notificacao(request, edital_slug):
         
         if form.is_valid():
             try:
-                # Verificar se já existe notificação para este CPF e edital
-                cpf = form.cleaned_data['cpf']
-                
-                if NotificacaoEdital.objects.filter(cpf=cpf, edital=edital).exists():
+                if not registrar_notificacao(form, edital, request):
                     messages.warning(request, 'Você já solicitou notificação para este edital com este CPF.')
                     return redirect('core:index')
                 
-                # Criar nova notificação
-                notificacao = form.save(commit=False)
-                notificacao.edital = edital
-                notificacao.ip_endereco = obter_ip_usuario(request)
-                notificacao.user_agent = request.META.get('HTTP_USER_AGENT', '')
-                notificacao.save()
-                
                 messages.success(
                     request, 
                     f'Notificação solicitada com sucesso! Você será avisado por e-mail quando o edital "{edital.titulo}" for lançado.'
@@ -432,6 +661,10 @@ def solicitar_notificacao(request, edital_slug):
 
 @csrf_protect
 @require_http_methods(["POST"])
+@limitar_envios('notificacao', limite=5, periodo=10 * 60, chaves={
+    'ip': ip_cliente,
+    'cpf': campo('cpf', apenas_digitos),
+})
 def solicitar_notificacao_ajax(request):
     """View AJAX para solicitar notificação de edital"""
     try:
@@ -465,22 +698,12 @@ def solicitar_notificacao_ajax(request):
         form = NotificacaoEditalForm(form_data)
         
         if form.is_valid():
-            # Verificar se já existe notificação para este CPF e edital
-            cpf = form.cleaned_data['cpf']
-            
-            if NotificacaoEdital.objects.filter(cpf=cpf, edital=edital).exists():
+            if not registrar_notificacao(form, edital, request):
                 return JsonResponse({
                     'success': False,
                     'message': 'Você já solicitou notificação para este edital com este CPF.'
                 })
             
-            # Criar nova notificação
-            notificacao = form.save(commit=False)
-            notificacao.edital = edital
-            notificacao.ip_endereco = obter_ip_usuario(request)
-            notificacao.user_agent = request.META.get('HTTP_USER_AGENT', '')
-            notificacao.save()
-            
             return JsonResponse({
                 'success': True,
                 'message': f'Notificação solicitada com sucesso! Você será avisado por e-mail quando o edital "{edital.titulo}" for lançado.'
@@ -518,18 +741,59 @@ def listar_notificacoes_edital(request, edital_slug):
         return redirect('core:index')
     
     edital = get_object_or_404(Edital, slug=edital_slug)
-    notificacoes = NotificacaoEdital.objects.filter(edital=edital).order_by('-data_solicitacao')
+    notificacoes = NotificacaoEdital.objects.filter(edital=edital)
+    contagem = notificacoes.aggregate(
+        total=Count('id'),
+        pendentes=Count('id', filter=Q(notificado=False)),
+    )
+    
+    # Editais populares têm milhares de inscritos: a página mostra 50 por vez
+    # e a lista completa sai pela exportação (exportar_notificacoes_edital)
+    paginator = Paginator(notificacoes.order_by('-data_solicitacao', '-id'), 50)
+    paginator.count = contagem['total']
+    page_obj = paginator.get_page(request.GET.get('page'))
     
     context = {
         'edital': edital,
-        'notificacoes': notificacoes,
-        'total_notificacoes': notificacoes.count(),
-        'notificacoes_pendentes': notificacoes.filter(notificado=False).count(),
+        'notificacoes': page_obj,
+        'total_notificacoes': contagem['total'],
+        'notificacoes_pendentes': contagem['pendentes'],
     }
     
     return render(request, 'editais/listar_notificacoes.html', context)
 
 
+@login_required
+@user_passes_test(staff_required)
+def exportar_notificacoes_edital(request, edital_slug):
+    """Lista completa de interessados no formato de ?formato= (csv ou jsonl), enviada em streaming"""
+    
+    edital = get_object_or_404(Edital, slug=edital_slug)
+    formato = request.GET.get('formato', 'csv')
+    if formato not in exportacao.FORMATOS:
+        return JsonResponse({'error': 'Formato inválido'}, status=400)
+    return exportacao.resposta(edital, formato)
+
+
+@login_required
+@user_passes_test(staff_required)
+def admin_notificacoes_cpf(request):
+    """Todas as solicitações de notificação de um CPF, em qualquer edital"""
+    
+    cpf = normalizar_cpf(request.GET.get('cpf', ''))
+    notificacoes = []
+    if len(cpf) == 11:
+        # Índice notificacao_cpf_idx (cpf, edital)
+        notificacoes = NotificacaoEdital.objects.filter(cpf=cpf).select_related('edital').order_by('-data_solicitacao')
+    
+    context = {
+        'cpf': formatar_cpf(cpf) if len(cpf) == 11 else request.GET.get('cpf', ''),
+        'notificacoes': notificacoes,
+    }
+    
+    return render(request, 'editais/admin/notificacoes_cpf.html', context)
+
+
 # ===== VIEWS ANEXOS =====
 
 @login_required
@@ -14,3 +14,8 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ponti_hub_inovacao.settings')
 
 application = get_asgi_application()
+
+# Templates pré-compilados só no processo do servidor (core.aquecimento)
+from core.aquecimento import aquecer_no_boot  # noqa: E402
+
+aquecer_no_boot()
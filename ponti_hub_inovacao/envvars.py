@@ -1,14 +1,180 @@
-import yaml
+import marshal
+import os
+import warnings
 
-try:
-    from yaml import CLoader as Loader, CDumper as Dumper
-except ImportError:
-    from yaml import Loader, Dumper
+from django.core.exceptions import ImproperlyConfigured
 
-def load_envars(BASE_DIR):
+# Chaves aceitas no .envvars.yaml e seus tipos. Os valores padrão ficam no
+# settings.py, junto de cada configuração.
+ESQUEMA = {
+    'django_secret_key': str,
+    'debug_mode': bool,
+    'aquecer_templates': bool,
+    'sqlite_mode': bool,
+    'sqlite_otimizado': bool,
+    'sqlite_busy_timeout': (int, float),
+    'sqlite_journal_mode': str,
+    'sqlite_mmap_size': int,
+    'sqlite_cache_size': int,
+    'db_engine': str,
+    'db_name': str,
+    'db_user': str,
+    'db_pw': str,
+    'db_host': str,
+    'db_port': int,
+    'db_conn_max_age': (int, type(None)),
+    'db_conn_health_checks': bool,
+    'db_pool': (bool, dict),
+    'cache_backend': str,
+    'cache_location': str,
+    'cache_timeout': (int, type(None)),
+    'relatorios_dir': str,
+    'relatorios_workers': int,
+    'email_sistema': str,
+    'email_pw': str,
+    'proxies_confiaveis': int,
+}
+
+# Variáveis de ambiente PONTI_<CHAVE> sobrescrevem o arquivo
+PREFIXO_AMBIENTE = 'PONTI_'
+ARQUIVO = '.envvars.yaml'
+ARQUIVO_CACHE = '.envvars.cache'
+
+
+def localizar_arquivo(BASE_DIR):
+    """Caminho do .envvars.yaml: PONTI_ENVVARS, raiz do projeto ou diretório acima"""
+    candidatos = [
+        os.environ.get(PREFIXO_AMBIENTE + 'ENVVARS'),
+        os.path.join(BASE_DIR, ARQUIVO),
+        os.path.join(BASE_DIR.parent, ARQUIVO),
+    ]
+    for caminho in candidatos:
+        if caminho and os.path.isfile(caminho):
+            return caminho
+
+    raise ImproperlyConfigured(
+        f"Arquivo {ARQUIVO} não encontrado. Locais verificados: "
+        + ', '.join(c for c in candidatos if c)
+    )
+
+
+def ler_yaml(caminho):
+    # Importado só quando o cache está desatualizado: o PyYAML é a parte
+    # mais cara da inicialização das configurações
+    import yaml
+
+    try:
+        from yaml import CSafeLoader as Loader
+    except ImportError:
+        from yaml import SafeLoader as Loader
+
+    with open(caminho, 'r') as arquivo:
+        try:
+            dados = yaml.load(arquivo, Loader=Loader)
+        except yaml.YAMLError as e:
+            raise ImproperlyConfigured(f"{caminho} não é um YAML válido: {e}")
+
+    if dados is None:
+        return {}
+    if not isinstance(dados, dict):
+        raise ImproperlyConfigured(f"{caminho} deve conter um mapeamento chave: valor")
+    return dados
+
+
+def ler_com_cache(caminho, caminho_cache):
+    """
+    Lê o YAML reaproveitando a versão compilada (marshal) enquanto o
+    mtime e o tamanho do arquivo não mudarem.
+    """
+    estado = os.stat(caminho)
+    chave = (os.path.abspath(caminho), estado.st_mtime_ns, estado.st_size)
+
+    try:
+        with open(caminho_cache, 'rb') as arquivo:
+            chave_cache, dados = marshal.load(arquivo)
+        if tuple(chave_cache) == chave:
+            return dados
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    dados = ler_yaml(caminho)
     try:
-        yaml_file=open("./.envvars.yaml", "r")        
-    except:
-        yaml_file=open(str(BASE_DIR.parent) + "/.envvars.yaml", "r")
-        
-    return yaml.load(yaml_file, Loader=Loader)
+        # O cache tem as mesmas credenciais do YAML
+        descritor = os.open(caminho_cache, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(descritor, 'wb') as arquivo:
+            marshal.dump((chave, dados), arquivo)
+    except (OSError, ValueError):
+        # Diretório somente leitura ou valor não serializável: segue sem cache
+        pass
+    return dados
+
+
+def converter_ambiente(chave, valor):
+    """Converte o texto de uma variável de ambiente para o tipo do esquema"""
+    tipos = ESQUEMA[chave] if isinstance(ESQUEMA[chave], tuple) else (ESQUEMA[chave],)
+    if str in tipos:
+        return valor
+
+    texto = valor.strip().lower()
+    if bool in tipos and texto in ('true', 'false', '1', '0', 'yes', 'no', 'sim', 'nao', 'não'):
+        return texto in ('true', '1', 'yes', 'sim')
+    if type(None) in tipos and texto in ('', 'none', 'null'):
+        return None
+    for tipo in (int, float):
+        if tipo in tipos:
+            try:
+                return tipo(texto)
+            except ValueError:
+                pass
+    if dict in tipos:
+        return ler_yaml_texto(chave, valor)
+
+    raise ImproperlyConfigured(
+        f"{PREFIXO_AMBIENTE}{chave.upper()}={valor!r} não é um valor válido para {chave}"
+    )
+
+
+def ler_yaml_texto(chave, valor):
+    import yaml
+
+    try:
+        dados = yaml.safe_load(valor)
+    except yaml.YAMLError as e:
+        raise ImproperlyConfigured(f"{PREFIXO_AMBIENTE}{chave.upper()} não é um YAML válido: {e}")
+    if not isinstance(dados, dict):
+        raise ImproperlyConfigured(f"{PREFIXO_AMBIENTE}{chave.upper()} deve ser um mapeamento")
+    return dados
+
+
+def validar(dados, origem):
+    """Confere os tipos das chaves conhecidas e avisa sobre chaves desconhecidas"""
+    for chave, valor in dados.items():
+        if chave not in ESQUEMA:
+            warnings.warn(f"Chave desconhecida em {origem}: {chave}", RuntimeWarning)
+            continue
+
+        tipos = ESQUEMA[chave] if isinstance(ESQUEMA[chave], tuple) else (ESQUEMA[chave],)
+        # bool é subclasse de int: "db_port: true" não deve passar como porta
+        valido = isinstance(valor, tipos) and not (isinstance(valor, bool) and bool not in tipos)
+        if not valido:
+            esperado = ' ou '.join('null' if t is type(None) else t.__name__ for t in tipos)
+            raise ImproperlyConfigured(
+                f"{chave} em {origem} deve ser {esperado}, recebido {type(valor).__name__}: {valor!r}"
+            )
+
+
+def load_envars(BASE_DIR):
+    """
+    Carrega as configurações do .envvars.yaml já validadas pelo ESQUEMA,
+    com as variáveis de ambiente PONTI_<CHAVE> tendo precedência.
+    """
+    caminho = localizar_arquivo(BASE_DIR)
+    envvars = dict(ler_com_cache(caminho, os.path.join(BASE_DIR, ARQUIVO_CACHE)))
+    validar(envvars, caminho)
+
+    for chave in ESQUEMA:
+        valor = os.environ.get(PREFIXO_AMBIENTE + chave.upper())
+        if valor is not None:
+            envvars[chave] = converter_ambiente(chave, valor)
+
+    return envvars
@@ -31,6 +31,11 @@ DEBUG = envvars.get('debug_mode', True)
 
 ALLOWED_HOSTS = ['191.252.178.203', 'ponti.esalarini.com.br', 'localhost']
 
+# Quantos proxies reversos (nginx, balanceador) ficam na frente da aplicação.
+# O IP do cliente usado no limite de envios é o que o proxy mais externo
+# acrescentou ao X-Forwarded-For; com 0, o REMOTE_ADDR, e o cabeçalho é ignorado
+PROXIES_CONFIAVEIS = envvars.get('proxies_confiaveis', 0)
+
 
 # Application definition
 
@@ -51,6 +56,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'core.middleware.ArquivosEstaticosMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -65,44 +71,144 @@ TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
         'DIRS': [],
-        'APP_DIRS': True,
         'OPTIONS': {
             'context_processors': [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
             ],
+            # Templates compilados ficam em memória em cada worker; o
+            # runserver limpa o cache quando um template é alterado.
+            # core.carregadores tira a indentação da página inicial na leitura
+            'loaders': [
+                ('django.template.loaders.cached.Loader', [
+                    'django.template.loaders.filesystem.Loader',
+                    'core.carregadores.CarregadorCompacto',
+                ]),
+            ],
         },
     },
 ]
 
+# Pré-compilação dos templates mais acessados no boot do servidor
+# (wsgi.py/asgi.py, core.aquecimento.aquecer_no_boot)
+TEMPLATES_AQUECER = envvars.get('aquecer_templates', not DEBUG)
+TEMPLATES_PRECOMPILAR = [
+    'core/index.html',
+    'core/inicio/*.html',
+    'projetos/base.html',
+    'projetos/dashboard.html',
+    'projetos/*/listar.html',
+    'projetos/*/detalhar.html',
+    'editais/solicitar_notificacao.html',
+]
+
 WSGI_APPLICATION = 'ponti_hub_inovacao.wsgi.application'
 
 
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# Conexões persistentes: cada worker reaproveita a conexão entre requisições
+# por até db_conn_max_age segundos, verificando-a antes do reuso. O runserver
+# abre uma thread por requisição, então em DEBUG o padrão é fechar ao final.
+# Os backends em core.db medem abertura de conexões (painel/instrumentacao/).
+DB_CONEXOES = {
+    'CONN_MAX_AGE': envvars.get('db_conn_max_age', 0 if DEBUG else 60),
+    'CONN_HEALTH_CHECKS': envvars.get('db_conn_health_checks', True),
+}
+
+# Perfil de desempenho do SQLite, aplicado a cada nova conexão. Com WAL os
+# leitores não bloqueiam o escritor (e vice-versa) e synchronous=NORMAL é
+# seguro; transações IMMEDIATE pegam o lock de escrita no BEGIN, então o
+# busy timeout (segundos) vale também para quem lê antes de escrever.
+# Comparativo: python manage.py benchmark_sqlite
+# O journal_mode fica gravado no arquivo: em DEBUG o padrão é o journal de
+# rollback, para não reescrever o db.sqlite3 versionado a cada execução.
+# Atenção: DEBUG vem ligado por padrão, e então o WAL fica desligado; em
+# produção use debug_mode: false ou sqlite_journal_mode: WAL (ou
+# PONTI_SQLITE_JOURNAL_MODE=WAL).
+SQLITE_OTIMIZADO = envvars.get('sqlite_otimizado', True)
+SQLITE_BUSY_TIMEOUT = envvars.get('sqlite_busy_timeout', 20)
+SQLITE_PRAGMAS = {
+    'journal_mode': envvars.get('sqlite_journal_mode', 'DELETE' if DEBUG else 'WAL'),
+    'synchronous': 'NORMAL',
+    'mmap_size': envvars.get('sqlite_mmap_size', 128 * 1024 * 1024),
+    'cache_size': envvars.get('sqlite_cache_size', -20000),  # negativo = KiB
+    'temp_store': 'MEMORY',
+}
+
 # Configuração condicional de banco de dados baseada em sqlite_mode
 if envvars.get('sqlite_mode', True):
     DATABASES = {
         'default': {
-            'ENGINE': 'django.db.backends.sqlite3',
+            'ENGINE': 'core.db.backends.sqlite3',
             'NAME': BASE_DIR / 'db.sqlite3',
+            'OPTIONS': {
+                'timeout': SQLITE_BUSY_TIMEOUT,
+                'transaction_mode': 'IMMEDIATE',
+                'init_command': ';'.join(
+                    f'PRAGMA {pragma}={valor}' for pragma, valor in SQLITE_PRAGMAS.items()
+                ),
+            } if SQLITE_OTIMIZADO else {},
+            **DB_CONEXOES,
         }
     }
+elif envvars.get('db_engine', 'mysql') == 'postgresql':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'core.db.backends.postgresql',
+            'NAME': envvars.get('db_name', 'ponti_hub_inovacao'),
+            'USER': envvars.get('db_user', 'ponti'),
+            'PASSWORD': envvars.get('db_pw', ''),
+            'HOST': envvars.get('db_host', 'localhost'),
+            'PORT': envvars.get('db_port', 5432),
+            'OPTIONS': {},
+            **DB_CONEXOES,
+        }
+    }
+    # Pool nativo (psycopg_pool): true ou {min_size, max_size, timeout}.
+    # Não é compatível com conexões persistentes.
+    db_pool = envvars.get('db_pool', False)
+    if db_pool:
+        DATABASES['default']['OPTIONS']['pool'] = db_pool
+        DATABASES['default']['CONN_MAX_AGE'] = 0
 else:
     DATABASES = {
+        'default': {
+            'ENGINE': 'core.db.backends.mysql',
+            'NAME': envvars.get('db_name', 'ponti_hub_inovacao'),
+            'USER': envvars.get('db_user', 'ponti'),
+            'PASSWORD': envvars.get('db_pw', ''),
+            'HOST': envvars.get('db_host', 'localhost'),
+            'PORT': envvars.get('db_port', 3306),
+            'OPTIONS': {
+                'charset': 'utf8mb4',
+                'init_command': "SET NAMES 'utf8mb4' COLLATE 'utf8mb4_unicode_ci', sql_mode='STRICT_TRANS_TABLES'",
+            },
+            **DB_CONEXOES,
+        }
+    }
+
+    # O MySQL não tem índices parciais: a condição dos Meta.indexes é
+    # ignorada e o índice é criado sobre todas as linhas
+    SILENCED_SYSTEM_CHECKS = ['models.W037']
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+
+# Em memória por padrão (vale por processo). Com vários workers um backend
+# compartilhado é obrigatório: o cronograma em cache de projetos.caminho_critico
+# é atualizado no lugar e invalidado entre processos. Por exemplo
+# cache_backend: django.core.cache.backends.redis.RedisCache
+# cache_location: redis://127.0.0.1:6379
+CACHES = {
     'default': {
-        'ENGINE': 'django.db.backends.mysql',
-        'NAME': envvars.get('db_name', 'ponti_hub_inovacao'),
-        'USER': envvars.get('db_user', 'ponti'),
-        'PASSWORD': envvars.get('db_pw', ''),
-        'HOST': envvars.get('db_host', 'localhost'),
-        'PORT': envvars.get('db_port', 3306),
-        'OPTIONS': {
-            'charset': 'utf8mb4',
-            'init_command': "SET NAMES 'utf8mb4' COLLATE 'utf8mb4_unicode_ci', sql_mode='STRICT_TRANS_TABLES'",
-        },
+        'BACKEND': envvars.get('cache_backend', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': envvars.get('cache_location', 'ponti-hub-inovacao'),
+        'TIMEOUT': envvars.get('cache_timeout', 300),
+        'KEY_PREFIX': 'ponti',
     }
 }
 
@@ -147,10 +253,28 @@ STATICFILES_DIRS = [
     BASE_DIR / 'core' / 'static',
 ]
 
+# collectstatic grava nomes com hash + staticfiles.json e as variantes .gz/.br;
+# o ArquivosEstaticosMiddleware serve o STATIC_ROOT com cache de longa duração
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'core.storage.ArmazenamentoEstaticoComprimido',
+    },
+}
+STATIC_CACHE_MAX_AGE = 60 * 60 * 24 * 365  # arquivos versionados (1 ano, immutable)
+STATIC_CACHE_MAX_AGE_NAO_VERSIONADO = 60
+
 # Media files (uploads)
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Relatórios gerados (projetos.artefatos). Ficam fora do MEDIA_ROOT porque
+# só são servidos pelas views com login
+RELATORIOS_DIR = Path(envvars.get('relatorios_dir', BASE_DIR / 'relatorios_gerados'))
+RELATORIOS_WORKERS = envvars.get('relatorios_workers', 2)
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -14,3 +14,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ponti_hub_inovacao.settings')
 
 application = get_wsgi_application()
+
+# Templates pré-compilados só no processo do servidor (core.aquecimento)
+from core.aquecimento import aquecer_no_boot  # noqa: E402
+
+aquecer_no_boot()
@@ -4,7 +4,25 @@ from django.forms import TextInput, Textarea
 from django.utils.html import format_html
 from django.urls import reverse
 from django.utils.safestring import mark_safe
-from .models import *
+from .models import (
+    STATUS_PRAZO,
+    CategoriaEstrategica,
+    TipoProjeto,
+    UnidadeOrganizacional,
+    Portfolio,
+    Programa,
+    Projeto,
+    EquipeProjeto,
+    RecursoProjeto,
+    FaseProjeto,
+    Entrega,
+    DependenciaCronograma,
+    Marco,
+    RiscoProjeto,
+    StakeholderProjeto,
+    SolicitacaoMudanca,
+    AnexoProjeto,
+)
 
 # =============================================================================
 # CONFIGURAÇÕES BASE
@@ -16,6 +34,19 @@ formfield_overrides = {
     models.TextField: {'widget': Textarea(attrs={'rows': 4, 'cols': 80})},
 }
 
+class StatusPrazoFilter(admin.SimpleListFilter):
+    """Filtro por situação do prazo para modelos com StatusPrazoQuerySet"""
+    title = 'status do prazo'
+    parameter_name = 'prazo'
+
+    def lookups(self, request, model_admin):
+        return STATUS_PRAZO
+
+    def queryset(self, request, queryset):
+        if self.value() in dict(STATUS_PRAZO):
+            return queryset.por_status_prazo(self.value())
+        return queryset
+
 # =============================================================================
 # INLINES
 # =============================================================================
@@ -41,7 +72,7 @@ class FaseProjetoInline(admin.TabularInline):
 class EntregaInline(admin.TabularInline):
     model = Entrega
     extra = 1
-    fields = ['nome', 'tipo', 'responsavel', 'data_prevista', 'status']
+    fields = ['nome', 'tipo', 'responsavel', 'data_prevista', 'duracao_dias', 'status']
 
 class RiscoProjetoInline(admin.TabularInline):
     model = RiscoProjeto
@@ -203,7 +234,7 @@ class ProgramaAdmin(admin.ModelAdmin):
 class ProjetoAdmin(admin.ModelAdmin):
     list_display = ['codigo', 'nome', 'gerente_projeto', 'status', 'prioridade', 
                    'percentual_conclusao', 'orcamento_display', 'prazo_display']
-    list_filter = ['status', 'prioridade', 'tipo_projeto', 'metodologia', 'portfolio', 'programa']
+    list_filter = ['status', StatusPrazoFilter, 'prioridade', 'tipo_projeto', 'metodologia', 'portfolio', 'programa']
     search_fields = ['codigo', 'nome', 'descricao']
     date_hierarchy = 'data_inicio_prevista'
     readonly_fields = ['uuid', 'criado_em', 'atualizado_em']
@@ -259,6 +290,9 @@ class ProjetoAdmin(admin.ModelAdmin):
         )
     orcamento_display.short_description = 'Orçamento'
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).com_status_prazo()
+    
     def prazo_display(self, obj):
         status_prazo = obj.get_status_prazo()
         cor_map = {'no_prazo': '#28a745', 'atencao': '#ffc107', 'atrasado': '#dc3545'}
@@ -270,6 +304,7 @@ class ProjetoAdmin(admin.ModelAdmin):
             status_map.get(status_prazo, 'N/A')
         )
     prazo_display.short_description = 'Status Prazo'
+    prazo_display.admin_order_field = 'status_prazo'
 
 # =============================================================================
 # GESTÃO DE EQUIPE E RECURSOS
@@ -315,10 +350,13 @@ class FaseProjetoAdmin(admin.ModelAdmin):
 class EntregaAdmin(admin.ModelAdmin):
     list_display = ['projeto', 'nome', 'tipo', 'responsavel', 'data_prevista', 
                    'status', 'prazo_display']
-    list_filter = ['tipo', 'status', 'projeto']
+    list_filter = ['tipo', 'status', StatusPrazoFilter, 'projeto']
     search_fields = ['nome', 'projeto__nome']
     readonly_fields = ['uuid', 'criado_em']
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).com_status_prazo()
+    
     def prazo_display(self, obj):
         status_prazo = obj.get_status_prazo()
         cor_map = {'no_prazo': '#28a745', 'atencao': '#ffc107', 'atrasado': '#dc3545'}
@@ -330,6 +368,34 @@ class EntregaAdmin(admin.ModelAdmin):
             status_map.get(status_prazo, 'N/A')
         )
     prazo_display.short_description = 'Status Prazo'
+    prazo_display.admin_order_field = 'status_prazo'
+
+@admin.register(DependenciaCronograma)
+class DependenciaCronogramaAdmin(admin.ModelAdmin):
+    list_display = ['projeto', 'predecessora', 'sucessora', 'defasagem_dias', 'ativo']
+    list_filter = ['ativo', 'projeto']
+    search_fields = ['projeto__nome', 'fase_predecessora__nome', 'entrega_predecessora__nome',
+                     'fase_sucessora__nome', 'entrega_sucessora__nome']
+    autocomplete_fields = ['fase_predecessora', 'entrega_predecessora', 'fase_sucessora', 'entrega_sucessora']
+    list_select_related = ['projeto', 'fase_predecessora__projeto', 'entrega_predecessora__projeto',
+                           'fase_sucessora__projeto', 'entrega_sucessora__projeto']
+    readonly_fields = ['criado_em']
+    
+    fieldsets = [
+        (None, {
+            'fields': ['projeto', 'defasagem_dias', 'ativo']
+        }),
+        ('Predecessora (fase ou entrega)', {
+            'fields': ['fase_predecessora', 'entrega_predecessora']
+        }),
+        ('Sucessora (fase ou entrega)', {
+            'fields': ['fase_sucessora', 'entrega_sucessora']
+        }),
+        ('Informações do Sistema', {
+            'fields': ['criado_em'],
+            'classes': ['collapse']
+        })
+    ]
 
 @admin.register(Marco)
 class MarcoAdmin(admin.ModelAdmin):
@@ -346,12 +412,12 @@ class MarcoAdmin(admin.ModelAdmin):
 class RiscoProjetoAdmin(admin.ModelAdmin):
     list_display = ['projeto', 'titulo', 'categoria', 'probabilidade', 
                    'impacto', 'nivel_display', 'responsavel', 'status']
-    list_filter = ['categoria', 'probabilidade', 'impacto', 'status', 'projeto']
+    list_filter = ['categoria', 'nivel', 'probabilidade', 'impacto', 'status', 'projeto']
     search_fields = ['titulo', 'descricao', 'projeto__nome']
-    readonly_fields = ['uuid', 'criado_em', 'atualizado_em']
+    readonly_fields = ['uuid', 'pontuacao', 'nivel', 'criado_em', 'atualizado_em']
     
     def nivel_display(self, obj):
-        nivel = obj.get_nivel_risco()
+        nivel = obj.nivel
         cor_map = {'baixo': '#28a745', 'medio': '#ffc107', 'alto': '#dc3545'}
         return format_html(
             '<span style="color: {}; font-weight: bold;">{}</span>',
@@ -359,6 +425,7 @@ class RiscoProjetoAdmin(admin.ModelAdmin):
             nivel.title()
         )
     nivel_display.short_description = 'Nível'
+    nivel_display.admin_order_field = 'pontuacao'
 
 # =============================================================================
 # COMUNICAÇÃO E MUDANÇAS
@@ -0,0 +1,87 @@
+"""
+Conflitos de alocação da equipe entre projetos.
+
+Cada linha ativa de EquipeProjeto é um intervalo [data_entrada, data_saida]
+(sem saída: em aberto) com a dedicação do membro ao projeto. Os extremos de
+todos os intervalos viram eventos (+dedicação na entrada, -dedicação no dia
+seguinte à saída), ordenados por membro e data; uma varredura única soma a
+dedicação corrente e registra os trechos em que ela passa de 100%. O custo
+é dominado pela ordenação: O(n log n) sobre todas as linhas da equipe.
+
+O resultado fica em cache e é descartado pelos sinais de EquipeProjeto e
+Projeto (projetos.signals).
+"""
+from datetime import timedelta
+from itertools import groupby
+
+from django.core.cache import cache
+
+from .models import EquipeProjeto
+
+CHAVE_CACHE = 'alocacao:conflitos'
+LIMITE_DEDICACAO = 100
+
+
+def carregar_alocacoes():
+    """(membro_id, projeto_id, dedicação, entrada, saída) das equipes ativas de projetos ativos"""
+    return EquipeProjeto.objects.filter(ativo=True, projeto__ativo=True).values_list(
+        'membro_id', 'projeto_id', 'dedicacao_percentual', 'data_entrada', 'data_saida',
+    ).order_by()
+
+
+def encontrar_conflitos(alocacoes, limite=LIMITE_DEDICACAO):
+    """
+    Trechos em que a dedicação somada de um membro passa do limite, em ordem
+    de membro e data: {membro_id, inicio, fim (None = em aberto), dedicacao,
+    projetos: {projeto_id: dedicação}}. Um trecho novo começa sempre que a
+    composição das alocações muda.
+    """
+    eventos = []
+    for membro_id, projeto_id, dedicacao, entrada, saida in alocacoes:
+        if saida is not None and saida < entrada:
+            continue
+        eventos.append((membro_id, entrada, projeto_id, dedicacao))
+        if saida is not None:
+            eventos.append((membro_id, saida + timedelta(days=1), projeto_id, -dedicacao))
+    eventos.sort(key=lambda evento: (evento[0], evento[1]))
+
+    conflitos = []
+    for membro_id, eventos_membro in groupby(eventos, key=lambda evento: evento[0]):
+        ativos = {}
+        aberto = None
+        for dia, eventos_dia in groupby(eventos_membro, key=lambda evento: evento[1]):
+            # Todas as entradas e saídas do dia são aplicadas antes de comparar
+            for _, _, projeto_id, variacao in eventos_dia:
+                ativos[projeto_id] = ativos.get(projeto_id, 0) + variacao
+                if ativos[projeto_id] == 0:
+                    del ativos[projeto_id]
+
+            if aberto is not None:
+                aberto['fim'] = dia - timedelta(days=1)
+                aberto = None
+
+            total = sum(ativos.values())
+            if total > limite:
+                aberto = {
+                    'membro_id': membro_id,
+                    'inicio': dia,
+                    'fim': None,
+                    'dedicacao': total,
+                    'projetos': dict(ativos),
+                }
+                conflitos.append(aberto)
+
+    return conflitos
+
+
+def conflitos():
+    """Conflitos de todas as equipes, calculados uma vez e servidos do cache"""
+    resultado = cache.get(CHAVE_CACHE)
+    if resultado is None:
+        resultado = encontrar_conflitos(carregar_alocacoes())
+        cache.set(CHAVE_CACHE, resultado)
+    return resultado
+
+
+def invalidar():
+    cache.delete(CHAVE_CACHE)
@@ -0,0 +1,191 @@
+"""
+Arquivos gerados dos relatórios (projetos.relatorios), guardados em disco.
+
+Cada arquivo é identificado pelo tipo do relatório, o uuid do portfólio,
+programa ou projeto, o formato e uma versão dos dados: um hash do maior
+atualizado_em e da contagem das linhas envolvidas (o objeto, os projetos,
+as entregas e os riscos), dos portfólios, programas e gerentes cujos nomes
+aparecem nas linhas e do dia, já que o status de prazo depende da data.
+Quando os dados mudam a versão muda e o arquivo antigo passa a estar
+desatualizado, sem invalidação explícita.
+
+Um arquivo da versão atual é servido direto do disco. Um desatualizado é
+servido enquanto a nova versão é gerada em segundo plano (ThreadPoolExecutor
+do processo). Sem nenhum arquivo, ou se o arquivo some antes de ser aberto
+(apagado por uma geração que acabou de terminar), o relatório vai em
+streaming e é gravado ao mesmo tempo. A gravação usa um arquivo temporário
+e os.replace, então dois processos gerando o mesmo relatório não deixam
+arquivo pela metade.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+import hashlib
+import os
+from pathlib import Path
+import tempfile
+import threading
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.db.models import Count, Max
+from django.http import FileResponse
+
+from . import relatorios
+from .models import Entrega, Portfolio, Programa, Projeto, RiscoProjeto
+
+MODELOS = {'portfolio': Portfolio, 'programa': Programa, 'projeto': Projeto}
+
+_executor = None
+_em_andamento = set()
+_trava = threading.Lock()
+
+
+def diretorio():
+    return Path(settings.RELATORIOS_DIR)
+
+
+def versao(tipo, objeto, hoje=None):
+    """Hash curto que muda sempre que alguma linha do relatório muda"""
+    projetos = relatorios.projetos_do_relatorio(tipo, objeto)
+    partes = [(hoje or date.today()).isoformat(), objeto.atualizado_em.isoformat()]
+    for queryset in (
+        projetos,
+        Entrega.objects.filter(projeto__in=projetos.values('pk')),
+        RiscoProjeto.objects.filter(projeto__in=projetos.values('pk')),
+    ):
+        estado = queryset.aggregate(total=Count('pk'), ultimo=Max('atualizado_em'))
+        partes.append(f"{estado['total']}:{estado['ultimo'].isoformat() if estado['ultimo'] else ''}")
+
+    # Nomes de portfólio, programa e gerente exibidos nas linhas
+    nomes = projetos.aggregate(
+        portfolio=Max('portfolio__atualizado_em'), programa=Max('programa__atualizado_em'),
+    )
+    partes += [valor.isoformat() if valor else '' for valor in nomes.values()]
+    # User não tem atualizado_em: entram os campos do nome de cada gerente
+    gerentes = projetos.order_by().values_list(
+        'gerente_projeto_id', 'gerente_projeto__username',
+        'gerente_projeto__first_name', 'gerente_projeto__last_name',
+    ).distinct()
+    partes += sorted(':'.join(map(str, gerente)) for gerente in gerentes)
+    return hashlib.sha1('|'.join(partes).encode()).hexdigest()[:16]
+
+
+def caminho(tipo, objeto, formato, versao_dados):
+    return diretorio() / tipo / f'{objeto.uuid}-{versao_dados}.{formato}'
+
+
+def versoes_em_disco(tipo, objeto, formato):
+    """Arquivos já gerados do relatório, do mais recente para o mais antigo"""
+    modificados = []
+    for arquivo in (diretorio() / tipo).glob(f'{objeto.uuid}-*.{formato}'):
+        try:
+            modificados.append((arquivo.stat().st_mtime, arquivo))
+        except FileNotFoundError:
+            pass  # Apagado por uma geração concluída depois do glob
+    return [arquivo for _, arquivo in sorted(modificados, reverse=True)]
+
+
+def _gravando(pedacos, destino):
+    """
+    Repassa os pedaços e os grava num temporário ao lado do destino. O
+    arquivo só toma o lugar do destino se a geração chegar ao fim. Depois
+    disso, as versões antigas do mesmo relatório são apagadas.
+    """
+    destino.parent.mkdir(parents=True, exist_ok=True)
+    descritor, temporario = tempfile.mkstemp(dir=destino.parent, prefix='.', suffix='.tmp')
+    concluido = False
+    try:
+        with os.fdopen(descritor, 'wb') as arquivo:
+            for pedaco in pedacos:
+                if isinstance(pedaco, str):
+                    pedaco = pedaco.encode('utf-8')
+                arquivo.write(pedaco)
+                yield pedaco
+        os.replace(temporario, destino)
+        concluido = True
+    finally:
+        if not concluido:
+            os.unlink(temporario)
+
+    # <uuid>-<versão>.<formato>: as outras versões do mesmo relatório
+    prefixo = destino.name.rsplit('-', 1)[0]
+    for antigo in destino.parent.glob(f'{prefixo}-*{destino.suffix}'):
+        if antigo != destino:
+            antigo.unlink(missing_ok=True)
+
+
+def gerar(tipo, objeto, formato):
+    """Gera e grava a versão atual do relatório; retorna o caminho do arquivo"""
+    destino = caminho(tipo, objeto, formato, versao(tipo, objeto))
+    for _ in _gravando(relatorios.GERADORES[formato](tipo, objeto), destino):
+        pass
+    return destino
+
+
+def _regenerar(tipo, pk, formato):
+    try:
+        objeto = MODELOS[tipo].objects.filter(pk=pk).first()
+        if objeto is not None:
+            gerar(tipo, objeto, formato)
+    finally:
+        with _trava:
+            _em_andamento.discard((tipo, pk, formato))
+        close_old_connections()
+
+
+def agendar(tipo, objeto, formato):
+    """
+    Pede a geração em segundo plano. Retorna o Future, ou None se o mesmo
+    relatório já está sendo gerado neste processo.
+    """
+    global _executor
+    chave = (tipo, objeto.pk, formato)
+    with _trava:
+        if chave in _em_andamento:
+            return None
+        _em_andamento.add(chave)
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.RELATORIOS_WORKERS, thread_name_prefix='relatorios',
+            )
+    return _executor.submit(_regenerar, *chave)
+
+
+def _resposta_arquivo(tipo, objeto, formato, arquivo):
+    """FileResponse do arquivo, ou None se ele foi apagado nesse meio tempo"""
+    try:
+        aberto = open(arquivo, 'rb')
+    except FileNotFoundError:
+        return None
+    anexo = formato != 'html'
+    return FileResponse(
+        aberto,
+        content_type=relatorios.FORMATOS[formato],
+        as_attachment=anexo,
+        filename=relatorios.nome_arquivo(tipo, objeto, formato) if anexo else '',
+    )
+
+
+def resposta(tipo, objeto, formato='html'):
+    """
+    Resposta do relatório a partir do arquivo em disco: a versão atual na
+    hora, a anterior enquanto a atual é gerada em segundo plano, ou em
+    streaming (gravando o arquivo) quando ainda não há nenhuma.
+    """
+    versao_dados = versao(tipo, objeto)
+    atual = caminho(tipo, objeto, formato, versao_dados)
+    em_disco = versoes_em_disco(tipo, objeto, formato)
+    response = None
+    if atual in em_disco:
+        response = _resposta_arquivo(tipo, objeto, formato, atual)
+    elif em_disco:
+        agendar(tipo, objeto, formato)
+        response = _resposta_arquivo(tipo, objeto, formato, em_disco[0])
+        if response is not None:
+            versao_dados = em_disco[0].stem.rsplit('-', 1)[1]
+            response['X-Relatorio-Desatualizado'] = '1'
+    if response is None:
+        pedacos = _gravando(relatorios.GERADORES[formato](tipo, objeto), atual)
+        response = relatorios.resposta(tipo, objeto, formato, pedacos)
+    response['X-Relatorio-Versao'] = versao_dados
+    return response
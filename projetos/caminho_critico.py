@@ -0,0 +1,322 @@
+"""
+Cronograma e caminho crítico (CPM) dos projetos.
+
+Os nós do grafo são as fases (f<id>) e entregas (e<id>) ativas do projeto;
+as arestas são as DependenciaCronograma (término-início, com defasagem).
+As datas são guardadas como ordinais (date.toordinal) e, para cada nó:
+
+    ES = max(início previsto, EF das predecessoras + defasagem)
+    EF = ES + duração
+    LF = fim do projeto nas folhas, senão min(LS das sucessoras - defasagem)
+    LS = LF - duração            folga = LS - ES
+
+A ordem topológica (Kahn) e as duas passadas custam O(V + E) e o resultado
+fica em cache por projeto. Quando uma fase ou entrega muda de data ou de
+duração, atualizar_no refaz a ida só para o nó e seus descendentes e a
+volta só para o nó e seus ancestrais; a volta completa só é necessária
+quando o fim do projeto muda.
+
+O cache não tem compare-and-set: uma atualização incremental segura uma
+trava (cache.add) e só mantém o que gravou se ninguém a marcou enquanto
+isso. Quem encontra a trava ocupada, ou invalida o cronograma, marca a
+trava (cache.incr) e apaga a entrada; o próximo acesso recalcula tudo.
+Para valer entre workers o backend de cache precisa ser compartilhado.
+"""
+from collections import deque
+from datetime import date
+
+from django.core.cache import cache
+
+from .models import DependenciaCronograma, Entrega, FaseProjeto, Marco
+
+
+class CicloDependencias(ValueError):
+    """As dependências do projeto formam um ciclo"""
+
+
+# Segundos até a trava expirar sozinha, se o processo morrer no meio
+TEMPO_TRAVA = 30
+
+
+def chave_cache(projeto_id):
+    return f'cronograma:projeto:{projeto_id}'
+
+
+def chave_trava(projeto_id):
+    return f'cronograma:projeto:{projeto_id}:trava'
+
+
+def no_fase(data_inicio_prevista, data_fim_prevista):
+    inicio = data_inicio_prevista.toordinal()
+    return {'inicio': inicio, 'duracao': max(data_fim_prevista.toordinal() - inicio, 0)}
+
+
+def no_entrega(data_prevista, duracao_dias):
+    # A entrega termina na data prevista depois de duracao_dias de trabalho
+    return {'inicio': data_prevista.toordinal() - duracao_dias, 'duracao': duracao_dias}
+
+
+def _chave(fase_id, entrega_id):
+    return f'f{fase_id}' if fase_id else f'e{entrega_id}'
+
+
+def carregar_grafos(projeto_ids):
+    """{projeto_id: grafo} com três consultas, qualquer que seja o número de projetos"""
+    grafos = {
+        projeto_id: {'nos': {}, 'sucessores': {}, 'predecessores': {}}
+        for projeto_id in projeto_ids
+    }
+
+    fases = FaseProjeto.objects.filter(projeto_id__in=grafos, ativo=True).values_list(
+        'id', 'projeto_id', 'data_inicio_prevista', 'data_fim_prevista',
+    ).order_by()
+    for fase_id, projeto_id, inicio, fim in fases:
+        grafos[projeto_id]['nos'][f'f{fase_id}'] = no_fase(inicio, fim)
+
+    entregas = Entrega.objects.filter(projeto_id__in=grafos, ativo=True).values_list(
+        'id', 'projeto_id', 'data_prevista', 'duracao_dias',
+    ).order_by()
+    for entrega_id, projeto_id, data_prevista, duracao in entregas:
+        grafos[projeto_id]['nos'][f'e{entrega_id}'] = no_entrega(data_prevista, duracao)
+
+    dependencias = DependenciaCronograma.objects.filter(projeto_id__in=grafos, ativo=True).values_list(
+        'projeto_id', 'fase_predecessora_id', 'entrega_predecessora_id',
+        'fase_sucessora_id', 'entrega_sucessora_id', 'defasagem_dias',
+    ).order_by()
+    for projeto_id, fase_pred, entrega_pred, fase_suc, entrega_suc, defasagem in dependencias:
+        grafo = grafos[projeto_id]
+        predecessora, sucessora = _chave(fase_pred, entrega_pred), _chave(fase_suc, entrega_suc)
+        # Dependências de fases/entregas inativas são ignoradas
+        if predecessora in grafo['nos'] and sucessora in grafo['nos']:
+            grafo['sucessores'].setdefault(predecessora, []).append((sucessora, defasagem))
+            grafo['predecessores'].setdefault(sucessora, []).append((predecessora, defasagem))
+
+    return grafos
+
+
+def ordenar(grafo):
+    """Ordem topológica (algoritmo de Kahn); levanta CicloDependencias se houver ciclo"""
+    entradas = {chave: len(grafo['predecessores'].get(chave, ())) for chave in grafo['nos']}
+    fila = deque(sorted(chave for chave, total in entradas.items() if total == 0))
+    ordem = []
+    while fila:
+        chave = fila.popleft()
+        ordem.append(chave)
+        for sucessora, _ in grafo['sucessores'].get(chave, ()):
+            entradas[sucessora] -= 1
+            if entradas[sucessora] == 0:
+                fila.append(sucessora)
+
+    if len(ordem) != len(grafo['nos']):
+        em_ciclo = sorted(chave for chave, total in entradas.items() if total > 0)
+        raise CicloDependencias(f"Dependências em ciclo: {', '.join(em_ciclo)}")
+    return ordem
+
+
+def _ida(cronograma, chaves):
+    nos = cronograma['nos']
+    for chave in chaves:
+        no = nos[chave]
+        inicio = no['inicio']
+        for predecessora, defasagem in cronograma['predecessores'].get(chave, ()):
+            inicio = max(inicio, nos[predecessora]['ef'] + defasagem)
+        no['es'] = inicio
+        no['ef'] = inicio + no['duracao']
+
+
+def _volta(cronograma, chaves):
+    nos = cronograma['nos']
+    for chave in chaves:
+        no = nos[chave]
+        fim = cronograma['fim']
+        for sucessora, defasagem in cronograma['sucessores'].get(chave, ()):
+            fim = min(fim, nos[sucessora]['ls'] - defasagem)
+        no['lf'] = fim
+        no['ls'] = fim - no['duracao']
+
+
+def _fim(cronograma):
+    return max((no['ef'] for no in cronograma['nos'].values()), default=None)
+
+
+def _alcancaveis(adjacencia, origem):
+    """A origem e todos os nós alcançáveis a partir dela"""
+    vistos = {origem}
+    fila = deque([origem])
+    while fila:
+        for vizinho, _ in adjacencia.get(fila.popleft(), ()):
+            if vizinho not in vistos:
+                vistos.add(vizinho)
+                fila.append(vizinho)
+    return vistos
+
+
+def calcular(grafo):
+    """Completa o grafo com a ordem topológica e ES/EF/LS/LF de cada nó"""
+    cronograma = dict(grafo)
+    cronograma['ordem'] = ordenar(grafo)
+    cronograma['posicao'] = {chave: posicao for posicao, chave in enumerate(cronograma['ordem'])}
+    _ida(cronograma, cronograma['ordem'])
+    cronograma['fim'] = _fim(cronograma)
+    _volta(cronograma, reversed(cronograma['ordem']))
+    return cronograma
+
+
+def cronogramas(projeto_ids):
+    """{projeto_id: cronograma}, calculando e guardando em cache os que faltarem"""
+    chaves = {chave_cache(projeto_id): projeto_id for projeto_id in projeto_ids}
+    resultado = {chaves[chave]: valor for chave, valor in cache.get_many(chaves).items()}
+
+    faltantes = [projeto_id for projeto_id in projeto_ids if projeto_id not in resultado]
+    if faltantes:
+        calculados = {
+            projeto_id: calcular(grafo) for projeto_id, grafo in carregar_grafos(faltantes).items()
+        }
+        cache.set_many({chave_cache(projeto_id): valor for projeto_id, valor in calculados.items()})
+        resultado.update(calculados)
+    return resultado
+
+
+def cronograma_projeto(projeto_id):
+    return cronogramas([projeto_id])[projeto_id]
+
+
+def invalidar(projeto_id):
+    # Marca a trava antes de apagar: uma atualização em andamento vê a
+    # marca depois de gravar e apaga o que gravou
+    try:
+        cache.incr(chave_trava(projeto_id))
+    except ValueError:
+        pass  # Nenhuma atualização em andamento
+    cache.delete(chave_cache(projeto_id))
+
+
+def atualizar_no(projeto_id, chave, inicio, duracao):
+    """
+    Aplica a nova data/duração de uma fase ou entrega ao cronograma em cache,
+    recalculando apenas o subgrafo afetado. Sem cronograma em cache não há
+    o que atualizar: o próximo acesso calcula tudo.
+    """
+    if not cache.add(chave_trava(projeto_id), 0, TEMPO_TRAVA):
+        # Outra atualização do mesmo projeto em andamento
+        invalidar(projeto_id)
+        return None
+    try:
+        return _atualizar_no(projeto_id, chave, inicio, duracao)
+    finally:
+        cache.delete(chave_trava(projeto_id))
+
+
+def _atualizar_no(projeto_id, chave, inicio, duracao):
+    cronograma = cache.get(chave_cache(projeto_id))
+    if cronograma is None:
+        return None
+
+    no = cronograma['nos'].get(chave)
+    if no is None:
+        # Nó novo ou reativado: a estrutura do grafo mudou
+        invalidar(projeto_id)
+        return None
+    if (no['inicio'], no['duracao']) == (inicio, duracao):
+        return cronograma
+
+    no['inicio'], no['duracao'] = inicio, duracao
+    posicao = cronograma['posicao']
+
+    _ida(cronograma, sorted(_alcancaveis(cronograma['sucessores'], chave), key=posicao.__getitem__))
+
+    fim_anterior, cronograma['fim'] = cronograma['fim'], _fim(cronograma)
+    if cronograma['fim'] != fim_anterior:
+        _volta(cronograma, reversed(cronograma['ordem']))
+    else:
+        # Com o mesmo fim, LF/LS dos descendentes não mudam
+        ancestrais = _alcancaveis(cronograma['predecessores'], chave)
+        _volta(cronograma, sorted(ancestrais, key=posicao.__getitem__, reverse=True))
+
+    cache.set(chave_cache(projeto_id), cronograma)
+    if cache.get(chave_trava(projeto_id)) != 0:
+        # Invalidado durante o cálculo: o que foi gravado pode estar desatualizado
+        cache.delete(chave_cache(projeto_id))
+        return None
+    return cronograma
+
+
+def cria_ciclo(projeto_id, predecessora, sucessora, ignorar=None):
+    """Se a dependência predecessora -> sucessora fecharia um ciclo no projeto"""
+    dependencias = DependenciaCronograma.objects.filter(projeto_id=projeto_id, ativo=True)
+    if ignorar is not None:
+        dependencias = dependencias.exclude(pk=ignorar)
+
+    sucessores = {}
+    for fase_pred, entrega_pred, fase_suc, entrega_suc in dependencias.values_list(
+        'fase_predecessora_id', 'entrega_predecessora_id', 'fase_sucessora_id', 'entrega_sucessora_id',
+    ).order_by():
+        sucessores.setdefault(_chave(fase_pred, entrega_pred), []).append((_chave(fase_suc, entrega_suc), 0))
+
+    return predecessora in _alcancaveis(sucessores, sucessora)
+
+
+def _data(ordinal):
+    return date.fromordinal(ordinal).isoformat() if ordinal is not None else None
+
+
+def gantt(projetos):
+    """Tarefas (fases e entregas), dependências e marcos de cada projeto, prontos para um Gantt"""
+    projetos = list(projetos)
+    calculados = cronogramas([projeto.id for projeto in projetos])
+
+    nomes = {}
+    for fase_id, nome, status, percentual in FaseProjeto.objects.filter(
+        projeto__in=projetos, ativo=True,
+    ).values_list('id', 'nome', 'status', 'percentual_conclusao').order_by():
+        nomes[f'f{fase_id}'] = {'tipo': 'fase', 'nome': nome, 'status': status, 'percentual': percentual}
+    for entrega_id, fase_id, nome, status in Entrega.objects.filter(
+        projeto__in=projetos, ativo=True,
+    ).values_list('id', 'fase_id', 'nome', 'status').order_by():
+        nomes[f'e{entrega_id}'] = {
+            'tipo': 'entrega', 'nome': nome, 'status': status,
+            'fase': f'f{fase_id}' if fase_id else None,
+        }
+
+    marcos = {}
+    for projeto_id, marco_id, nome, tipo, data_prevista, status in Marco.objects.filter(
+        projeto__in=projetos, ativo=True,
+    ).values_list('projeto_id', 'id', 'nome', 'tipo', 'data_prevista', 'status').order_by('data_prevista'):
+        marcos.setdefault(projeto_id, []).append({
+            'id': f'm{marco_id}', 'nome': nome, 'tipo': tipo,
+            'data': data_prevista.isoformat(), 'status': status,
+        })
+
+    resultado = []
+    for projeto in projetos:
+        cronograma = calculados[projeto.id]
+        tarefas = []
+        for chave in cronograma['ordem']:
+            no = cronograma['nos'][chave]
+            folga = no['ls'] - no['es']
+            tarefas.append({
+                'id': chave,
+                **nomes.get(chave, {}),
+                'inicio': _data(no['es']),
+                'fim': _data(no['ef']),
+                'inicio_tarde': _data(no['ls']),
+                'fim_tarde': _data(no['lf']),
+                'folga': folga,
+                'critica': folga <= 0,
+                'dependencias': [
+                    {'id': predecessora, 'defasagem': defasagem}
+                    for predecessora, defasagem in cronograma['predecessores'].get(chave, ())
+                ],
+            })
+
+        resultado.append({
+            'uuid': str(projeto.uuid),
+            'codigo': projeto.codigo,
+            'nome': projeto.nome,
+            'inicio': _data(min((no['es'] for no in cronograma['nos'].values()), default=None)),
+            'fim': _data(cronograma['fim']),
+            'caminho_critico': [tarefa['id'] for tarefa in tarefas if tarefa['critica']],
+            'tarefas': tarefas,
+            'marcos': marcos.get(projeto.id, []),
+        })
+    return resultado
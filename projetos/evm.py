@@ -0,0 +1,228 @@
+"""
+Gerenciamento de valor agregado (EVM) dos projetos.
+
+Os campos necessários são carregados de uma vez (values_list) em colunas e
+os indicadores são calculados sobre as colunas inteiras: com NumPy as
+operações são vetorizadas; sem NumPy as colunas usam o módulo array e o
+cálculo é feito em um laço simples, com o mesmo resultado.
+
+Para cada projeto, na data de referência:
+
+    BAC = orcamento_total
+    PV  = BAC x fração do prazo previsto já decorrida (linha de base linear)
+    EV  = BAC x percentual_conclusao / 100
+    AC  = orcamento_consumido
+    CPI = EV / AC            SPI = EV / PV
+    EAC = BAC / CPI          VAC = BAC - EAC
+
+Programas e portfólios somam BAC, PV, EV, AC e EAC dos seus projetos e
+recalculam os índices sobre as somas.
+"""
+from array import array
+from datetime import date
+import math
+
+from django.db.models.functions import Coalesce
+
+from .models import Projeto
+
+# NumPy é importado no primeiro cálculo, e não junto com o módulo: o import
+# custa mais que a carga inteira das URLs, que passa por aqui via views.
+_NAO_CARREGADO = object()
+np = _NAO_CARREGADO
+
+# Chave usada nas colunas de agrupamento quando o projeto não tem programa/portfólio
+SEM_GRUPO = -1
+
+
+def _numpy():
+    """Módulo numpy, importado no primeiro uso; None quando não está instalado"""
+    global np
+    if np is _NAO_CARREGADO:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        np = numpy
+    return np
+
+
+def carregar_colunas(queryset=None, extras=()):
+    """
+    Carrega os campos usados no cálculo como colunas (arrays NumPy ou do
+    módulo array). Projetos sem programa/portfólio recebem SEM_GRUPO.
+    Os campos em `extras` vêm como listas comuns, na mesma ordem.
+    """
+    if queryset is None:
+        queryset = Projeto.objects.filter(ativo=True)
+
+    linhas = queryset.annotate(
+        portfolio_efetivo=Coalesce('portfolio_id', 'programa__portfolio_id'),
+    ).values_list(
+        'id', 'programa_id', 'portfolio_efetivo',
+        'orcamento_total', 'orcamento_consumido', 'percentual_conclusao',
+        'data_inicio_prevista', 'data_fim_prevista',
+        *extras,
+    ).order_by()
+
+    ids, programas, portfolios, bac, ac, percentual, inicio, fim, *valores_extras = (
+        list(coluna) for coluna in (zip(*linhas) if linhas else ([],) * (8 + len(extras)))
+    )
+
+    inteiros = {
+        'id': ids,
+        'programa': [SEM_GRUPO if valor is None else valor for valor in programas],
+        'portfolio': [SEM_GRUPO if valor is None else valor for valor in portfolios],
+        'inicio': [valor.toordinal() for valor in inicio],
+        'fim': [valor.toordinal() for valor in fim],
+    }
+    reais = {
+        'bac': [float(valor) for valor in bac],
+        'ac': [float(valor) for valor in ac],
+        'percentual': [float(valor) for valor in percentual],
+    }
+
+    np = _numpy()
+    if np is not None:
+        colunas = {nome: np.array(valores, dtype=np.int64) for nome, valores in inteiros.items()}
+        colunas.update({nome: np.array(valores, dtype=np.float64) for nome, valores in reais.items()})
+    else:
+        colunas = {nome: array('q', valores) for nome, valores in inteiros.items()}
+        colunas.update({nome: array('d', valores) for nome, valores in reais.items()})
+    colunas.update(zip(extras, valores_extras))
+    return colunas
+
+
+def indicadores(bac, pv, ev, ac):
+    """CPI, SPI, EAC e VAC a partir dos valores (usado também nos agregados)"""
+    cpi = ev / ac if ac > 0 else math.nan
+    spi = ev / pv if pv > 0 else math.nan
+    if ac <= 0:
+        # Sem custo lançado ainda, a estimativa é o próprio orçamento
+        eac = bac
+    elif cpi > 0:
+        eac = bac / cpi
+    else:
+        # Custo lançado sem nenhum avanço: todo o orçamento ainda está por fazer
+        eac = ac + bac
+    return cpi, spi, eac, bac - eac
+
+
+def calcular(colunas, data=None):
+    """Calcula PV, EV, AC, BAC, CPI, SPI, EAC e VAC para todas as linhas das colunas"""
+    hoje = (data or date.today()).toordinal()
+    np = _numpy()
+    if np is not None:
+        return _calcular_numpy(np, colunas, hoje)
+    return _calcular_array(colunas, hoje)
+
+
+def _calcular_numpy(np, colunas, hoje):
+    bac, ac = colunas['bac'], colunas['ac']
+    duracao = np.maximum(colunas['fim'] - colunas['inicio'], 1)
+    decorrido = np.clip((hoje - colunas['inicio']) / duracao, 0.0, 1.0)
+
+    pv = bac * decorrido
+    ev = bac * colunas['percentual'] / 100.0
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cpi = np.where(ac > 0, ev / ac, np.nan)
+        spi = np.where(pv > 0, ev / pv, np.nan)
+        eac = np.where(ac <= 0, bac, np.where(cpi > 0, bac / cpi, ac + bac))
+
+    return {'bac': bac, 'pv': pv, 'ev': ev, 'ac': ac, 'cpi': cpi, 'spi': spi, 'eac': eac, 'vac': bac - eac}
+
+
+def _calcular_array(colunas, hoje):
+    resultado = {nome: array('d') for nome in ('pv', 'ev', 'cpi', 'spi', 'eac', 'vac')}
+    for bac, ac, percentual, inicio, fim in zip(
+        colunas['bac'], colunas['ac'], colunas['percentual'], colunas['inicio'], colunas['fim']
+    ):
+        decorrido = min(max((hoje - inicio) / max(fim - inicio, 1), 0.0), 1.0)
+        pv = bac * decorrido
+        ev = bac * percentual / 100.0
+        cpi, spi, eac, vac = indicadores(bac, pv, ev, ac)
+        for nome, valor in (('pv', pv), ('ev', ev), ('cpi', cpi), ('spi', spi), ('eac', eac), ('vac', vac)):
+            resultado[nome].append(valor)
+
+    resultado['bac'] = colunas['bac']
+    resultado['ac'] = colunas['ac']
+    return resultado
+
+
+def consolidar(chaves, metricas):
+    """
+    Soma BAC, PV, EV, AC e EAC por chave (programa ou portfólio) e recalcula
+    os índices sobre as somas. Linhas com chave SEM_GRUPO são ignoradas.
+    """
+    somados = ('bac', 'pv', 'ev', 'ac', 'eac')
+    totais = {}
+
+    np = _numpy()
+    if np is not None and len(chaves):
+        validas = chaves != SEM_GRUPO
+        grupos, posicoes = np.unique(chaves[validas], return_inverse=True)
+        somas = {nome: np.bincount(posicoes, weights=metricas[nome][validas]) for nome in somados}
+        quantidades = np.bincount(posicoes)
+        for indice, chave in enumerate(grupos.tolist()):
+            totais[chave] = {nome: float(somas[nome][indice]) for nome in somados}
+            totais[chave]['projetos'] = int(quantidades[indice])
+    else:
+        for posicao, chave in enumerate(chaves):
+            if chave == SEM_GRUPO:
+                continue
+            total = totais.setdefault(chave, dict.fromkeys(somados, 0.0))
+            total.setdefault('projetos', 0)
+            total['projetos'] += 1
+            for nome in somados:
+                total[nome] += metricas[nome][posicao]
+
+    for total in totais.values():
+        cpi, spi, _, _ = indicadores(total['bac'], total['pv'], total['ev'], total['ac'])
+        total.update({
+            'cpi': arredondar_indice(cpi),
+            'spi': arredondar_indice(spi),
+            'vac': total['bac'] - total['eac'],
+        })
+    return totais
+
+
+def arredondar_indice(valor):
+    """Índice arredondado, ou None quando indefinido (NaN)"""
+    return None if math.isnan(valor) else round(valor, 4)
+
+
+def indicadores_projetos(data=None, queryset=None):
+    """{projeto_id: indicadores} para os projetos do queryset (ativos por padrão)"""
+    colunas = carregar_colunas(queryset)
+    metricas = calcular(colunas, data)
+    resultado = {}
+    for posicao, projeto_id in enumerate(colunas['id']):
+        resultado[int(projeto_id)] = {
+            nome: float(metricas[nome][posicao]) for nome in ('bac', 'pv', 'ev', 'ac', 'eac', 'vac')
+        }
+        resultado[int(projeto_id)]['cpi'] = arredondar_indice(float(metricas['cpi'][posicao]))
+        resultado[int(projeto_id)]['spi'] = arredondar_indice(float(metricas['spi'][posicao]))
+    return resultado
+
+
+def indicadores_consolidados(data=None, queryset=None):
+    """
+    ({portfolio_id: indicadores}, {programa_id: indicadores}) com uma única
+    carga das colunas e um único cálculo para os dois agrupamentos
+    """
+    colunas = carregar_colunas(queryset)
+    metricas = calcular(colunas, data)
+    return consolidar(colunas['portfolio'], metricas), consolidar(colunas['programa'], metricas)
+
+
+def indicadores_programas(data=None, queryset=None):
+    """{programa_id: indicadores consolidados}"""
+    colunas = carregar_colunas(queryset)
+    return consolidar(colunas['programa'], calcular(colunas, data))
+
+
+def indicadores_portfolios(data=None, queryset=None):
+    """{portfolio_id: indicadores consolidados}, incluindo projetos ligados via programa"""
+    colunas = carregar_colunas(queryset)
+    return consolidar(colunas['portfolio'], calcular(colunas, data))
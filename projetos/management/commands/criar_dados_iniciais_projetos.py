@@ -1,6 +1,15 @@
 from django.core.management.base import BaseCommand
 from django.contrib.auth.models import User
-from projetos.models import *
+from projetos.models import (
+    CategoriaEstrategica,
+    TipoProjeto,
+    UnidadeOrganizacional,
+    Portfolio,
+    Programa,
+    Projeto,
+    EquipeProjeto,
+    FaseProjeto,
+)
 from datetime import date, timedelta
 from decimal import Decimal
 
@@ -1,7 +1,21 @@
 from django.core.management.base import BaseCommand
 from django.contrib.auth.models import User
 from datetime import date, timedelta
-from projetos.models import *
+from projetos.models import (
+    StatusChoices,
+    PrioridadeChoices,
+    TipoRiscoChoices,
+    ProbabilidadeChoices,
+    ImpactoChoices,
+    CategoriaEstrategica,
+    TipoProjeto,
+    UnidadeOrganizacional,
+    Portfolio,
+    Programa,
+    Projeto,
+    Entrega,
+    RiscoProjeto,
+)
 
 class Command(BaseCommand):
     help = 'Cria dados iniciais para o sistema de gestão de projetos'
@@ -0,0 +1,51 @@
+from datetime import date, datetime
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from projetos import evm, snapshots
+from projetos.models import Portfolio
+
+
+class Command(BaseCommand):
+    help = (
+        'Grava o snapshot diário dos projetos ativos (status, conclusão, indicadores EVM '
+        'e riscos); pode ser reexecutado no mesmo dia'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--data',
+            help='Data de referência no formato AAAA-MM-DD (padrão: hoje)',
+        )
+        parser.add_argument(
+            '--resumo',
+            action='store_true',
+            help='Exibe os indicadores consolidados por portfólio',
+        )
+
+    def handle(self, *args, **options):
+        data = date.today()
+        if options['data']:
+            try:
+                data = datetime.strptime(options['data'], '%Y-%m-%d').date()
+            except ValueError:
+                raise CommandError('Data inválida, use o formato AAAA-MM-DD')
+
+        inicio = time.perf_counter()
+        gravados = snapshots.registrar_snapshots(data)
+        duracao = time.perf_counter() - inicio
+        self.stdout.write(self.style.SUCCESS(
+            f'{gravados} snapshots gravados para {data:%d/%m/%Y} em {duracao:.2f}s'
+        ))
+
+        if options['resumo']:
+            indicadores = evm.indicadores_portfolios(data)
+            nomes = dict(Portfolio.objects.filter(id__in=indicadores).values_list('id', 'nome'))
+            for portfolio_id, valores in indicadores.items():
+                cpi = f"{valores['cpi']:.2f}" if valores['cpi'] is not None else '-'
+                spi = f"{valores['spi']:.2f}" if valores['spi'] is not None else '-'
+                self.stdout.write(
+                    f"  {nomes.get(portfolio_id, portfolio_id)}: {valores['projetos']} projetos, "
+                    f"CPI {cpi}, SPI {spi}, VAC {valores['vac']:,.2f}"
+                )
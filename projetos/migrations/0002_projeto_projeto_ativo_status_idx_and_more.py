@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-19 05:27
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projetos', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='projeto',
+            index=models.Index(condition=models.Q(('ativo', True)), fields=['status'], name='projeto_ativo_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='projeto',
+            index=models.Index(condition=models.Q(('ativo', True)), fields=['data_fim_prevista', 'status'], name='projeto_ativo_prazo_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='projeto',
+            index=models.Index(condition=models.Q(('ativo', True)), fields=['-prioridade', 'nome'], name='projeto_ativo_ordem_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='riscoprojeto',
+            index=models.Index(condition=models.Q(('ativo', True)), fields=['projeto', 'status'], name='risco_ativo_projeto_idx'),
+        ),
+    ]
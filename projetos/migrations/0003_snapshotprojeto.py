@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-19 05:33
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projetos', '0002_projeto_projeto_ativo_status_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SnapshotProjeto',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('data', models.DateField(verbose_name='Data')),
+                ('pv', models.DecimalField(decimal_places=2, max_digits=15, verbose_name='Valor Planejado (PV)')),
+                ('ev', models.DecimalField(decimal_places=2, max_digits=15, verbose_name='Valor Agregado (EV)')),
+                ('ac', models.DecimalField(decimal_places=2, max_digits=15, verbose_name='Custo Real (AC)')),
+                ('eac', models.DecimalField(decimal_places=2, max_digits=15, verbose_name='Estimativa no Término (EAC)')),
+                ('vac', models.DecimalField(decimal_places=2, max_digits=15, verbose_name='Variação no Término (VAC)')),
+                ('cpi', models.FloatField(blank=True, null=True, verbose_name='Índice de Desempenho de Custo (CPI)')),
+                ('spi', models.FloatField(blank=True, null=True, verbose_name='Índice de Desempenho de Prazo (SPI)')),
+                ('criado_em', models.DateTimeField(auto_now_add=True)),
+                ('projeto', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='snapshots', to='projetos.projeto', verbose_name='Projeto')),
+            ],
+            options={
+                'verbose_name': 'Snapshot do Projeto',
+                'verbose_name_plural': 'Snapshots dos Projetos',
+                'ordering': ['-data'],
+                'indexes': [models.Index(fields=['data'], name='snapshot_data_idx')],
+                'unique_together': {('projeto', 'data')},
+            },
+        ),
+    ]
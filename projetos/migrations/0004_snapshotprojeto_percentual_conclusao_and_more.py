@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-19 05:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projetos', '0003_snapshotprojeto'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='snapshotprojeto',
+            name='percentual_conclusao',
+            field=models.PositiveSmallIntegerField(default=0, verbose_name='Percentual de Conclusão (%)'),
+        ),
+        migrations.AddField(
+            model_name='snapshotprojeto',
+            name='riscos_abertos',
+            field=models.PositiveIntegerField(default=0, verbose_name='Riscos Abertos'),
+        ),
+        migrations.AddField(
+            model_name='snapshotprojeto',
+            name='riscos_altos',
+            field=models.PositiveIntegerField(default=0, verbose_name='Riscos Altos Abertos'),
+        ),
+        migrations.AddField(
+            model_name='snapshotprojeto',
+            name='status',
+            field=models.CharField(choices=[('nao_iniciado', 'Não Iniciado'), ('em_planejamento', 'Em Planejamento'), ('em_execucao', 'Em Execução'), ('em_monitoramento', 'Em Monitoramento'), ('suspenso', 'Suspenso'), ('cancelado', 'Cancelado'), ('concluido', 'Concluído')], default='nao_iniciado', max_length=20, verbose_name='Status'),
+        ),
+    ]
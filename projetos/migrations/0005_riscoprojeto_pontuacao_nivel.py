@@ -0,0 +1,48 @@
+# Generated by Django 5.2.18 on 2026-10-19 05:41
+
+from django.db import migrations, models
+
+# Cópia dos pesos de projetos.models.riscos na data desta migração
+PROBABILIDADE = {
+    'muito_baixa': 1, 'baixa': 2, 'media': 3, 'alta': 4, 'muito_alta': 5, 'quase_certa': 6
+}
+IMPACTO = {
+    'muito_baixo': 1, 'baixo': 2, 'medio': 3, 'alto': 4, 'muito_alto': 5
+}
+
+
+def preencher_pontuacao(apps, schema_editor):
+    """Um UPDATE por combinação de probabilidade e impacto (30 no total)"""
+    RiscoProjeto = apps.get_model('projetos', 'RiscoProjeto')
+    for probabilidade, peso_probabilidade in PROBABILIDADE.items():
+        for impacto, peso_impacto in IMPACTO.items():
+            pontuacao = peso_probabilidade * peso_impacto
+            nivel = 'baixo' if pontuacao <= 6 else 'medio' if pontuacao <= 15 else 'alto'
+            RiscoProjeto.objects.filter(probabilidade=probabilidade, impacto=impacto).update(
+                pontuacao=pontuacao, nivel=nivel,
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projetos', '0004_snapshotprojeto_percentual_conclusao_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='riscoprojeto',
+            name='nivel',
+            field=models.CharField(choices=[('baixo', 'Baixo'), ('medio', 'Médio'), ('alto', 'Alto')], default='baixo', editable=False, max_length=10, verbose_name='Nível'),
+        ),
+        migrations.AddField(
+            model_name='riscoprojeto',
+            name='pontuacao',
+            field=models.PositiveSmallIntegerField(default=1, editable=False, verbose_name='Pontuação'),
+        ),
+        migrations.RunPython(preencher_pontuacao, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='riscoprojeto',
+            index=models.Index(condition=models.Q(('ativo', True)), fields=['nivel', 'status'], name='risco_ativo_nivel_idx'),
+        ),
+    ]
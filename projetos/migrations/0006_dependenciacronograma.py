@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-19 05:45
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projetos', '0005_riscoprojeto_pontuacao_nivel'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='entrega',
+            name='duracao_dias',
+            field=models.PositiveIntegerField(default=1, help_text='Dias de trabalho até a data prevista, usados no cálculo do caminho crítico', verbose_name='Duração (dias)'),
+        ),
+        migrations.CreateModel(
+            name='DependenciaCronograma',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('defasagem_dias', models.IntegerField(default=0, help_text='Espera após o término da predecessora; negativo permite sobreposição', verbose_name='Defasagem (dias)')),
+                ('ativo', models.BooleanField(default=True, verbose_name='Ativo')),
+                ('criado_em', models.DateTimeField(auto_now_add=True)),
+                ('entrega_predecessora', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='dependencias_sucessoras', to='projetos.entrega', verbose_name='Entrega Predecessora')),
+                ('entrega_sucessora', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='dependencias_predecessoras', to='projetos.entrega', verbose_name='Entrega Sucessora')),
+                ('fase_predecessora', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='dependencias_sucessoras', to='projetos.faseprojeto', verbose_name='Fase Predecessora')),
+                ('fase_sucessora', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='dependencias_predecessoras', to='projetos.faseprojeto', verbose_name='Fase Sucessora')),
+                ('projeto', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='dependencias', to='projetos.projeto', verbose_name='Projeto')),
+            ],
+            options={
+                'verbose_name': 'Dependência do Cronograma',
+                'verbose_name_plural': 'Dependências do Cronograma',
+                'constraints': [models.CheckConstraint(condition=models.Q(('fase_predecessora__isnull', True), ('entrega_predecessora__isnull', True), _connector='XOR'), name='dependencia_uma_predecessora'), models.CheckConstraint(condition=models.Q(('fase_sucessora__isnull', True), ('entrega_sucessora__isnull', True), _connector='XOR'), name='dependencia_uma_sucessora')],
+            },
+        ),
+    ]
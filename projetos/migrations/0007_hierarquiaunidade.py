@@ -0,0 +1,49 @@
+# Generated by Django 5.2.18 on 2026-10-19 05:48
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def preencher_hierarquia(apps, schema_editor):
+    """Monta a tabela de fechamento a partir de unidade_pai"""
+    UnidadeOrganizacional = apps.get_model('projetos', 'UnidadeOrganizacional')
+    HierarquiaUnidade = apps.get_model('projetos', 'HierarquiaUnidade')
+
+    pais = dict(UnidadeOrganizacional.objects.values_list('id', 'unidade_pai_id'))
+    ligacoes = []
+    for unidade_id in pais:
+        ancestral_id, profundidade = unidade_id, 0
+        # O limite protege contra ciclos gravados antes da validação existir
+        while ancestral_id is not None and profundidade <= len(pais):
+            ligacoes.append(HierarquiaUnidade(
+                ancestral_id=ancestral_id, descendente_id=unidade_id, profundidade=profundidade,
+            ))
+            ancestral_id, profundidade = pais.get(ancestral_id), profundidade + 1
+
+    HierarquiaUnidade.objects.bulk_create(ligacoes, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projetos', '0006_dependenciacronograma'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HierarquiaUnidade',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('profundidade', models.PositiveSmallIntegerField()),
+                ('ancestral', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='descendentes', to='projetos.unidadeorganizacional')),
+                ('descendente', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='ancestrais', to='projetos.unidadeorganizacional')),
+            ],
+            options={
+                'verbose_name': 'Hierarquia de Unidades',
+                'verbose_name_plural': 'Hierarquia de Unidades',
+                'indexes': [models.Index(fields=['descendente', 'profundidade'], name='hierarquia_descendente_idx')],
+                'unique_together': {('ancestral', 'descendente')},
+            },
+        ),
+        migrations.RunPython(preencher_hierarquia, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projetos', '0007_hierarquiaunidade'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='entrega',
+            name='atualizado_em',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
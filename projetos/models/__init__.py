@@ -0,0 +1,62 @@
+from .base import (
+    STATUS_PRAZO,
+    StatusPrazoQuerySet,
+    StatusChoices,
+    PrioridadeChoices,
+    TipoRecursoChoices,
+    TipoRiscoChoices,
+    ProbabilidadeChoices,
+    ImpactoChoices,
+    NivelRiscoChoices,
+    CategoriaEstrategica,
+    TipoProjeto,
+    UnidadeOrganizacional,
+    HierarquiaUnidade,
+)
+from .portfolio import Portfolio, Programa, Projeto, EquipeProjeto, RecursoProjeto
+from .cronograma import FaseProjeto, Entrega, DependenciaCronograma, Marco
+from .riscos import (
+    RiscoProjeto,
+    calcular_nivel_risco,
+    calcular_pontuacao_risco,
+    NIVEIS_PROBABILIDADE,
+    NIVEIS_IMPACTO,
+    STATUS_RISCO_ABERTO,
+)
+from .comunicacao import StakeholderProjeto, SolicitacaoMudanca, AnexoProjeto
+from .historico import SnapshotProjeto
+
+__all__ = [
+    'STATUS_PRAZO',
+    'StatusPrazoQuerySet',
+    'StatusChoices',
+    'PrioridadeChoices',
+    'TipoRecursoChoices',
+    'TipoRiscoChoices',
+    'ProbabilidadeChoices',
+    'ImpactoChoices',
+    'NivelRiscoChoices',
+    'CategoriaEstrategica',
+    'TipoProjeto',
+    'UnidadeOrganizacional',
+    'HierarquiaUnidade',
+    'Portfolio',
+    'Programa',
+    'Projeto',
+    'EquipeProjeto',
+    'RecursoProjeto',
+    'FaseProjeto',
+    'Entrega',
+    'DependenciaCronograma',
+    'Marco',
+    'RiscoProjeto',
+    'calcular_nivel_risco',
+    'calcular_pontuacao_risco',
+    'NIVEIS_PROBABILIDADE',
+    'NIVEIS_IMPACTO',
+    'STATUS_RISCO_ABERTO',
+    'StakeholderProjeto',
+    'SolicitacaoMudanca',
+    'AnexoProjeto',
+    'SnapshotProjeto',
+]
@@ -0,0 +1,315 @@
+from django.db import models, transaction
+from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.core.validators import MinValueValidator, MaxValueValidator
+from datetime import date, timedelta
+import uuid
+
+# =============================================================================
+# MODELOS BASE E CONFIGURAÇÕES
+# =============================================================================
+
+STATUS_PRAZO = [
+    ('atrasado', 'Atrasado'),
+    ('atencao', 'Atenção'),
+    ('no_prazo', 'No Prazo'),
+]
+
+
+class StatusPrazoQuerySet(models.QuerySet):
+    """
+    Situação do prazo (atrasado, atencao, no_prazo) calculada no banco, com
+    as mesmas regras de get_status_prazo e uma única data de referência.
+    As subclasses indicam os campos e a antecedência do alerta.
+    """
+    campo_previsto = None
+    campo_real = None
+    status_concluido = None
+    dias_atencao = 0
+
+    def condicoes_prazo(self, hoje=None):
+        """{status_prazo: Q}; as condições são excludentes e cobrem todas as linhas"""
+        hoje = hoje or date.today()
+        limite = hoje + timedelta(days=self.dias_atencao)
+        concluido = models.Q(status=self.status_concluido)
+        concluido_no_prazo = concluido & models.Q(**{
+            f'{self.campo_real}__lte': models.F(self.campo_previsto),
+        })
+
+        # Só comparações diretas com a data prevista: o filtro usa o índice
+        return {
+            'atrasado': (concluido & ~concluido_no_prazo)
+                        | (~concluido & models.Q(**{f'{self.campo_previsto}__lt': hoje})),
+            'atencao': ~concluido & models.Q(**{
+                f'{self.campo_previsto}__gte': hoje,
+                f'{self.campo_previsto}__lt': limite,
+            }),
+            'no_prazo': concluido_no_prazo
+                        | (~concluido & models.Q(**{f'{self.campo_previsto}__gte': limite})),
+        }
+
+    def com_status_prazo(self, hoje=None):
+        """Anota status_prazo em cada linha"""
+        return self.annotate(status_prazo=models.Case(
+            *[models.When(condicao, then=models.Value(status))
+              for status, condicao in self.condicoes_prazo(hoje).items()],
+            output_field=models.CharField(),
+        ))
+
+    def por_status_prazo(self, status_prazo, hoje=None):
+        """Filtra pela situação do prazo sem depender da anotação"""
+        return self.filter(self.condicoes_prazo(hoje)[status_prazo])
+
+
+class StatusChoices(models.TextChoices):
+    """Status padrão para projetos e programas"""
+    NAO_INICIADO = 'nao_iniciado', 'Não Iniciado'
+    EM_PLANEJAMENTO = 'em_planejamento', 'Em Planejamento'
+    EM_EXECUCAO = 'em_execucao', 'Em Execução'
+    EM_MONITORAMENTO = 'em_monitoramento', 'Em Monitoramento'
+    SUSPENSO = 'suspenso', 'Suspenso'
+    CANCELADO = 'cancelado', 'Cancelado'
+    CONCLUIDO = 'concluido', 'Concluído'
+
+class PrioridadeChoices(models.TextChoices):
+    """Níveis de prioridade"""
+    MUITO_BAIXA = 'muito_baixa', 'Muito Baixa'
+    BAIXA = 'baixa', 'Baixa'
+    MEDIA = 'media', 'Média'
+    ALTA = 'alta', 'Alta'
+    MUITO_ALTA = 'muito_alta', 'Muito Alta'
+    CRITICA = 'critica', 'Crítica'
+
+class TipoRecursoChoices(models.TextChoices):
+    """Tipos de recursos"""
+    HUMANO = 'humano', 'Recurso Humano'
+    FINANCEIRO = 'financeiro', 'Recurso Financeiro'
+    MATERIAL = 'material', 'Recurso Material'
+    TECNOLOGICO = 'tecnologico', 'Recurso Tecnológico'
+    INFRAESTRUTURA = 'infraestrutura', 'Infraestrutura'
+
+class TipoRiscoChoices(models.TextChoices):
+    """Tipos de risco"""
+    TECNICO = 'tecnico', 'Técnico'
+    CRONOGRAMA = 'cronograma', 'Cronograma'
+    ORCAMENTO = 'orcamento', 'Orçamento'
+    RECURSO = 'recurso', 'Recurso'
+    EXTERNO = 'externo', 'Externo'
+    ORGANIZACIONAL = 'organizacional', 'Organizacional'
+    QUALIDADE = 'qualidade', 'Qualidade'
+
+class ProbabilidadeChoices(models.TextChoices):
+    """Probabilidade de ocorrência do risco"""
+    MUITO_BAIXA = 'muito_baixa', 'Muito Baixa (1-10%)'
+    BAIXA = 'baixa', 'Baixa (11-30%)'
+    MEDIA = 'media', 'Média (31-50%)'
+    ALTA = 'alta', 'Alta (51-70%)'
+    MUITO_ALTA = 'muito_alta', 'Muito Alta (71-90%)'
+    QUASE_CERTA = 'quase_certa', 'Quase Certa (91-99%)'
+
+class ImpactoChoices(models.TextChoices):
+    """Impacto do risco"""
+    MUITO_BAIXO = 'muito_baixo', 'Muito Baixo'
+    BAIXO = 'baixo', 'Baixo'
+    MEDIO = 'medio', 'Médio'
+    ALTO = 'alto', 'Alto'
+    MUITO_ALTO = 'muito_alto', 'Muito Alto'
+
+class NivelRiscoChoices(models.TextChoices):
+    """Nível do risco na matriz probabilidade x impacto"""
+    BAIXO = 'baixo', 'Baixo'
+    MEDIO = 'medio', 'Médio'
+    ALTO = 'alto', 'Alto'
+
+# =============================================================================
+# CONFIGURAÇÕES E CATEGORIAS
+# =============================================================================
+
+class CategoriaEstrategica(models.Model):
+    """Categorias estratégicas para alinhamento dos portfólios"""
+    uuid = models.UUIDField(default=uuid.uuid4, editable=False, unique=True)
+    nome = models.CharField(max_length=100, verbose_name="Nome da Categoria")
+    descricao = models.TextField(verbose_name="Descrição", blank=True)
+    cor = models.CharField(max_length=7, default="#007bff", verbose_name="Cor (Hex)")
+    icone = models.CharField(max_length=50, blank=True, verbose_name="Ícone CSS")
+    peso_estrategico = models.IntegerField(
+        default=1,
+        validators=[MinValueValidator(1), MaxValueValidator(10)],
+        verbose_name="Peso Estratégico (1-10)"
+    )
+    ativo = models.BooleanField(default=True, verbose_name="Ativo")
+    criado_em = models.DateTimeField(auto_now_add=True)
+    atualizado_em = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Categoria Estratégica"
+        verbose_name_plural = "Categorias Estratégicas"
+        ordering = ['-peso_estrategico', 'nome']
+
+    def __str__(self):
+        return f"{self.nome} (Peso: {self.peso_estrategico})"
+
+class TipoProjeto(models.Model):
+    """Tipos de projeto para categorização"""
+    uuid = models.UUIDField(default=uuid.uuid4, editable=False, unique=True)
+    nome = models.CharField(max_length=100, verbose_name="Nome do Tipo")
+    descricao = models.TextField(verbose_name="Descrição", blank=True)
+    prefixo = models.CharField(max_length=10, verbose_name="Prefixo para Códigos")
+    metodologia_sugerida = models.CharField(
+        max_length=50,
+        choices=[
+            ('tradicional', 'Tradicional (Cascata)'),
+            ('agil', 'Ágil (Scrum/Kanban)'),
+            ('hibrido', 'Híbrido'),
+            ('lean', 'Lean'),
+        ],
+        default='tradicional',
+        verbose_name="Metodologia Sugerida"
+    )
+    ativo = models.BooleanField(default=True, verbose_name="Ativo")
+    criado_em = models.DateTimeField(auto_now_add=True)
+    atualizado_em = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Tipo de Projeto"
+        verbose_name_plural = "Tipos de Projeto"
+        ordering = ['nome']
+
+    def __str__(self):
+        return self.nome
+
+class UnidadeOrganizacionalQuerySet(models.QuerySet):
+    def subarvore(self, unidade):
+        """A unidade e todas as suas subunidades, em qualquer nível"""
+        return self.filter(ancestrais__ancestral=unidade)
+
+    def ancestrais_de(self, unidade):
+        """A unidade e todas as unidades acima dela, da raiz para baixo"""
+        return self.filter(descendentes__descendente=unidade).order_by('-descendentes__profundidade')
+
+
+class UnidadeOrganizacional(models.Model):
+    """Unidades organizacionais responsáveis pelos projetos"""
+    uuid = models.UUIDField(default=uuid.uuid4, editable=False, unique=True)
+    nome = models.CharField(max_length=100, verbose_name="Nome da Unidade")
+    sigla = models.CharField(max_length=10, verbose_name="Sigla")
+    descricao = models.TextField(verbose_name="Descrição", blank=True)
+    unidade_pai = models.ForeignKey(
+        'self',
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        verbose_name="Unidade Superior"
+    )
+    responsavel = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        verbose_name="Responsável"
+    )
+    ativo = models.BooleanField(default=True, verbose_name="Ativo")
+    criado_em = models.DateTimeField(auto_now_add=True)
+    atualizado_em = models.DateTimeField(auto_now=True)
+
+    objects = UnidadeOrganizacionalQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = "Unidade Organizacional"
+        verbose_name_plural = "Unidades Organizacionais"
+        ordering = ['nome']
+
+    def __str__(self):
+        return f"{self.sigla} - {self.nome}"
+
+    def clean(self):
+        """Validações do modelo"""
+        if self.unidade_pai_id and self.pk:
+            if HierarquiaUnidade.objects.filter(ancestral=self, descendente_id=self.unidade_pai_id).exists():
+                raise ValidationError('A unidade superior não pode ser a própria unidade nem uma de suas subunidades.')
+
+    def save(self, *args, **kwargs):
+        nova = self._state.adding
+        pai_anterior = None
+        if not nova:
+            pai_anterior = UnidadeOrganizacional.objects.filter(pk=self.pk).values_list(
+                'unidade_pai_id', flat=True
+            ).first()
+
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if nova:
+                HierarquiaUnidade.incluir(self)
+            elif pai_anterior != self.unidade_pai_id:
+                HierarquiaUnidade.mover(self)
+
+
+class HierarquiaUnidade(models.Model):
+    """
+    Tabela de fechamento (closure table) da árvore de unidades: uma linha por
+    par ancestral/descendente, inclusive a própria unidade (profundidade 0).
+    Mantida por UnidadeOrganizacional.save(); com ela a subárvore de uma
+    unidade sai de um único join, sem consultas recursivas.
+    """
+    ancestral = models.ForeignKey(
+        UnidadeOrganizacional,
+        on_delete=models.CASCADE,
+        related_name='descendentes'
+    )
+    descendente = models.ForeignKey(
+        UnidadeOrganizacional,
+        on_delete=models.CASCADE,
+        related_name='ancestrais'
+    )
+    profundidade = models.PositiveSmallIntegerField()
+
+    class Meta:
+        verbose_name = "Hierarquia de Unidades"
+        verbose_name_plural = "Hierarquia de Unidades"
+        unique_together = ['ancestral', 'descendente']
+        indexes = [
+            models.Index(fields=['descendente', 'profundidade'], name='hierarquia_descendente_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.ancestral_id} > {self.descendente_id} ({self.profundidade})"
+
+    @classmethod
+    def incluir(cls, unidade):
+        """Liga uma unidade nova a si mesma e a todos os ancestrais do pai"""
+        ligacoes = [cls(ancestral=unidade, descendente=unidade, profundidade=0)]
+        if unidade.unidade_pai_id:
+            ligacoes += [
+                cls(ancestral_id=ancestral_id, descendente=unidade, profundidade=profundidade + 1)
+                for ancestral_id, profundidade in cls.objects.filter(
+                    descendente_id=unidade.unidade_pai_id
+                ).values_list('ancestral_id', 'profundidade')
+            ]
+        cls.objects.bulk_create(ligacoes)
+
+    @classmethod
+    def mover(cls, unidade):
+        """Religa a subárvore da unidade aos ancestrais do novo pai"""
+        subarvore = dict(cls.objects.filter(ancestral=unidade).values_list('descendente_id', 'profundidade'))
+        if unidade.unidade_pai_id in subarvore:
+            raise ValueError(f'{unidade} não pode ficar abaixo de uma de suas subunidades')
+
+        # Listas em vez de subconsultas: o MySQL não aceita subconsulta na
+        # própria tabela em um DELETE
+        cls.objects.filter(descendente_id__in=list(subarvore)).exclude(
+            ancestral_id__in=list(subarvore)
+        ).delete()
+
+        if unidade.unidade_pai_id:
+            ancestrais = cls.objects.filter(descendente_id=unidade.unidade_pai_id).values_list(
+                'ancestral_id', 'profundidade'
+            )
+            cls.objects.bulk_create([
+                cls(
+                    ancestral_id=ancestral_id,
+                    descendente_id=descendente_id,
+                    profundidade=profundidade_ancestral + profundidade + 1,
+                )
+                for ancestral_id, profundidade_ancestral in ancestrais
+                for descendente_id, profundidade in subarvore.items()
+            ])
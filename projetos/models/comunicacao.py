@@ -0,0 +1,295 @@
+from django.db import models
+from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+import uuid
+
+from .portfolio import Projeto
+
+# =============================================================================
+# COMUNICAÇÃO E MUDANÇAS
+# =============================================================================
+
+class StakeholderProjeto(models.Model):
+    """Partes interessadas do projeto"""
+    uuid = models.UUIDField(default=uuid.uuid4, editable=False, unique=True)
+    projeto = models.ForeignKey(
+        Projeto,
+        on_delete=models.CASCADE,
+        related_name='stakeholders',
+        verbose_name="Projeto"
+    )
+    nome = models.CharField(max_length=100, verbose_name="Nome")
+    cargo = models.CharField(max_length=100, verbose_name="Cargo")
+    organizacao = models.CharField(max_length=100, verbose_name="Organização")
+    email = models.EmailField(verbose_name="E-mail", blank=True)
+    telefone = models.CharField(max_length=20, verbose_name="Telefone", blank=True)
+    
+    # Classificação
+    tipo = models.CharField(
+        max_length=20,
+        choices=[
+            ('interno', 'Interno'),
+            ('externo', 'Externo'),
+            ('cliente', 'Cliente'),
+            ('fornecedor', 'Fornecedor'),
+            ('usuario_final', 'Usuário Final'),
+        ],
+        verbose_name="Tipo"
+    )
+    nivel_influencia = models.CharField(
+        max_length=10,
+        choices=[
+            ('baixo', 'Baixo'),
+            ('medio', 'Médio'),
+            ('alto', 'Alto'),
+        ],
+        default='medio',
+        verbose_name="Nível de Influência"
+    )
+    nivel_interesse = models.CharField(
+        max_length=10,
+        choices=[
+            ('baixo', 'Baixo'),
+            ('medio', 'Médio'),
+            ('alto', 'Alto'),
+        ],
+        default='medio',
+        verbose_name="Nível de Interesse"
+    )
+    
+    # Comunicação
+    frequencia_comunicacao = models.CharField(
+        max_length=20,
+        choices=[
+            ('diaria', 'Diária'),
+            ('semanal', 'Semanal'),
+            ('quinzenal', 'Quinzenal'),
+            ('mensal', 'Mensal'),
+            ('sob_demanda', 'Sob Demanda'),
+        ],
+        default='semanal',
+        verbose_name="Frequência de Comunicação"
+    )
+    metodo_comunicacao = models.CharField(
+        max_length=20,
+        choices=[
+            ('email', 'E-mail'),
+            ('reuniao', 'Reunião'),
+            ('relatorio', 'Relatório'),
+            ('dashboard', 'Dashboard'),
+            ('telefone', 'Telefone'),
+        ],
+        default='email',
+        verbose_name="Método de Comunicação"
+    )
+    
+    observacoes = models.TextField(verbose_name="Observações", blank=True)
+    ativo = models.BooleanField(default=True, verbose_name="Ativo")
+    criado_em = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Stakeholder"
+        verbose_name_plural = "Stakeholders"
+        ordering = ['nome']
+
+    def __str__(self):
+        return f"{self.projeto.codigo} - {self.nome}"
+
+class SolicitacaoMudanca(models.Model):
+    """Solicitações de mudança no projeto"""
+    uuid = models.UUIDField(default=uuid.uuid4, editable=False, unique=True)
+    projeto = models.ForeignKey(
+        Projeto,
+        on_delete=models.CASCADE,
+        related_name='mudancas',
+        verbose_name="Projeto"
+    )
+    numero = models.CharField(max_length=20, verbose_name="Número da Solicitação")
+    titulo = models.CharField(max_length=100, verbose_name="Título")
+    descricao = models.TextField(verbose_name="Descrição da Mudança")
+    justificativa = models.TextField(verbose_name="Justificativa")
+    
+    # Solicitante
+    solicitante = models.ForeignKey(
+        User,
+        on_delete=models.PROTECT,
+        related_name='mudancas_solicitadas',
+        verbose_name="Solicitante"
+    )
+    data_solicitacao = models.DateField(verbose_name="Data da Solicitação")
+    
+    # Impactos
+    impacto_cronograma = models.TextField(
+        verbose_name="Impacto no Cronograma",
+        blank=True
+    )
+    impacto_orcamento = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        default=0,
+        verbose_name="Impacto no Orçamento"
+    )
+    impacto_qualidade = models.TextField(
+        verbose_name="Impacto na Qualidade",
+        blank=True
+    )
+    impacto_recursos = models.TextField(
+        verbose_name="Impacto nos Recursos",
+        blank=True
+    )
+    
+    # Aprovação
+    status = models.CharField(
+        max_length=20,
+        choices=[
+            ('pendente', 'Pendente'),
+            ('em_analise', 'Em Análise'),
+            ('aprovada', 'Aprovada'),
+            ('rejeitada', 'Rejeitada'),
+            ('implementada', 'Implementada'),
+        ],
+        default='pendente',
+        verbose_name="Status"
+    )
+    aprovador = models.ForeignKey(
+        User,
+        on_delete=models.PROTECT,
+        related_name='mudancas_aprovadas',
+        null=True,
+        blank=True,
+        verbose_name="Aprovador"
+    )
+    data_aprovacao = models.DateField(
+        null=True,
+        blank=True,
+        verbose_name="Data da Aprovação"
+    )
+    observacoes_aprovacao = models.TextField(
+        verbose_name="Observações da Aprovação",
+        blank=True
+    )
+    
+    ativo = models.BooleanField(default=True, verbose_name="Ativo")
+    criado_em = models.DateTimeField(auto_now_add=True)
+    atualizado_em = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Solicitação de Mudança"
+        verbose_name_plural = "Solicitações de Mudança"
+        ordering = ['-data_solicitacao']
+        unique_together = ['projeto', 'numero']
+
+    def __str__(self):
+        return f"{self.numero} - {self.titulo}"
+
+# =============================================================================
+# ANEXOS E DOCUMENTOS
+# =============================================================================
+
+class AnexoProjeto(models.Model):
+    """Anexos e documentos do projeto"""
+    uuid = models.UUIDField(default=uuid.uuid4, editable=False, unique=True)
+    projeto = models.ForeignKey(
+        Projeto,
+        on_delete=models.CASCADE,
+        related_name='anexos',
+        verbose_name="Projeto"
+    )
+    nome = models.CharField(max_length=100, verbose_name="Nome do Anexo")
+    descricao = models.TextField(verbose_name="Descrição", blank=True)
+    
+    # Arquivo ou Link
+    tipo = models.CharField(
+        max_length=10,
+        choices=[
+            ('arquivo', 'Arquivo'),
+            ('link', 'Link Externo'),
+        ],
+        default='arquivo',
+        verbose_name="Tipo"
+    )
+    arquivo = models.FileField(
+        upload_to='projetos/anexos/',
+        blank=True,
+        null=True,
+        verbose_name="Arquivo"
+    )
+    link = models.URLField(
+        blank=True,
+        null=True,
+        verbose_name="Link Externo"
+    )
+    
+    # Categorização
+    categoria = models.CharField(
+        max_length=20,
+        choices=[
+            ('charter', 'Project Charter'),
+            ('cronograma', 'Cronograma'),
+            ('orcamento', 'Orçamento'),
+            ('escopo', 'Escopo'),
+            ('risco', 'Análise de Riscos'),
+            ('comunicacao', 'Comunicação'),
+            ('qualidade', 'Qualidade'),
+            ('outro', 'Outro'),
+        ],
+        default='outro',
+        verbose_name="Categoria"
+    )
+    
+    # Controle de versão
+    versao = models.CharField(
+        max_length=10,
+        default='1.0',
+        verbose_name="Versão"
+    )
+    autor = models.ForeignKey(
+        User,
+        on_delete=models.PROTECT,
+        verbose_name="Autor"
+    )
+    
+    ativo = models.BooleanField(default=True, verbose_name="Ativo")
+    criado_em = models.DateTimeField(auto_now_add=True)
+    atualizado_em = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Anexo do Projeto"
+        verbose_name_plural = "Anexos do Projeto"
+        ordering = ['-atualizado_em']
+
+    def __str__(self):
+        return f"{self.projeto.codigo} - {self.nome}"
+
+    def clean(self):
+        """Validação para garantir arquivo OU link"""
+        if self.tipo == 'arquivo' and not self.arquivo:
+            raise ValidationError('Arquivo é obrigatório quando tipo é "Arquivo".')
+        if self.tipo == 'link' and not self.link:
+            raise ValidationError('Link é obrigatório quando tipo é "Link Externo".')
+
+    def get_icone(self):
+        """Retorna ícone baseado no tipo"""
+        if self.tipo == 'link':
+            return 'fa-solid fa-link'
+        else:
+            # Determinar ícone baseado na extensão do arquivo
+            if self.arquivo:
+                nome = self.arquivo.name.lower()
+                if nome.endswith(('.pdf',)):
+                    return 'fa-solid fa-file-pdf'
+                elif nome.endswith(('.doc', '.docx')):
+                    return 'fa-solid fa-file-word'
+                elif nome.endswith(('.xls', '.xlsx')):
+                    return 'fa-solid fa-file-excel'
+                elif nome.endswith(('.ppt', '.pptx')):
+                    return 'fa-solid fa-file-powerpoint'
+                elif nome.endswith(('.jpg', '.jpeg', '.png', '.gif')):
+                    return 'fa-solid fa-file-image'
+            return 'fa-solid fa-file'
+
+    def delete(self, *args, **kwargs):
+        """Remove arquivo físico ao deletar o registro"""
+        if self.arquivo:
+            self.arquivo.delete(save=False)
+        super().delete(*args, **kwargs)
@@ -0,0 +1,340 @@
+from django.db import models
+from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.core.validators import MinValueValidator, MaxValueValidator
+from datetime import date, timedelta
+import uuid
+
+from .base import StatusChoices, StatusPrazoQuerySet
+from .portfolio import Projeto
+
+# =============================================================================
+# CRONOGRAMA E ENTREGAS
+# =============================================================================
+
+class FaseProjeto(models.Model):
+    """Fases do projeto"""
+    uuid = models.UUIDField(default=uuid.uuid4, editable=False, unique=True)
+    projeto = models.ForeignKey(
+        Projeto,
+        on_delete=models.CASCADE,
+        related_name='fases',
+        verbose_name="Projeto"
+    )
+    nome = models.CharField(max_length=100, verbose_name="Nome da Fase")
+    descricao = models.TextField(verbose_name="Descrição", blank=True)
+    ordem = models.PositiveIntegerField(verbose_name="Ordem")
+    data_inicio_prevista = models.DateField(verbose_name="Data Início Prevista")
+    data_inicio_real = models.DateField(null=True, blank=True, verbose_name="Data Início Real")
+    data_fim_prevista = models.DateField(verbose_name="Data Fim Prevista")
+    data_fim_real = models.DateField(null=True, blank=True, verbose_name="Data Fim Real")
+    percentual_conclusao = models.IntegerField(
+        default=0,
+        validators=[MinValueValidator(0), MaxValueValidator(100)],
+        verbose_name="Percentual de Conclusão (%)"
+    )
+    status = models.CharField(
+        max_length=20,
+        choices=StatusChoices.choices,
+        default=StatusChoices.NAO_INICIADO,
+        verbose_name="Status"
+    )
+    ativo = models.BooleanField(default=True, verbose_name="Ativo")
+    criado_em = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Fase do Projeto"
+        verbose_name_plural = "Fases do Projeto"
+        ordering = ['projeto', 'ordem']
+        unique_together = ['projeto', 'ordem']
+
+    def __str__(self):
+        return f"{self.projeto.codigo} - Fase {self.ordem}: {self.nome}"
+
+class EntregaQuerySet(StatusPrazoQuerySet):
+    campo_previsto = 'data_prevista'
+    campo_real = 'data_entrega'
+    status_concluido = 'entregue'
+    dias_atencao = 3  # 3 dias de antecedência
+
+
+class Entrega(models.Model):
+    """Entregas/Deliverables do projeto"""
+    uuid = models.UUIDField(default=uuid.uuid4, editable=False, unique=True)
+    projeto = models.ForeignKey(
+        Projeto,
+        on_delete=models.CASCADE,
+        related_name='entregas',
+        verbose_name="Projeto"
+    )
+    fase = models.ForeignKey(
+        FaseProjeto,
+        on_delete=models.CASCADE,
+        related_name='entregas',
+        verbose_name="Fase",
+        null=True,
+        blank=True
+    )
+    nome = models.CharField(max_length=100, verbose_name="Nome da Entrega")
+    descricao = models.TextField(verbose_name="Descrição")
+    tipo = models.CharField(
+        max_length=20,
+        choices=[
+            ('documento', 'Documento'),
+            ('prototipo', 'Protótipo'),
+            ('sistema', 'Sistema'),
+            ('relatorio', 'Relatório'),
+            ('treinamento', 'Treinamento'),
+            ('outro', 'Outro'),
+        ],
+        default='documento',
+        verbose_name="Tipo de Entrega"
+    )
+    responsavel = models.ForeignKey(
+        User,
+        on_delete=models.PROTECT,
+        verbose_name="Responsável"
+    )
+    data_prevista = models.DateField(verbose_name="Data Prevista")
+    duracao_dias = models.PositiveIntegerField(
+        default=1,
+        verbose_name="Duração (dias)",
+        help_text="Dias de trabalho até a data prevista, usados no cálculo do caminho crítico"
+    )
+    data_entrega = models.DateField(null=True, blank=True, verbose_name="Data de Entrega")
+    status = models.CharField(
+        max_length=20,
+        choices=[
+            ('nao_iniciado', 'Não Iniciado'),
+            ('em_desenvolvimento', 'Em Desenvolvimento'),
+            ('em_revisao', 'Em Revisão'),
+            ('aprovado', 'Aprovado'),
+            ('rejeitado', 'Rejeitado'),
+            ('entregue', 'Entregue'),
+        ],
+        default='nao_iniciado',
+        verbose_name="Status"
+    )
+    criterios_aceitacao = models.TextField(
+        verbose_name="Critérios de Aceitação",
+        blank=True
+    )
+    observacoes = models.TextField(verbose_name="Observações", blank=True)
+    ativo = models.BooleanField(default=True, verbose_name="Ativo")
+    criado_em = models.DateTimeField(auto_now_add=True)
+    atualizado_em = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Entrega"
+        verbose_name_plural = "Entregas"
+        ordering = ['data_prevista', 'nome']
+
+    objects = EntregaQuerySet.as_manager()
+
+    def __str__(self):
+        return f"{self.projeto.codigo} - {self.nome}"
+
+    def get_status_prazo(self):
+        """Retorna o status do prazo da entrega"""
+        # Listagens anotam o valor com Entrega.objects.com_status_prazo()
+        if hasattr(self, 'status_prazo'):
+            return self.status_prazo
+
+        from datetime import date
+        hoje = date.today()
+        
+        if self.status == 'entregue':
+            if self.data_entrega and self.data_entrega <= self.data_prevista:
+                return 'no_prazo'
+            else:
+                return 'atrasado'
+        
+        if hoje > self.data_prevista:
+            return 'atrasado'
+        elif hoje > self.data_prevista - timedelta(days=3):  # 3 dias de antecedência
+            return 'atencao'
+        else:
+            return 'no_prazo'
+
+class DependenciaCronograma(models.Model):
+    """
+    Dependência término-início entre fases e entregas de um projeto: a
+    sucessora só começa depois que a predecessora termina (mais a defasagem).
+    Cada lado aponta para uma fase ou para uma entrega.
+    """
+    projeto = models.ForeignKey(
+        Projeto,
+        on_delete=models.CASCADE,
+        related_name='dependencias',
+        verbose_name="Projeto"
+    )
+    fase_predecessora = models.ForeignKey(
+        FaseProjeto,
+        on_delete=models.CASCADE,
+        related_name='dependencias_sucessoras',
+        verbose_name="Fase Predecessora",
+        null=True,
+        blank=True
+    )
+    entrega_predecessora = models.ForeignKey(
+        Entrega,
+        on_delete=models.CASCADE,
+        related_name='dependencias_sucessoras',
+        verbose_name="Entrega Predecessora",
+        null=True,
+        blank=True
+    )
+    fase_sucessora = models.ForeignKey(
+        FaseProjeto,
+        on_delete=models.CASCADE,
+        related_name='dependencias_predecessoras',
+        verbose_name="Fase Sucessora",
+        null=True,
+        blank=True
+    )
+    entrega_sucessora = models.ForeignKey(
+        Entrega,
+        on_delete=models.CASCADE,
+        related_name='dependencias_predecessoras',
+        verbose_name="Entrega Sucessora",
+        null=True,
+        blank=True
+    )
+    defasagem_dias = models.IntegerField(
+        default=0,
+        verbose_name="Defasagem (dias)",
+        help_text="Espera após o término da predecessora; negativo permite sobreposição"
+    )
+    ativo = models.BooleanField(default=True, verbose_name="Ativo")
+    criado_em = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Dependência do Cronograma"
+        verbose_name_plural = "Dependências do Cronograma"
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(fase_predecessora__isnull=True) ^ models.Q(entrega_predecessora__isnull=True),
+                name='dependencia_uma_predecessora',
+            ),
+            models.CheckConstraint(
+                condition=models.Q(fase_sucessora__isnull=True) ^ models.Q(entrega_sucessora__isnull=True),
+                name='dependencia_uma_sucessora',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.predecessora} → {self.sucessora}"
+
+    @property
+    def predecessora(self):
+        return self.fase_predecessora or self.entrega_predecessora
+
+    @property
+    def sucessora(self):
+        return self.fase_sucessora or self.entrega_sucessora
+
+    @property
+    def chave_predecessora(self):
+        """Identificador do nó no grafo do cronograma (f<id> ou e<id>)"""
+        if self.fase_predecessora_id:
+            return f"f{self.fase_predecessora_id}"
+        return f"e{self.entrega_predecessora_id}"
+
+    @property
+    def chave_sucessora(self):
+        if self.fase_sucessora_id:
+            return f"f{self.fase_sucessora_id}"
+        return f"e{self.entrega_sucessora_id}"
+
+    def clean(self):
+        """Validações do modelo"""
+        if (self.fase_predecessora_id is None) == (self.entrega_predecessora_id is None):
+            raise ValidationError('Informe uma fase ou uma entrega como predecessora.')
+        if (self.fase_sucessora_id is None) == (self.entrega_sucessora_id is None):
+            raise ValidationError('Informe uma fase ou uma entrega como sucessora.')
+        if self.chave_predecessora == self.chave_sucessora:
+            raise ValidationError('Uma tarefa não pode depender dela mesma.')
+
+        for tarefa in (self.predecessora, self.sucessora):
+            if tarefa.projeto_id != self.projeto_id:
+                raise ValidationError(f'"{tarefa}" não pertence ao projeto da dependência.')
+
+        from ..caminho_critico import cria_ciclo
+        if cria_ciclo(self.projeto_id, self.chave_predecessora, self.chave_sucessora, ignorar=self.pk):
+            raise ValidationError('Esta dependência cria um ciclo no cronograma.')
+
+
+class MarcoQuerySet(StatusPrazoQuerySet):
+    campo_previsto = 'data_prevista'
+    campo_real = 'data_real'
+    status_concluido = 'atingido'
+    dias_atencao = 3  # 3 dias de antecedência
+
+
+class Marco(models.Model):
+    """Marcos/Milestones do projeto"""
+    uuid = models.UUIDField(default=uuid.uuid4, editable=False, unique=True)
+    projeto = models.ForeignKey(
+        Projeto,
+        on_delete=models.CASCADE,
+        related_name='marcos',
+        verbose_name="Projeto"
+    )
+    nome = models.CharField(max_length=100, verbose_name="Nome do Marco")
+    descricao = models.TextField(verbose_name="Descrição")
+    data_prevista = models.DateField(verbose_name="Data Prevista")
+    data_real = models.DateField(null=True, blank=True, verbose_name="Data Real")
+    tipo = models.CharField(
+        max_length=20,
+        choices=[
+            ('inicio_projeto', 'Início do Projeto'),
+            ('fim_fase', 'Fim de Fase'),
+            ('aprovacao', 'Aprovação'),
+            ('entrega_principal', 'Entrega Principal'),
+            ('fim_projeto', 'Fim do Projeto'),
+            ('outro', 'Outro'),
+        ],
+        default='outro',
+        verbose_name="Tipo de Marco"
+    )
+    status = models.CharField(
+        max_length=20,
+        choices=[
+            ('pendente', 'Pendente'),
+            ('atingido', 'Atingido'),
+            ('atrasado', 'Atrasado'),
+        ],
+        default='pendente',
+        verbose_name="Status"
+    )
+    ativo = models.BooleanField(default=True, verbose_name="Ativo")
+    criado_em = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Marco"
+        verbose_name_plural = "Marcos"
+        ordering = ['data_prevista', 'nome']
+
+    objects = MarcoQuerySet.as_manager()
+
+    def __str__(self):
+        return f"{self.projeto.codigo} - {self.nome}"
+
+    def get_status_prazo(self):
+        """Retorna o status do prazo do marco"""
+        # Listagens anotam o valor com Marco.objects.com_status_prazo()
+        if hasattr(self, 'status_prazo'):
+            return self.status_prazo
+
+        hoje = date.today()
+
+        if self.status == 'atingido':
+            if self.data_real and self.data_real <= self.data_prevista:
+                return 'no_prazo'
+            return 'atrasado'
+
+        if hoje > self.data_prevista:
+            return 'atrasado'
+        elif hoje > self.data_prevista - timedelta(days=3):  # 3 dias de antecedência
+            return 'atencao'
+        return 'no_prazo'
@@ -0,0 +1,56 @@
+from django.db import models
+
+from .base import StatusChoices
+from .portfolio import Projeto
+
+# =============================================================================
+# HISTÓRICO (SNAPSHOTS DIÁRIOS)
+# =============================================================================
+
+class SnapshotProjeto(models.Model):
+    """Situação de um projeto em um dia: andamento, indicadores EVM e riscos"""
+    projeto = models.ForeignKey(
+        Projeto,
+        on_delete=models.CASCADE,
+        related_name='snapshots',
+        verbose_name="Projeto"
+    )
+    data = models.DateField(verbose_name="Data")
+
+    # Andamento
+    status = models.CharField(
+        max_length=20,
+        choices=StatusChoices.choices,
+        default=StatusChoices.NAO_INICIADO,
+        verbose_name="Status"
+    )
+    percentual_conclusao = models.PositiveSmallIntegerField(default=0, verbose_name="Percentual de Conclusão (%)")
+
+    # Valores monetários (ver projetos.evm)
+    pv = models.DecimalField(max_digits=15, decimal_places=2, verbose_name="Valor Planejado (PV)")
+    ev = models.DecimalField(max_digits=15, decimal_places=2, verbose_name="Valor Agregado (EV)")
+    ac = models.DecimalField(max_digits=15, decimal_places=2, verbose_name="Custo Real (AC)")
+    eac = models.DecimalField(max_digits=15, decimal_places=2, verbose_name="Estimativa no Término (EAC)")
+    vac = models.DecimalField(max_digits=15, decimal_places=2, verbose_name="Variação no Término (VAC)")
+
+    # Índices; nulos quando o denominador é zero
+    cpi = models.FloatField(null=True, blank=True, verbose_name="Índice de Desempenho de Custo (CPI)")
+    spi = models.FloatField(null=True, blank=True, verbose_name="Índice de Desempenho de Prazo (SPI)")
+
+    # Riscos ativos ainda em acompanhamento
+    riscos_abertos = models.PositiveIntegerField(default=0, verbose_name="Riscos Abertos")
+    riscos_altos = models.PositiveIntegerField(default=0, verbose_name="Riscos Altos Abertos")
+
+    criado_em = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Snapshot do Projeto"
+        verbose_name_plural = "Snapshots dos Projetos"
+        unique_together = ['projeto', 'data']
+        ordering = ['-data']
+        indexes = [
+            models.Index(fields=['data'], name='snapshot_data_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.projeto.codigo} - {self.data:%d/%m/%Y}"
@@ -0,0 +1,490 @@
+from django.db import models
+from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.core.validators import MinValueValidator, MaxValueValidator
+from datetime import timedelta
+import uuid
+
+from .base import (
+    CategoriaEstrategica, TipoProjeto, UnidadeOrganizacional,
+    StatusChoices, PrioridadeChoices, TipoRecursoChoices, StatusPrazoQuerySet,
+)
+
+# =============================================================================
+# PORTFÓLIO
+# =============================================================================
+
+class Portfolio(models.Model):
+    """Portfólio de projetos e programas"""
+    uuid = models.UUIDField(default=uuid.uuid4, editable=False, unique=True)
+    nome = models.CharField(max_length=100, verbose_name="Nome do Portfólio")
+    descricao = models.TextField(verbose_name="Descrição")
+    codigo = models.CharField(max_length=20, unique=True, verbose_name="Código")
+    
+    # Responsabilidades
+    gestor_portfolio = models.ForeignKey(
+        User,
+        on_delete=models.PROTECT,
+        related_name='portfolios_gerenciados',
+        verbose_name="Gestor do Portfólio"
+    )
+    patrocinador = models.ForeignKey(
+        User,
+        on_delete=models.PROTECT,
+        related_name='portfolios_patrocinados',
+        verbose_name="Patrocinador"
+    )
+    unidade_organizacional = models.ForeignKey(
+        UnidadeOrganizacional,
+        on_delete=models.PROTECT,
+        verbose_name="Unidade Organizacional"
+    )
+    
+    # Alinhamento estratégico
+    categoria_estrategica = models.ForeignKey(
+        CategoriaEstrategica,
+        on_delete=models.PROTECT,
+        verbose_name="Categoria Estratégica"
+    )
+    
+    # Orçamento e recursos
+    orcamento_total = models.DecimalField(
+        max_digits=15,
+        decimal_places=2,
+        default=0,
+        verbose_name="Orçamento Total"
+    )
+    
+    # Datas
+    data_inicio = models.DateField(verbose_name="Data de Início")
+    data_fim_prevista = models.DateField(verbose_name="Data Fim Prevista")
+    data_fim_real = models.DateField(null=True, blank=True, verbose_name="Data Fim Real")
+    
+    # Status e controle
+    status = models.CharField(
+        max_length=20,
+        choices=StatusChoices.choices,
+        default=StatusChoices.NAO_INICIADO,
+        verbose_name="Status"
+    )
+    prioridade = models.CharField(
+        max_length=15,
+        choices=PrioridadeChoices.choices,
+        default=PrioridadeChoices.MEDIA,
+        verbose_name="Prioridade"
+    )
+    
+    ativo = models.BooleanField(default=True, verbose_name="Ativo")
+    criado_em = models.DateTimeField(auto_now_add=True)
+    atualizado_em = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Portfólio"
+        verbose_name_plural = "Portfólios"
+        ordering = ['-prioridade', 'nome']
+
+    def __str__(self):
+        return f"{self.codigo} - {self.nome}"
+
+    def get_valor_total_projetos(self):
+        """Calcula o valor total dos projetos do portfólio"""
+        return sum([p.orcamento_total for p in self.projetos.all()] + 
+                  [p.orcamento_total for programa in self.programas.all() 
+                   for p in programa.projetos.all()])
+
+    def get_percentual_conclusao(self):
+        """Calcula o percentual médio de conclusão do portfólio"""
+        projetos = list(self.projetos.all())
+        for programa in self.programas.all():
+            projetos.extend(programa.projetos.all())
+        
+        if not projetos:
+            return 0
+        
+        total_conclusao = sum([p.percentual_conclusao for p in projetos])
+        return total_conclusao / len(projetos)
+
+# =============================================================================
+# PROGRAMA
+# =============================================================================
+
+class Programa(models.Model):
+    """Programa que agrupa projetos relacionados"""
+    uuid = models.UUIDField(default=uuid.uuid4, editable=False, unique=True)
+    nome = models.CharField(max_length=100, verbose_name="Nome do Programa")
+    descricao = models.TextField(verbose_name="Descrição")
+    codigo = models.CharField(max_length=20, unique=True, verbose_name="Código")
+    
+    # Relacionamentos
+    portfolio = models.ForeignKey(
+        Portfolio,
+        on_delete=models.CASCADE,
+        related_name='programas',
+        verbose_name="Portfólio"
+    )
+    
+    # Responsabilidades
+    gerente_programa = models.ForeignKey(
+        User,
+        on_delete=models.PROTECT,
+        related_name='programas_gerenciados',
+        verbose_name="Gerente do Programa"
+    )
+    
+    # Objetivos e benefícios
+    objetivos = models.TextField(verbose_name="Objetivos do Programa")
+    beneficios_esperados = models.TextField(verbose_name="Benefícios Esperados")
+    
+    # Orçamento e recursos
+    orcamento_total = models.DecimalField(
+        max_digits=15,
+        decimal_places=2,
+        default=0,
+        verbose_name="Orçamento Total"
+    )
+    
+    # Datas
+    data_inicio = models.DateField(verbose_name="Data de Início")
+    data_fim_prevista = models.DateField(verbose_name="Data Fim Prevista")
+    data_fim_real = models.DateField(null=True, blank=True, verbose_name="Data Fim Real")
+    
+    # Status e controle
+    status = models.CharField(
+        max_length=20,
+        choices=StatusChoices.choices,
+        default=StatusChoices.NAO_INICIADO,
+        verbose_name="Status"
+    )
+    prioridade = models.CharField(
+        max_length=15,
+        choices=PrioridadeChoices.choices,
+        default=PrioridadeChoices.MEDIA,
+        verbose_name="Prioridade"
+    )
+    
+    ativo = models.BooleanField(default=True, verbose_name="Ativo")
+    criado_em = models.DateTimeField(auto_now_add=True)
+    atualizado_em = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Programa"
+        verbose_name_plural = "Programas"
+        ordering = ['-prioridade', 'nome']
+
+    def __str__(self):
+        return f"{self.codigo} - {self.nome}"
+
+    def get_percentual_conclusao(self):
+        """Calcula o percentual médio de conclusão do programa"""
+        projetos = self.projetos.all()
+        if not projetos:
+            return 0
+        
+        total_conclusao = sum([p.percentual_conclusao for p in projetos])
+        return total_conclusao / len(projetos)
+
+# =============================================================================
+# PROJETO
+# =============================================================================
+
+class ProjetoQuerySet(StatusPrazoQuerySet):
+    campo_previsto = 'data_fim_prevista'
+    campo_real = 'data_fim_real'
+    status_concluido = StatusChoices.CONCLUIDO
+    dias_atencao = 7  # Uma semana de antecedência
+
+
+class Projeto(models.Model):
+    """Projeto individual"""
+    uuid = models.UUIDField(default=uuid.uuid4, editable=False, unique=True)
+    nome = models.CharField(max_length=100, verbose_name="Nome do Projeto")
+    descricao = models.TextField(verbose_name="Descrição")
+    codigo = models.CharField(max_length=20, unique=True, verbose_name="Código")
+    
+    # Relacionamentos
+    portfolio = models.ForeignKey(
+        Portfolio,
+        on_delete=models.CASCADE,
+        related_name='projetos',
+        verbose_name="Portfólio",
+        null=True,
+        blank=True
+    )
+    programa = models.ForeignKey(
+        Programa,
+        on_delete=models.CASCADE,
+        related_name='projetos',
+        verbose_name="Programa",
+        null=True,
+        blank=True
+    )
+    tipo_projeto = models.ForeignKey(
+        TipoProjeto,
+        on_delete=models.PROTECT,
+        verbose_name="Tipo de Projeto"
+    )
+    
+    # Responsabilidades
+    gerente_projeto = models.ForeignKey(
+        User,
+        on_delete=models.PROTECT,
+        related_name='projetos_gerenciados',
+        verbose_name="Gerente do Projeto"
+    )
+    patrocinador = models.ForeignKey(
+        User,
+        on_delete=models.PROTECT,
+        related_name='projetos_patrocinados',
+        verbose_name="Patrocinador"
+    )
+    
+    # Definição do projeto
+    objetivos = models.TextField(verbose_name="Objetivos")
+    escopo_produto = models.TextField(verbose_name="Escopo do Produto")
+    escopo_trabalho = models.TextField(verbose_name="Escopo do Trabalho")
+    premissas = models.TextField(verbose_name="Premissas", blank=True)
+    restricoes = models.TextField(verbose_name="Restrições", blank=True)
+    nao_escopo = models.TextField(verbose_name="Não Escopo", blank=True)
+    
+    # Orçamento e recursos
+    orcamento_total = models.DecimalField(
+        max_digits=15,
+        decimal_places=2,
+        default=0,
+        verbose_name="Orçamento Total"
+    )
+    orcamento_consumido = models.DecimalField(
+        max_digits=15,
+        decimal_places=2,
+        default=0,
+        verbose_name="Orçamento Consumido"
+    )
+    
+    # Datas
+    data_inicio_prevista = models.DateField(verbose_name="Data Início Prevista")
+    data_inicio_real = models.DateField(null=True, blank=True, verbose_name="Data Início Real")
+    data_fim_prevista = models.DateField(verbose_name="Data Fim Prevista")
+    data_fim_real = models.DateField(null=True, blank=True, verbose_name="Data Fim Real")
+    
+    # Percentual de conclusão
+    percentual_conclusao = models.IntegerField(
+        default=0,
+        validators=[MinValueValidator(0), MaxValueValidator(100)],
+        verbose_name="Percentual de Conclusão (%)"
+    )
+    
+    # Status e controle
+    status = models.CharField(
+        max_length=20,
+        choices=StatusChoices.choices,
+        default=StatusChoices.NAO_INICIADO,
+        verbose_name="Status"
+    )
+    prioridade = models.CharField(
+        max_length=15,
+        choices=PrioridadeChoices.choices,
+        default=PrioridadeChoices.MEDIA,
+        verbose_name="Prioridade"
+    )
+    
+    # Metodologia
+    metodologia = models.CharField(
+        max_length=50,
+        choices=[
+            ('tradicional', 'Tradicional (Cascata)'),
+            ('agil', 'Ágil (Scrum/Kanban)'),
+            ('hibrido', 'Híbrido'),
+            ('lean', 'Lean'),
+        ],
+        default='tradicional',
+        verbose_name="Metodologia"
+    )
+    
+    ativo = models.BooleanField(default=True, verbose_name="Ativo")
+    criado_em = models.DateTimeField(auto_now_add=True)
+    atualizado_em = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Projeto"
+        verbose_name_plural = "Projetos"
+        ordering = ['-prioridade', 'nome']
+        # Projetos inativos não aparecem nas telas; onde o banco não suporta
+        # índices parciais (MySQL) a condição é ignorada e o índice é completo
+        indexes = [
+            models.Index(
+                fields=['status'],
+                condition=models.Q(ativo=True),
+                name='projeto_ativo_status_idx',
+            ),
+            models.Index(
+                fields=['data_fim_prevista', 'status'],
+                condition=models.Q(ativo=True),
+                name='projeto_ativo_prazo_idx',
+            ),
+            models.Index(
+                fields=['-prioridade', 'nome'],
+                condition=models.Q(ativo=True),
+                name='projeto_ativo_ordem_idx',
+            ),
+        ]
+
+    objects = ProjetoQuerySet.as_manager()
+
+    def __str__(self):
+        return f"{self.codigo} - {self.nome}"
+
+    def clean(self):
+        """Validações do modelo"""
+        if self.data_inicio_prevista and self.data_fim_prevista:
+            if self.data_inicio_prevista >= self.data_fim_prevista:
+                raise ValidationError('Data de início deve ser anterior à data de fim.')
+        
+        if self.data_inicio_real and self.data_fim_real:
+            if self.data_inicio_real >= self.data_fim_real:
+                raise ValidationError('Data de início real deve ser anterior à data de fim real.')
+        
+        if self.orcamento_consumido > self.orcamento_total:
+            raise ValidationError('Orçamento consumido não pode ser maior que o orçamento total.')
+
+    def get_percentual_orcamento_consumido(self):
+        """Calcula o percentual do orçamento consumido"""
+        if self.orcamento_total > 0:
+            return (self.orcamento_consumido / self.orcamento_total) * 100
+        return 0
+
+    def get_saldo_orcamento(self):
+        """Calcula o saldo do orçamento"""
+        return self.orcamento_total - self.orcamento_consumido
+
+    def get_status_prazo(self):
+        """Retorna o status do prazo do projeto"""
+        # Listagens anotam o valor com Projeto.objects.com_status_prazo()
+        if hasattr(self, 'status_prazo'):
+            return self.status_prazo
+
+        from datetime import date
+        hoje = date.today()
+        
+        if self.status == StatusChoices.CONCLUIDO:
+            if self.data_fim_real and self.data_fim_real <= self.data_fim_prevista:
+                return 'no_prazo'
+            else:
+                return 'atrasado'
+        
+        if hoje > self.data_fim_prevista:
+            return 'atrasado'
+        elif hoje > self.data_fim_prevista - timedelta(days=7):  # Uma semana de antecedência
+            return 'atencao'
+        else:
+            return 'no_prazo'
+
+# =============================================================================
+# EQUIPE E RECURSOS
+# =============================================================================
+
+class EquipeProjeto(models.Model):
+    """Equipe do projeto"""
+    uuid = models.UUIDField(default=uuid.uuid4, editable=False, unique=True)
+    projeto = models.ForeignKey(
+        Projeto,
+        on_delete=models.CASCADE,
+        related_name='equipe',
+        verbose_name="Projeto"
+    )
+    membro = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        verbose_name="Membro da Equipe"
+    )
+    papel = models.CharField(
+        max_length=50,
+        choices=[
+            ('gerente', 'Gerente de Projeto'),
+            ('coordenador', 'Coordenador'),
+            ('analista', 'Analista'),
+            ('desenvolvedor', 'Desenvolvedor'),
+            ('designer', 'Designer'),
+            ('tester', 'Testador'),
+            ('especialista', 'Especialista'),
+            ('consultor', 'Consultor'),
+            ('outro', 'Outro'),
+        ],
+        verbose_name="Papel"
+    )
+    responsabilidades = models.TextField(verbose_name="Responsabilidades", blank=True)
+    dedicacao_percentual = models.IntegerField(
+        default=100,
+        validators=[MinValueValidator(1), MaxValueValidator(100)],
+        verbose_name="Dedicação (%)"
+    )
+    data_entrada = models.DateField(verbose_name="Data de Entrada")
+    data_saida = models.DateField(null=True, blank=True, verbose_name="Data de Saída")
+    ativo = models.BooleanField(default=True, verbose_name="Ativo")
+    criado_em = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Membro da Equipe"
+        verbose_name_plural = "Equipe do Projeto"
+        unique_together = ['projeto', 'membro']
+
+    def __str__(self):
+        return f"{self.projeto.codigo} - {self.membro.get_full_name()} ({self.papel})"
+
+class RecursoProjeto(models.Model):
+    """Recursos necessários/alocados ao projeto"""
+    uuid = models.UUIDField(default=uuid.uuid4, editable=False, unique=True)
+    projeto = models.ForeignKey(
+        Projeto,
+        on_delete=models.CASCADE,
+        related_name='recursos',
+        verbose_name="Projeto"
+    )
+    nome = models.CharField(max_length=100, verbose_name="Nome do Recurso")
+    tipo = models.CharField(
+        max_length=20,
+        choices=TipoRecursoChoices.choices,
+        verbose_name="Tipo de Recurso"
+    )
+    descricao = models.TextField(verbose_name="Descrição", blank=True)
+    quantidade_necessaria = models.DecimalField(
+        max_digits=10,
+        decimal_places=2,
+        verbose_name="Quantidade Necessária"
+    )
+    quantidade_alocada = models.DecimalField(
+        max_digits=10,
+        decimal_places=2,
+        default=0,
+        verbose_name="Quantidade Alocada"
+    )
+    unidade_medida = models.CharField(
+        max_length=20,
+        verbose_name="Unidade de Medida"
+    )
+    custo_unitario = models.DecimalField(
+        max_digits=10,
+        decimal_places=2,
+        default=0,
+        verbose_name="Custo Unitário"
+    )
+    data_necessidade = models.DateField(verbose_name="Data de Necessidade")
+    observacoes = models.TextField(verbose_name="Observações", blank=True)
+    criado_em = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Recurso do Projeto"
+        verbose_name_plural = "Recursos do Projeto"
+        ordering = ['data_necessidade', 'nome']
+
+    def __str__(self):
+        return f"{self.projeto.codigo} - {self.nome}"
+
+    def get_custo_total(self):
+        """Calcula o custo total do recurso"""
+        return self.quantidade_necessaria * self.custo_unitario
+
+    def get_percentual_alocado(self):
+        """Calcula o percentual alocado do recurso"""
+        if self.quantidade_necessaria > 0:
+            return (self.quantidade_alocada / self.quantidade_necessaria) * 100
+        return 0
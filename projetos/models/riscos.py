@@ -0,0 +1,162 @@
+from django.db import models
+from django.contrib.auth.models import User
+import uuid
+
+from .base import TipoRiscoChoices, ProbabilidadeChoices, ImpactoChoices, NivelRiscoChoices
+from .portfolio import Projeto
+
+# =============================================================================
+# GESTÃO DE RISCOS
+# =============================================================================
+
+# Pesos usados na matriz probabilidade x impacto
+NIVEIS_PROBABILIDADE = {
+    'muito_baixa': 1, 'baixa': 2, 'media': 3, 'alta': 4, 'muito_alta': 5, 'quase_certa': 6
+}
+NIVEIS_IMPACTO = {
+    'muito_baixo': 1, 'baixo': 2, 'medio': 3, 'alto': 4, 'muito_alto': 5
+}
+
+# Riscos que ainda exigem acompanhamento
+STATUS_RISCO_ABERTO = ['identificado', 'em_analise', 'em_tratamento', 'monitorando']
+
+
+def calcular_pontuacao_risco(probabilidade, impacto):
+    """Pontuação na matriz (1 a 30): peso da probabilidade x peso do impacto"""
+    return NIVEIS_PROBABILIDADE.get(probabilidade, 1) * NIVEIS_IMPACTO.get(impacto, 1)
+
+
+def nivel_por_pontuacao(pontuacao):
+    if pontuacao <= 6:
+        return NivelRiscoChoices.BAIXO
+    elif pontuacao <= 15:
+        return NivelRiscoChoices.MEDIO
+    else:
+        return NivelRiscoChoices.ALTO
+
+
+def calcular_nivel_risco(probabilidade, impacto):
+    """Nível (baixo, medio, alto) a partir da probabilidade e do impacto"""
+    return nivel_por_pontuacao(calcular_pontuacao_risco(probabilidade, impacto))
+
+
+class RiscoProjeto(models.Model):
+    """Riscos identificados no projeto"""
+    uuid = models.UUIDField(default=uuid.uuid4, editable=False, unique=True)
+    projeto = models.ForeignKey(
+        Projeto,
+        on_delete=models.CASCADE,
+        related_name='riscos',
+        verbose_name="Projeto"
+    )
+    titulo = models.CharField(max_length=100, verbose_name="Título do Risco")
+    descricao = models.TextField(verbose_name="Descrição do Risco")
+    categoria = models.CharField(
+        max_length=20,
+        choices=TipoRiscoChoices.choices,
+        verbose_name="Categoria"
+    )
+    probabilidade = models.CharField(
+        max_length=15,
+        choices=ProbabilidadeChoices.choices,
+        verbose_name="Probabilidade"
+    )
+    impacto = models.CharField(
+        max_length=15,
+        choices=ImpactoChoices.choices,
+        verbose_name="Impacto"
+    )
+    # Derivados de probabilidade e impacto, gravados no save() para que a
+    # matriz e as contagens por nível sejam feitas no banco. update() e
+    # bulk_create() não passam pelo save() e devem preenchê-los.
+    pontuacao = models.PositiveSmallIntegerField(
+        default=1,
+        editable=False,
+        verbose_name="Pontuação"
+    )
+    nivel = models.CharField(
+        max_length=10,
+        choices=NivelRiscoChoices.choices,
+        default=NivelRiscoChoices.BAIXO,
+        editable=False,
+        verbose_name="Nível"
+    )
+    
+    # Estratégia de resposta
+    estrategia_resposta = models.CharField(
+        max_length=20,
+        choices=[
+            ('evitar', 'Evitar'),
+            ('mitigar', 'Mitigar'),
+            ('transferir', 'Transferir'),
+            ('aceitar', 'Aceitar'),
+        ],
+        verbose_name="Estratégia de Resposta"
+    )
+    plano_resposta = models.TextField(
+        verbose_name="Plano de Resposta",
+        blank=True
+    )
+    responsavel = models.ForeignKey(
+        User,
+        on_delete=models.PROTECT,
+        verbose_name="Responsável"
+    )
+    
+    # Datas
+    data_identificacao = models.DateField(verbose_name="Data de Identificação")
+    data_prazo_resposta = models.DateField(
+        null=True,
+        blank=True,
+        verbose_name="Prazo para Resposta"
+    )
+    
+    # Status
+    status = models.CharField(
+        max_length=20,
+        choices=[
+            ('identificado', 'Identificado'),
+            ('em_analise', 'Em Análise'),
+            ('em_tratamento', 'Em Tratamento'),
+            ('monitorando', 'Monitorando'),
+            ('materializado', 'Materializado'),
+            ('encerrado', 'Encerrado'),
+        ],
+        default='identificado',
+        verbose_name="Status"
+    )
+    
+    ativo = models.BooleanField(default=True, verbose_name="Ativo")
+    criado_em = models.DateTimeField(auto_now_add=True)
+    atualizado_em = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Risco do Projeto"
+        verbose_name_plural = "Riscos do Projeto"
+        ordering = ['-data_identificacao']
+        indexes = [
+            models.Index(
+                fields=['projeto', 'status'],
+                condition=models.Q(ativo=True),
+                name='risco_ativo_projeto_idx',
+            ),
+            models.Index(
+                fields=['nivel', 'status'],
+                condition=models.Q(ativo=True),
+                name='risco_ativo_nivel_idx',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.projeto.codigo} - {self.titulo}"
+
+    def save(self, *args, **kwargs):
+        self.pontuacao = calcular_pontuacao_risco(self.probabilidade, self.impacto)
+        self.nivel = nivel_por_pontuacao(self.pontuacao)
+        if kwargs.get('update_fields') is not None:
+            kwargs['update_fields'] = {*kwargs['update_fields'], 'pontuacao', 'nivel'}
+        super().save(*args, **kwargs)
+
+    def get_nivel_risco(self):
+        """Calcula o nível do risco baseado em probabilidade e impacto"""
+        return calcular_nivel_risco(self.probabilidade, self.impacto)
@@ -0,0 +1,78 @@
+"""Conteúdo do relatório de status do projeto em PDF (renderizado pela fila de core.fila_pdf)"""
+from datetime import date
+
+from . import evm
+from .models import STATUS_PRAZO, Entrega, Marco, Projeto, RiscoProjeto, STATUS_RISCO_ABERTO
+
+_NOMES_PRAZO = dict(STATUS_PRAZO)
+
+
+def _data(valor):
+    return valor.strftime('%d/%m/%Y') if valor else '-'
+
+
+def _indice(valor):
+    return f'{valor:.2f}' if valor is not None else '-'
+
+
+def conteudo_projeto(projeto, hoje=None):
+    """
+    (título, blocos) do status do projeto na data: indicadores, entregas,
+    marcos e riscos abertos. A data não entra nos blocos (a versão do PDF é
+    o hash deles); core.pdf a carimba no rodapé ao renderizar.
+    """
+    hoje = hoje or date.today()
+    gerente = projeto.gerente_projeto
+    indicadores = evm.indicadores_projetos(hoje, Projeto.objects.filter(pk=projeto.pk)).get(projeto.pk)
+
+    campos = [
+        ['Código', projeto.codigo],
+        ['Gerente', gerente.get_full_name() or gerente.username],
+        ['Status', projeto.get_status_display()],
+        ['Prioridade', projeto.get_prioridade_display()],
+        ['Prazo', _NOMES_PRAZO[projeto.get_status_prazo()]],
+        ['Período previsto', f'{_data(projeto.data_inicio_prevista)} a {_data(projeto.data_fim_prevista)}'],
+        ['Conclusão', f'{projeto.percentual_conclusao}%'],
+        ['Orçamento', f'R$ {projeto.orcamento_total:,.2f}'],
+        ['Consumido', f'R$ {projeto.orcamento_consumido:,.2f}'],
+    ]
+    if indicadores:
+        campos += [
+            ['CPI / SPI', f"{_indice(indicadores['cpi'])} / {_indice(indicadores['spi'])}"],
+            ['Estimativa no término', f"R$ {indicadores['eac']:,.2f}"],
+        ]
+
+    entregas = Entrega.objects.filter(projeto=projeto, ativo=True).com_status_prazo(hoje).order_by(
+        'data_prevista', 'nome',
+    )
+    marcos = Marco.objects.filter(projeto=projeto, ativo=True).order_by('data_prevista')
+    riscos = RiscoProjeto.objects.filter(
+        projeto=projeto, ativo=True, status__in=STATUS_RISCO_ABERTO,
+    ).select_related('responsavel').order_by('-pontuacao', 'titulo')
+
+    blocos = [
+        ['titulo', f'{projeto.codigo} - {projeto.nome}'],
+        ['campos', campos],
+        ['subtitulo', 'Entregas'],
+        ['tabela', ['Entrega', 'Prevista', 'Entregue', 'Status', 'Prazo'], [
+            [
+                entrega.nome, _data(entrega.data_prevista), _data(entrega.data_entrega),
+                entrega.get_status_display(), _NOMES_PRAZO[entrega.status_prazo],
+            ]
+            for entrega in entregas
+        ]],
+        ['subtitulo', 'Marcos'],
+        ['tabela', ['Marco', 'Previsto', 'Realizado', 'Status'], [
+            [marco.nome, _data(marco.data_prevista), _data(marco.data_real), marco.get_status_display()]
+            for marco in marcos
+        ]],
+        ['subtitulo', 'Riscos em aberto'],
+        ['tabela', ['Risco', 'Nível', 'Status', 'Responsável'], [
+            [
+                risco.titulo, risco.get_nivel_display(), risco.get_status_display(),
+                risco.responsavel.get_full_name() or risco.responsavel.username,
+            ]
+            for risco in riscos
+        ]],
+    ]
+    return f'Projeto {projeto.codigo}', blocos
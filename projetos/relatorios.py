@@ -0,0 +1,341 @@
+"""
+Relatórios de portfólio, programa e projeto.
+
+Os projetos do relatório são lidos em lotes ordenados por código, com
+paginação por chave (sem OFFSET). Cada lote traz em três consultas os
+projetos (com portfólio, programa e gerente) e as entregas e riscos ativos
+deles, por prefetch. As linhas saem de geradores e são escritas em CSV,
+XLSX ou HTML conforme a resposta é enviada. A memória usada é a de um lote,
+qualquer que seja o tamanho do relatório.
+"""
+from datetime import date
+
+from django.db.models import Prefetch, Q
+from django.http import StreamingHttpResponse
+from django.template.loader import render_to_string
+from django.utils.safestring import mark_safe
+
+from core.planilhas import celula_segura
+
+from .models import (
+    STATUS_PRAZO, STATUS_RISCO_ABERTO, Entrega, NivelRiscoChoices, Projeto, RiscoProjeto,
+)
+
+TAMANHO_LOTE = 500
+
+COLUNAS = [
+    ('codigo', 'Código'),
+    ('nome', 'Projeto'),
+    ('portfolio', 'Portfólio'),
+    ('programa', 'Programa'),
+    ('gerente', 'Gerente'),
+    ('status', 'Status'),
+    ('prioridade', 'Prioridade'),
+    ('prazo', 'Prazo'),
+    ('percentual_conclusao', '% Concluído'),
+    ('data_inicio_prevista', 'Início Previsto'),
+    ('data_fim_prevista', 'Fim Previsto'),
+    ('data_fim_real', 'Fim Real'),
+    ('orcamento_total', 'Orçamento'),
+    ('orcamento_consumido', 'Consumido'),
+    ('entregas', 'Entregas'),
+    ('entregas_concluidas', 'Entregas Concluídas'),
+    ('entregas_atrasadas', 'Entregas Atrasadas'),
+    ('riscos_abertos', 'Riscos Abertos'),
+    ('riscos_altos', 'Riscos Altos'),
+]
+
+FORMATOS = {
+    'html': 'text/html; charset=utf-8',
+    'csv': 'text/csv; charset=utf-8',
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+}
+
+# Marca do ponto da página em que as linhas são inseridas
+MARCADOR_LINHAS = '<!-- linhas do relatório -->'
+
+# Rótulos das choices resolvidos uma vez (get_FOO_display refaz a busca a cada linha)
+_NOMES_PRAZO = dict(STATUS_PRAZO)
+_NOMES_STATUS = dict(Projeto._meta.get_field('status').flatchoices)
+_NOMES_PRIORIDADE = dict(Projeto._meta.get_field('prioridade').flatchoices)
+
+
+def projetos_do_relatorio(tipo, objeto):
+    """Projetos ativos cobertos pelo relatório de um portfólio, programa ou projeto"""
+    projetos = Projeto.objects.filter(ativo=True)
+    if tipo == 'portfolio':
+        return projetos.filter(Q(portfolio=objeto) | Q(programa__portfolio=objeto))
+    if tipo == 'programa':
+        return projetos.filter(programa=objeto)
+    return projetos.filter(pk=objeto.pk)
+
+
+def lotes(projetos, hoje=None, tamanho_lote=TAMANHO_LOTE):
+    """Listas de até tamanho_lote projetos, em ordem de código, com entregas e riscos carregados"""
+    hoje = hoje or date.today()
+    # Só as colunas usadas no relatório: descrições e textos longos ficam no banco
+    entregas = Entrega.objects.filter(ativo=True).com_status_prazo(hoje).only(
+        'projeto_id', 'nome', 'status', 'data_prevista', 'data_entrega',
+    ).order_by('data_prevista', 'id')
+    riscos = RiscoProjeto.objects.filter(ativo=True).only(
+        'projeto_id', 'titulo', 'status', 'nivel', 'pontuacao',
+    ).order_by('-pontuacao', 'id')
+    consulta = projetos.com_status_prazo(hoje).select_related(
+        'portfolio', 'programa', 'gerente_projeto',
+    ).only(
+        'codigo', 'nome', 'status', 'prioridade', 'percentual_conclusao',
+        'data_inicio_prevista', 'data_fim_prevista', 'data_fim_real',
+        'orcamento_total', 'orcamento_consumido',
+        'portfolio__nome', 'programa__nome',
+        'gerente_projeto__username', 'gerente_projeto__first_name', 'gerente_projeto__last_name',
+    ).prefetch_related(
+        Prefetch('entregas', queryset=entregas, to_attr='entregas_ativas'),
+        Prefetch('riscos', queryset=riscos, to_attr='riscos_ativos'),
+    ).order_by('codigo')
+
+    ultimo = None
+    while True:
+        pagina = consulta if ultimo is None else consulta.filter(codigo__gt=ultimo)
+        lote = list(pagina[:tamanho_lote])
+        if not lote:
+            return
+        yield lote
+        ultimo = lote[-1].codigo
+
+
+def linha_projeto(projeto):
+    """Valores das COLUNAS de um projeto vindo de lotes()"""
+    riscos_abertos = [risco for risco in projeto.riscos_ativos if risco.status in STATUS_RISCO_ABERTO]
+    gerente = projeto.gerente_projeto
+    return {
+        'codigo': projeto.codigo,
+        'nome': projeto.nome,
+        'portfolio': projeto.portfolio.nome if projeto.portfolio else '',
+        'programa': projeto.programa.nome if projeto.programa else '',
+        'gerente': gerente.get_full_name() or gerente.username,
+        'status': _NOMES_STATUS.get(projeto.status, projeto.status),
+        'prioridade': _NOMES_PRIORIDADE.get(projeto.prioridade, projeto.prioridade),
+        'prazo': _NOMES_PRAZO.get(projeto.status_prazo, ''),
+        'percentual_conclusao': projeto.percentual_conclusao,
+        'data_inicio_prevista': projeto.data_inicio_prevista,
+        'data_fim_prevista': projeto.data_fim_prevista,
+        'data_fim_real': projeto.data_fim_real,
+        'orcamento_total': projeto.orcamento_total,
+        'orcamento_consumido': projeto.orcamento_consumido,
+        'entregas': len(projeto.entregas_ativas),
+        'entregas_concluidas': sum(entrega.status == 'entregue' for entrega in projeto.entregas_ativas),
+        'entregas_atrasadas': sum(
+            entrega.status_prazo == 'atrasado' for entrega in projeto.entregas_ativas
+        ),
+        'riscos_abertos': len(riscos_abertos),
+        'riscos_altos': sum(risco.nivel == NivelRiscoChoices.ALTO for risco in riscos_abertos),
+    }
+
+
+def linhas(tipo, objeto, hoje=None, tamanho_lote=TAMANHO_LOTE):
+    """(projeto, linha) de cada projeto do relatório, lote a lote"""
+    for lote in lotes(projetos_do_relatorio(tipo, objeto), hoje, tamanho_lote):
+        for projeto in lote:
+            yield projeto, linha_projeto(projeto)
+
+
+# =============================================================================
+# FORMATOS
+# =============================================================================
+
+class _Eco:
+    """Destino do csv.writer: writerow devolve a linha em vez de guardá-la"""
+
+    def write(self, valor):
+        return valor
+
+
+class _Buffer:
+    """Arquivo binário só de escrita cujo conteúdo é retirado a cada pedaço gerado"""
+
+    def __init__(self):
+        self.partes = []
+
+    def write(self, dados):
+        self.partes.append(bytes(dados))
+        return len(dados)
+
+    def flush(self):
+        pass
+
+    def retirar(self):
+        dados = b''.join(self.partes)
+        self.partes = []
+        return dados
+
+
+def _texto(valor):
+    if valor is None:
+        return ''
+    if isinstance(valor, date):
+        return valor.strftime('%d/%m/%Y')
+    return str(valor)
+
+
+def gerar_csv(tipo, objeto, hoje=None):
+    """Pedaços (bytes) do CSV; o BOM faz o Excel abrir o arquivo como UTF-8"""
+    # csv e zipfile são importados só na geração: este módulo é carregado
+    # com as views, e eles não precisam pesar no boot
+    import csv
+
+    escritor = csv.writer(_Eco(), delimiter=';')
+    yield ('\ufeff' + escritor.writerow([titulo for _, titulo in COLUNAS])).encode('utf-8')
+    for _, linha in linhas(tipo, objeto, hoje):
+        yield escritor.writerow(
+            [_texto(celula_segura(linha[chave])) for chave, _ in COLUNAS]
+        ).encode('utf-8')
+
+
+# Partes fixas de uma pasta de trabalho XLSX com uma planilha; o estilo 1
+# formata as datas (número de série a partir de 30/12/1899)
+_XLSX_FIXOS = {
+    '[Content_Types].xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '<Override PartName="/xl/styles.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+        '</Types>'
+    ),
+    '_rels/.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+        'Target="xl/workbook.xml"/>'
+        '</Relationships>'
+    ),
+    'xl/workbook.xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<sheets><sheet name="Projetos" sheetId="1" r:id="rId1"/></sheets>'
+        '</workbook>'
+    ),
+    'xl/_rels/workbook.xml.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+        'Target="worksheets/sheet1.xml"/>'
+        '<Relationship Id="rId2" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+        'Target="styles.xml"/>'
+        '</Relationships>'
+    ),
+    'xl/styles.xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+        '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+        '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+        '<fill><patternFill patternType="gray125"/></fill></fills>'
+        '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+        '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+        '<cellXfs count="2"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+        '<xf numFmtId="14" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/></cellXfs>'
+        '</styleSheet>'
+    ),
+}
+
+_INICIO_PLANILHA = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+)
+_FIM_PLANILHA = '</sheetData></worksheet>'
+_ORIGEM_DATAS = date(1899, 12, 30).toordinal()
+
+
+def _escapar(texto):
+    # O mesmo que xml.sax.saxutils.escape, sem importar o pacote xml no boot
+    return texto.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+
+def _celula(valor):
+    if valor is None or valor == '':
+        return '<c/>'
+    if isinstance(valor, date):
+        return f'<c s="1"><v>{valor.toordinal() - _ORIGEM_DATAS}</v></c>'
+    if isinstance(valor, str):
+        return f'<c t="inlineStr"><is><t>{_escapar(valor)}</t></is></c>'
+    return f'<c><v>{valor}</v></c>'
+
+
+def _linha_xlsx(valores):
+    return ('<row>' + ''.join(_celula(valor) for valor in valores) + '</row>').encode('utf-8')
+
+
+def gerar_xlsx(tipo, objeto, hoje=None):
+    """
+    Pedaços (bytes) de um XLSX mínimo, sem dependências: o zip é escrito
+    sem seek (descritores de dados após cada arquivo) e a planilha é
+    comprimida linha a linha.
+    """
+    import zipfile
+
+    buffer = _Buffer()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as pacote:
+        for nome, conteudo in _XLSX_FIXOS.items():
+            pacote.writestr(nome, conteudo)
+        yield buffer.retirar()
+
+        with pacote.open('xl/worksheets/sheet1.xml', 'w') as planilha:
+            planilha.write(_INICIO_PLANILHA.encode('utf-8'))
+            planilha.write(_linha_xlsx([titulo for _, titulo in COLUNAS]))
+            for _, linha in linhas(tipo, objeto, hoje):
+                planilha.write(_linha_xlsx([linha[chave] for chave, _ in COLUNAS]))
+                dados = buffer.retirar()
+                if dados:
+                    yield dados
+            planilha.write(_FIM_PLANILHA.encode('utf-8'))
+    yield buffer.retirar()
+
+
+def gerar_html(tipo, objeto, hoje=None):
+    """
+    Pedaços (str) da página: o template do relatório é renderizado uma vez
+    com o marcador no lugar das linhas, e cada lote de projetos é renderizado
+    à parte e enviado entre o começo e o fim da página.
+    """
+    pagina = render_to_string(f'projetos/relatorios/{tipo}.html', {
+        tipo: objeto,
+        'colunas': COLUNAS,
+        'gerado_em': hoje or date.today(),
+        'linhas': mark_safe(MARCADOR_LINHAS),
+    })
+    inicio, fim = pagina.split(MARCADOR_LINHAS, 1)
+    yield inicio
+
+    for lote in lotes(projetos_do_relatorio(tipo, objeto), hoje):
+        yield render_to_string('projetos/relatorios/_linhas.html', {
+            'linhas': [(projeto, linha_projeto(projeto)) for projeto in lote],
+            'total_colunas': len(COLUNAS),
+            'detalhado': tipo == 'projeto',
+        })
+    yield fim
+
+
+GERADORES = {'html': gerar_html, 'csv': gerar_csv, 'xlsx': gerar_xlsx}
+
+
+def nome_arquivo(tipo, objeto, formato, hoje=None):
+    return f'relatorio-{tipo}-{objeto.codigo}-{(hoje or date.today()).isoformat()}.{formato}'
+
+
+def resposta(tipo, objeto, formato='html', pedacos=None):
+    """StreamingHttpResponse do relatório no formato pedido (html, csv ou xlsx)"""
+    if pedacos is None:
+        pedacos = GERADORES[formato](tipo, objeto)
+    response = StreamingHttpResponse(pedacos, content_type=FORMATOS[formato])
+    if formato != 'html':
+        response['Content-Disposition'] = f'attachment; filename="{nome_arquivo(tipo, objeto, formato)}"'
+    return response
@@ -0,0 +1,50 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from . import alocacao, caminho_critico
+from .models import DependenciaCronograma, Entrega, EquipeProjeto, FaseProjeto, Projeto
+
+# O cronograma (caminho crítico) de cada projeto fica em cache: mudanças de
+# data ou duração são aplicadas de forma incremental; mudanças na estrutura
+# do grafo (nós ou dependências criados, removidos ou desativados) descartam
+# o cronograma do projeto, que é recalculado no próximo acesso.
+
+
+@receiver(post_save, sender=FaseProjeto)
+def atualizar_cronograma_fase(sender, instance, created, **kwargs):
+    if created or not instance.ativo:
+        caminho_critico.invalidar(instance.projeto_id)
+        return
+    caminho_critico.atualizar_no(
+        instance.projeto_id, f'f{instance.pk}',
+        **caminho_critico.no_fase(instance.data_inicio_prevista, instance.data_fim_prevista),
+    )
+
+
+@receiver(post_save, sender=Entrega)
+def atualizar_cronograma_entrega(sender, instance, created, **kwargs):
+    if created or not instance.ativo:
+        caminho_critico.invalidar(instance.projeto_id)
+        return
+    caminho_critico.atualizar_no(
+        instance.projeto_id, f'e{instance.pk}',
+        **caminho_critico.no_entrega(instance.data_prevista, instance.duracao_dias),
+    )
+
+
+@receiver(post_delete, sender=FaseProjeto)
+@receiver(post_delete, sender=Entrega)
+@receiver(post_save, sender=DependenciaCronograma)
+@receiver(post_delete, sender=DependenciaCronograma)
+def invalidar_cronograma(sender, instance, **kwargs):
+    caminho_critico.invalidar(instance.projeto_id)
+
+
+# Os conflitos de alocação são calculados para todas as equipes de uma vez;
+# qualquer mudança de equipe (ou de projeto ativo/inativo) descarta o resultado
+@receiver(post_save, sender=EquipeProjeto)
+@receiver(post_delete, sender=EquipeProjeto)
+@receiver(post_save, sender=Projeto)
+@receiver(post_delete, sender=Projeto)
+def invalidar_alocacao(sender, **kwargs):
+    alocacao.invalidar()
@@ -0,0 +1,140 @@
+"""
+Histórico diário dos projetos (SnapshotProjeto).
+
+O comando registrar_snapshots grava uma linha compacta por projeto ativo e
+por dia; os endpoints de tendência leem as séries já prontas em vez de
+recalcular todos os projetos a partir das tabelas vivas.
+"""
+from collections import Counter
+from datetime import date
+from decimal import Decimal
+
+from django.db import connection
+from django.db.models import Avg, Count, Q, Sum
+
+from . import evm
+from .models import (
+    RiscoProjeto, SnapshotProjeto, StatusChoices, NivelRiscoChoices,
+    STATUS_RISCO_ABERTO,
+)
+
+CAMPOS_ATUALIZADOS = [
+    'status', 'percentual_conclusao', 'pv', 'ev', 'ac', 'eac', 'vac', 'cpi', 'spi',
+    'riscos_abertos', 'riscos_altos',
+]
+
+
+def contar_riscos():
+    """({projeto_id: riscos abertos}, {projeto_id: riscos altos abertos}) em uma consulta"""
+    abertos, altos = Counter(), Counter()
+    riscos = RiscoProjeto.objects.filter(
+        ativo=True, status__in=STATUS_RISCO_ABERTO,
+    ).values('projeto_id').annotate(
+        abertos=Count('id'),
+        altos=Count('id', filter=Q(nivel=NivelRiscoChoices.ALTO)),
+    ).order_by()
+
+    for linha in riscos:
+        abertos[linha['projeto_id']] = linha['abertos']
+        altos[linha['projeto_id']] = linha['altos']
+    return abertos, altos
+
+
+def _dinheiro(valor):
+    return Decimal(f'{valor:.2f}')
+
+
+def registrar_snapshots(data=None, tamanho_lote=2000):
+    """
+    Grava (ou atualiza) o snapshot do dia de cada projeto ativo. A gravação
+    é um upsert por (projeto, data): reexecutar no mesmo dia substitui os
+    valores sem duplicar linhas. Retorna quantos snapshots foram gravados.
+    """
+    data = data or date.today()
+    colunas = evm.carregar_colunas(extras=('status', 'percentual_conclusao'))
+    metricas = evm.calcular(colunas, data)
+    abertos, altos = contar_riscos()
+
+    snapshots = []
+    for posicao, projeto_id in enumerate(colunas['id']):
+        projeto_id = int(projeto_id)
+        snapshots.append(SnapshotProjeto(
+            projeto_id=projeto_id,
+            data=data,
+            status=colunas['status'][posicao],
+            percentual_conclusao=colunas['percentual_conclusao'][posicao],
+            pv=_dinheiro(metricas['pv'][posicao]),
+            ev=_dinheiro(metricas['ev'][posicao]),
+            ac=_dinheiro(metricas['ac'][posicao]),
+            eac=_dinheiro(metricas['eac'][posicao]),
+            vac=_dinheiro(metricas['vac'][posicao]),
+            cpi=evm.arredondar_indice(float(metricas['cpi'][posicao])),
+            spi=evm.arredondar_indice(float(metricas['spi'][posicao])),
+            riscos_abertos=abertos[projeto_id],
+            riscos_altos=altos[projeto_id],
+        ))
+
+    # O MySQL resolve o conflito por qualquer chave única e não aceita unique_fields
+    alvo = {}
+    if connection.features.supports_update_conflicts_with_target:
+        alvo['unique_fields'] = ['projeto', 'data']
+
+    SnapshotProjeto.objects.bulk_create(
+        snapshots,
+        batch_size=tamanho_lote,
+        update_conflicts=True,
+        update_fields=CAMPOS_ATUALIZADOS,
+        **alvo,
+    )
+    return len(snapshots)
+
+
+def serie_tendencias(inicio, fim, portfolio=None, programa=None, projeto=None):
+    """
+    Série diária agregada entre `inicio` e `fim` (inclusive), opcionalmente
+    restrita a um portfólio, programa ou projeto.
+    """
+    snapshots = SnapshotProjeto.objects.filter(data__range=(inicio, fim))
+    if projeto is not None:
+        snapshots = snapshots.filter(projeto=projeto)
+    if programa is not None:
+        snapshots = snapshots.filter(projeto__programa=programa)
+    if portfolio is not None:
+        snapshots = snapshots.filter(
+            Q(projeto__portfolio=portfolio) | Q(projeto__programa__portfolio=portfolio)
+        )
+
+    por_status = {
+        f'status_{valor}': Count('id', filter=Q(status=valor))
+        for valor in StatusChoices.values
+    }
+    linhas = snapshots.values('data').annotate(
+        projetos=Count('id'),
+        percentual_medio=Avg('percentual_conclusao'),
+        pv=Sum('pv'),
+        ev=Sum('ev'),
+        ac=Sum('ac'),
+        eac=Sum('eac'),
+        riscos_abertos=Sum('riscos_abertos'),
+        riscos_altos=Sum('riscos_altos'),
+        **por_status,
+    ).order_by('data')
+
+    serie = []
+    for linha in linhas:
+        pv, ev, ac = (float(linha[campo] or 0) for campo in ('pv', 'ev', 'ac'))
+        serie.append({
+            'data': linha['data'].isoformat(),
+            'projetos': linha['projetos'],
+            'percentual_medio': round(linha['percentual_medio'] or 0, 1),
+            'pv': pv,
+            'ev': ev,
+            'ac': ac,
+            'eac': float(linha['eac'] or 0),
+            'cpi': round(ev / ac, 4) if ac else None,
+            'spi': round(ev / pv, 4) if pv else None,
+            'riscos_abertos': linha['riscos_abertos'] or 0,
+            'riscos_altos': linha['riscos_altos'] or 0,
+            'status': {valor: linha[f'status_{valor}'] for valor in StatusChoices.values},
+        })
+    return serie
@@ -1,3 +1,780 @@
-from django.test import TestCase
+from array import array
+import csv
+from datetime import date, timedelta
+import io
+import math
+import tempfile
+from unittest import mock, skipUnless
+import zipfile
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.core.cache import cache
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+
+from core import pdf
+from core.models import TarefaPDF
+from . import alocacao, artefatos, caminho_critico, evm, relatorios, snapshots, unidades
+from . import pdf as projetos_pdf
+from .models import (
+    STATUS_RISCO_ABERTO, CategoriaEstrategica, DependenciaCronograma, Entrega, EquipeProjeto,
+    FaseProjeto, HierarquiaUnidade, Marco, Portfolio, Programa, Projeto, RiscoProjeto, SnapshotProjeto, TipoProjeto, UnidadeOrganizacional,
+)
+
+
+@skipUnless(connection.vendor == 'sqlite', 'Plano de execução verificado no SQLite')
+class IndicesConsultasTests(TestCase):
+    """As consultas mais frequentes do dashboard e das listagens usam índice"""
+
+    def assertUsaIndice(self, queryset, indice):
+        plano = queryset.explain()
+        self.assertIn(f'USING INDEX {indice}', plano, plano)
+
+    def test_projetos_ativos_por_status(self):
+        self.assertUsaIndice(
+            Projeto.objects.filter(ativo=True, status='em_execucao'),
+            'projeto_ativo_status_idx',
+        )
+
+    def test_projetos_atrasados(self):
+        # O IN em status é mais seletivo que o intervalo de data_fim_prevista
+        self.assertUsaIndice(
+            Projeto.objects.filter(
+                ativo=True,
+                data_fim_prevista__lt=date.today(),
+                status__in=['em_execucao', 'em_planejamento', 'em_monitoramento'],
+            ),
+            'projeto_ativo_status_idx',
+        )
+
+    def test_listagem_ordenada_por_prioridade(self):
+        self.assertUsaIndice(
+            Projeto.objects.filter(ativo=True).order_by('-prioridade', 'nome'),
+            'projeto_ativo_ordem_idx',
+        )
+
+    def test_projetos_em_atencao(self):
+        self.assertUsaIndice(
+            Projeto.objects.filter(ativo=True).por_status_prazo('atencao'),
+            'projeto_ativo_prazo_idx',
+        )
+
+    def test_riscos_altos_em_aberto(self):
+        self.assertUsaIndice(
+            RiscoProjeto.objects.filter(ativo=True, nivel='alto', status__in=STATUS_RISCO_ABERTO),
+            'risco_ativo_nivel_idx',
+        )
+
+    def test_riscos_ativos_do_projeto(self):
+        self.assertUsaIndice(
+            RiscoProjeto.objects.filter(
+                ativo=True, projeto_id=1, status__in=['identificado', 'em_analise'],
+            ),
+            'risco_ativo_projeto_idx',
+        )
+
+
+class EVMTests(SimpleTestCase):
+    """Cálculo dos indicadores de valor agregado (projetos.evm)"""
+
+    def colunas(self, hoje):
+        # Dois projetos do portfólio 1 e um sem portfólio, todos com 100 dias de prazo
+        inicio = hoje.toordinal() - 50
+        return {
+            'id': array('q', [1, 2, 3]),
+            'programa': array('q', [evm.SEM_GRUPO] * 3),
+            'portfolio': array('q', [1, 1, evm.SEM_GRUPO]),
+            'inicio': array('q', [inicio] * 3),
+            'fim': array('q', [inicio + 100] * 3),
+            'bac': array('d', [1000.0, 2000.0, 500.0]),
+            'ac': array('d', [500.0, 0.0, 100.0]),
+            'percentual': array('d', [40.0, 50.0, 0.0]),
+        }
+
+    def test_indicadores(self):
+        cpi, spi, eac, vac = evm.indicadores(bac=1000, pv=500, ev=400, ac=500)
+        self.assertAlmostEqual(cpi, 0.8)
+        self.assertAlmostEqual(spi, 0.8)
+        self.assertAlmostEqual(eac, 1250)
+        self.assertAlmostEqual(vac, -250)
+
+    def test_indicadores_sem_custo_lancado(self):
+        cpi, spi, eac, vac = evm.indicadores(bac=1000, pv=0, ev=0, ac=0)
+        self.assertTrue(math.isnan(cpi))
+        self.assertTrue(math.isnan(spi))
+        self.assertEqual((eac, vac), (1000, 0))
+
+    @mock.patch.object(evm, 'np', None)
+    def test_calcular_sem_numpy(self):
+        hoje = date(2025, 6, 1)
+        metricas = evm.calcular(self.colunas(hoje), hoje)
+        self.assertAlmostEqual(metricas['pv'][0], 500)
+        self.assertAlmostEqual(metricas['ev'][0], 400)
+        self.assertAlmostEqual(metricas['eac'][0], 1250)
+        self.assertEqual(metricas['eac'][1], 2000)
+        # Custo sem avanço: EAC = AC + BAC
+        self.assertEqual(metricas['eac'][2], 600)
+
+    @mock.patch.object(evm, 'np', None)
+    def test_consolidar_por_portfolio(self):
+        hoje = date(2025, 6, 1)
+        colunas = self.colunas(hoje)
+        totais = evm.consolidar(colunas['portfolio'], evm.calcular(colunas, hoje))
+
+        self.assertEqual(list(totais), [1])
+        self.assertEqual(totais[1]['projetos'], 2)
+        self.assertAlmostEqual(totais[1]['ev'], 1400)
+        self.assertAlmostEqual(totais[1]['cpi'], 2.8)
+        self.assertAlmostEqual(totais[1]['spi'], 1400 / 1500, places=4)
+
+    @skipUnless(evm._numpy() is not None, 'NumPy não instalado')
+    def test_numpy_e_array_coincidem(self):
+        np = evm._numpy()
+        hoje = date(2025, 6, 1)
+        colunas = self.colunas(hoje)
+        with mock.patch.object(evm, 'np', None):
+            esperado = evm.consolidar(colunas['portfolio'], evm.calcular(colunas, hoje))
+
+        colunas_numpy = {
+            nome: np.array(valores, dtype=np.float64 if valores.typecode == 'd' else np.int64)
+            for nome, valores in colunas.items()
+        }
+        obtido = evm.consolidar(colunas_numpy['portfolio'], evm.calcular(colunas_numpy, hoje))
+        for nome, valor in esperado[1].items():
+            self.assertAlmostEqual(obtido[1][nome], valor)
+
+
+class SnapshotTests(TestCase):
+    """Snapshots diários (projetos.snapshots)"""
+
+    @classmethod
+    def setUpTestData(cls):
+        usuario = User.objects.create_user('gerente')
+        tipo = TipoProjeto.objects.create(nome='Pesquisa', prefixo='PES', metodologia_sugerida='agil')
+        cls.projeto = Projeto.objects.create(
+            nome='Projeto', descricao='-', codigo='PES-001', tipo_projeto=tipo,
+            gerente_projeto=usuario, patrocinador=usuario,
+            objetivos='-', escopo_produto='-', escopo_trabalho='-',
+            orcamento_total=1000, orcamento_consumido=500, percentual_conclusao=40,
+            data_inicio_prevista=date(2025, 1, 1), data_fim_prevista=date(2025, 4, 11),
+            status='em_execucao',
+        )
+        for probabilidade, impacto, status in (
+            ('muito_alta', 'muito_alto', 'identificado'),
+            ('baixa', 'baixo', 'monitorando'),
+            ('muito_alta', 'muito_alto', 'encerrado'),
+        ):
+            RiscoProjeto.objects.create(
+                projeto=cls.projeto, titulo='Risco', descricao='-', categoria='tecnico',
+                probabilidade=probabilidade, impacto=impacto, estrategia_resposta='mitigar',
+                responsavel=usuario, data_identificacao=date(2025, 1, 1), status=status,
+            )
+
+    def test_registrar_snapshots_e_idempotente(self):
+        dia = date(2025, 2, 20)
+        self.assertEqual(snapshots.registrar_snapshots(dia), 1)
+
+        Projeto.objects.filter(pk=self.projeto.pk).update(percentual_conclusao=60)
+        self.assertEqual(snapshots.registrar_snapshots(dia), 1)
+
+        snapshot = SnapshotProjeto.objects.get(projeto=self.projeto, data=dia)
+        self.assertEqual(SnapshotProjeto.objects.count(), 1)
+        self.assertEqual(snapshot.percentual_conclusao, 60)
+        self.assertEqual(snapshot.status, 'em_execucao')
+        self.assertEqual((snapshot.riscos_abertos, snapshot.riscos_altos), (2, 1))
+
+    def test_api_evm_carrega_colunas_uma_vez(self):
+        self.client.force_login(self.projeto.gerente_projeto)
+        with mock.patch.object(evm, 'carregar_colunas', wraps=evm.carregar_colunas) as carregar:
+            resposta = self.client.get('/projetos/api/evm/')
+        self.assertEqual(resposta.status_code, 200)
+        self.assertEqual(carregar.call_count, 1)
+
+    def test_pdf_montado_so_quando_pedido(self):
+        # Depois do fim previsto PV e status do prazo não mudam: a versão também não
+        versoes = {
+            pdf.versao_conteudo(projetos_pdf.conteudo_projeto(self.projeto, dia)[1])
+            for dia in (date(2025, 5, 1), date(2025, 5, 2))
+        }
+        self.assertEqual(len(versoes), 1)
+
+        self.client.force_login(self.projeto.gerente_projeto)
+        self.assertEqual(self.client.get(f'/projetos/projetos/{self.projeto.uuid}/').status_code, 200)
+        self.assertFalse(TarefaPDF.objects.exists())
+
+        self.client.get(f'/projetos/relatorios/projeto/{self.projeto.uuid}/pdf/')
+        self.assertEqual(TarefaPDF.objects.filter(tipo='projeto').count(), 1)
+
+    def test_nivel_gravado_no_save(self):
+        risco = self.projeto.riscos.get(status='identificado')
+        self.assertEqual((risco.pontuacao, risco.nivel), (25, 'alto'))
+
+        risco.impacto = 'baixo'
+        risco.save(update_fields=['impacto'])
+        risco.refresh_from_db()
+        self.assertEqual((risco.pontuacao, risco.nivel), (10, 'medio'))
+
+    def test_matriz_riscos(self):
+        gestor = self.projeto.gerente_projeto
+        portfolio = Portfolio.objects.create(
+            nome='Inovação', descricao='-', codigo='INO', gestor_portfolio=gestor, patrocinador=gestor,
+            unidade_organizacional=UnidadeOrganizacional.objects.create(nome='Diretoria', sigla='DIR'),
+            categoria_estrategica=CategoriaEstrategica.objects.create(nome='Inovação'),
+            data_inicio=date(2025, 1, 1), data_fim_prevista=date(2025, 12, 31),
+        )
+        Projeto.objects.filter(pk=self.projeto.pk).update(portfolio=portfolio)
+        self.client.force_login(self.projeto.gerente_projeto)
+
+        resposta = self.client.get('/projetos/api/matriz-riscos/', {'portfolio': str(portfolio.uuid)})
+        dados = resposta.json()
+        self.assertEqual(len(dados['pontuacao']), 6)
+        self.assertEqual(len(dados['pontuacao'][0]), 5)
+        [matriz] = dados['portfolios']
+        self.assertEqual(matriz['nome'], 'Inovação')
+        # O risco encerrado não entra na matriz
+        self.assertEqual(matriz['total'], 2)
+        self.assertEqual(matriz['matriz'][4][4], 1)
+        self.assertEqual(matriz['matriz'][1][1], 1)
+
+    def test_matriz_riscos_com_dados_invalidos(self):
+        self.client.force_login(self.projeto.gerente_projeto)
+        resposta = self.client.get('/projetos/api/matriz-riscos/', {'portfolio': 'nao-e-uuid'})
+        self.assertEqual(resposta.status_code, 400)
+
+        # Valor fora das escolhas gravado direto no banco fica fora da matriz
+        self.projeto.riscos.filter(probabilidade='baixa').update(probabilidade='desconhecida')
+        resposta = self.client.get('/projetos/api/matriz-riscos/')
+        self.assertEqual(resposta.status_code, 200)
+        [matriz] = resposta.json()['portfolios']
+        self.assertEqual(matriz['total'], 1)
+
+    def test_serie_tendencias(self):
+        for dia in (date(2025, 2, 19), date(2025, 2, 20)):
+            snapshots.registrar_snapshots(dia)
+
+        serie = snapshots.serie_tendencias(date(2025, 2, 1), date(2025, 2, 28), projeto=self.projeto)
+        self.assertEqual([ponto['data'] for ponto in serie], ['2025-02-19', '2025-02-20'])
+        self.assertEqual(serie[-1]['projetos'], 1)
+        self.assertEqual(serie[-1]['status']['em_execucao'], 1)
+        self.assertEqual(serie[-1]['cpi'], 0.8)
+
+    def test_api_tendencias_valida_uuid(self):
+        self.client.force_login(self.projeto.gerente_projeto)
+        resposta = self.client.get('/projetos/api/tendencias/', {'projeto': 'nao-e-uuid'})
+        self.assertEqual(resposta.status_code, 400)
+        self.assertIn('projeto', resposta.json()['error'])
+
+        resposta = self.client.get('/projetos/api/tendencias/', {'projeto': str(self.projeto.uuid)})
+        self.assertEqual(resposta.status_code, 200)
+
+
+class StatusPrazoTests(TestCase):
+    """status_prazo anotado no banco segue as regras de get_status_prazo"""
+
+    @classmethod
+    def setUpTestData(cls):
+        usuario = User.objects.create_user('gerente')
+        tipo = TipoProjeto.objects.create(nome='Pesquisa', prefixo='PES', metodologia_sugerida='agil')
+        hoje = date.today()
+        # (dias até o fim previsto, status, dias de atraso na conclusão)
+        casos = [
+            (-10, 'em_execucao', None), (0, 'em_execucao', None), (3, 'em_execucao', None),
+            (7, 'em_execucao', None), (30, 'em_planejamento', None),
+            (-10, 'concluido', 0), (-10, 'concluido', 5), (-10, 'concluido', None),
+        ]
+        for numero, (dias, status, atraso) in enumerate(casos):
+            fim = hoje + timedelta(days=dias)
+            projeto = Projeto.objects.create(
+                nome=f'Projeto {numero}', descricao='-', codigo=f'PES-{numero:03}', tipo_projeto=tipo,
+                gerente_projeto=usuario, patrocinador=usuario,
+                objetivos='-', escopo_produto='-', escopo_trabalho='-',
+                orcamento_total=1000, data_inicio_prevista=fim - timedelta(days=100),
+                data_fim_prevista=fim, status=status,
+                data_fim_real=None if atraso is None else fim + timedelta(days=atraso),
+            )
+            Entrega.objects.create(
+                projeto=projeto, nome='Entrega', descricao='-', responsavel=usuario,
+                data_prevista=fim, status='entregue' if status == 'concluido' else 'em_desenvolvimento',
+                data_entrega=projeto.data_fim_real,
+            )
+            Marco.objects.create(
+                projeto=projeto, nome='Marco', descricao='-', data_prevista=fim,
+                status='atingido' if status == 'concluido' else 'pendente',
+                data_real=projeto.data_fim_real,
+            )
+
+    def assertMesmoStatus(self, modelo):
+        anotados = dict(modelo.objects.com_status_prazo().values_list('pk', 'status_prazo'))
+        for objeto in modelo.objects.all():
+            self.assertEqual(anotados[objeto.pk], objeto.get_status_prazo(), objeto)
+
+    def test_projetos(self):
+        self.assertMesmoStatus(Projeto)
+        self.assertEqual(
+            Projeto.objects.por_status_prazo('atrasado').count(),
+            Projeto.objects.com_status_prazo().filter(status_prazo='atrasado').count(),
+        )
+
+    def test_entregas(self):
+        self.assertMesmoStatus(Entrega)
+
+    def test_marcos(self):
+        self.assertMesmoStatus(Marco)
+        self.assertEqual(Marco.objects.por_status_prazo('atrasado').count(), 3)
+
+
+class CaminhoCriticoTests(SimpleTestCase):
+    """Cálculo do cronograma (projetos.caminho_critico) sobre grafos montados à mão"""
+
+    def grafo(self, nos, arestas):
+        grafo = {'nos': {}, 'sucessores': {}, 'predecessores': {}}
+        for chave, inicio, duracao in nos:
+            grafo['nos'][chave] = {'inicio': inicio, 'duracao': duracao}
+        for predecessora, sucessora, defasagem in arestas:
+            grafo['sucessores'].setdefault(predecessora, []).append((sucessora, defasagem))
+            grafo['predecessores'].setdefault(sucessora, []).append((predecessora, defasagem))
+        return grafo
+
+    def test_caminho_critico(self):
+        # a(3) -> b(4) -> d(2) e a -> c(1) -> d: o caminho crítico é a, b, d
+        cronograma = caminho_critico.calcular(self.grafo(
+            [('a', 0, 3), ('b', 0, 4), ('c', 0, 1), ('d', 0, 2)],
+            [('a', 'b', 0), ('a', 'c', 0), ('b', 'd', 0), ('c', 'd', 0)],
+        ))
+        nos = cronograma['nos']
+        self.assertEqual(cronograma['fim'], 9)
+        self.assertEqual((nos['d']['es'], nos['d']['ef']), (7, 9))
+        self.assertEqual({chave for chave, no in nos.items() if no['ls'] == no['es']}, {'a', 'b', 'd'})
+        self.assertEqual(nos['c']['ls'] - nos['c']['es'], 3)
+
+    def test_defasagem_e_inicio_previsto(self):
+        cronograma = caminho_critico.calcular(self.grafo(
+            [('a', 0, 2), ('b', 10, 1)], [('a', 'b', 3)],
+        ))
+        # b não começa antes do início previsto (10), mesmo com a terminando em 2 + 3
+        self.assertEqual(cronograma['nos']['b']['es'], 10)
+        self.assertEqual(cronograma['nos']['a']['ls'] - cronograma['nos']['a']['es'], 5)
+
+    def test_ciclo(self):
+        with self.assertRaises(caminho_critico.CicloDependencias):
+            caminho_critico.calcular(self.grafo(
+                [('a', 0, 1), ('b', 0, 1)], [('a', 'b', 0), ('b', 'a', 0)],
+            ))
+
+    def test_atualizacao_incremental_igual_ao_calculo_completo(self):
+        # Grafo em camadas: cada nó depende de alguns nós das camadas anteriores
+        nos = [(f'n{i}', i % 7, 1 + i % 5) for i in range(60)]
+        arestas = [(f'n{i}', f'n{j}', (i + j) % 3) for j in range(60) for i in range(j) if (i * 7 + j) % 11 == 0]
+        cache.set(caminho_critico.chave_cache(0), caminho_critico.calcular(self.grafo(nos, arestas)))
+
+        for chave, duracao in (('n3', 20), ('n25', 1), ('n59', 40), ('n3', 1)):
+            inicio = self.grafo(nos, arestas)['nos'][chave]['inicio']
+            incremental = caminho_critico.atualizar_no(0, chave, inicio, duracao)
+
+            nos = [(c, i, duracao if c == chave else d) for c, i, d in nos]
+            completo = caminho_critico.calcular(self.grafo(nos, arestas))
+            self.assertEqual(incremental['fim'], completo['fim'])
+            self.assertEqual(incremental['nos'], completo['nos'])
+        cache.delete(caminho_critico.chave_cache(0))
+
+    def test_atualizacao_concorrente_descarta_o_cronograma(self):
+        grafo = self.grafo([('a', 0, 3), ('b', 0, 4)], [('a', 'b', 0)])
+        self.addCleanup(cache.delete, caminho_critico.chave_cache(0))
+
+        # Trava ocupada por outra atualização
+        cache.set(caminho_critico.chave_cache(0), caminho_critico.calcular(grafo))
+        cache.add(caminho_critico.chave_trava(0), 0)
+        self.assertIsNone(caminho_critico.atualizar_no(0, 'a', 0, 5))
+        self.assertIsNone(cache.get(caminho_critico.chave_cache(0)))
+        cache.delete(caminho_critico.chave_trava(0))
+
+        # Invalidação no meio do cálculo: o resultado não fica no cache
+        cache.set(caminho_critico.chave_cache(0), caminho_critico.calcular(grafo))
+        volta = caminho_critico._volta
+
+        def volta_com_invalidacao(*args):
+            caminho_critico.invalidar(0)
+            volta(*args)
+
+        with mock.patch.object(caminho_critico, '_volta', volta_com_invalidacao):
+            self.assertIsNone(caminho_critico.atualizar_no(0, 'a', 0, 5))
+        self.assertIsNone(cache.get(caminho_critico.chave_cache(0)))
+        self.assertIsNone(cache.get(caminho_critico.chave_trava(0)))
+
+
+class CronogramaTests(TestCase):
+    """Dependências entre fases e entregas e a API do Gantt"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.usuario = User.objects.create_user('gerente')
+        tipo = TipoProjeto.objects.create(nome='Pesquisa', prefixo='PES', metodologia_sugerida='agil')
+        cls.projeto = Projeto.objects.create(
+            nome='Projeto', descricao='-', codigo='PES-001', tipo_projeto=tipo,
+            gerente_projeto=cls.usuario, patrocinador=cls.usuario,
+            objetivos='-', escopo_produto='-', escopo_trabalho='-',
+            data_inicio_prevista=date(2025, 1, 1), data_fim_prevista=date(2025, 6, 30),
+        )
+        cls.fase = FaseProjeto.objects.create(
+            projeto=cls.projeto, nome='Levantamento', ordem=1,
+            data_inicio_prevista=date(2025, 1, 1), data_fim_prevista=date(2025, 1, 31),
+        )
+        cls.entrega = Entrega.objects.create(
+            projeto=cls.projeto, fase=cls.fase, nome='Relatório', descricao='-',
+            responsavel=cls.usuario, data_prevista=date(2025, 1, 20), duracao_dias=5,
+        )
+        DependenciaCronograma.objects.create(
+            projeto=cls.projeto, fase_predecessora=cls.fase, entrega_sucessora=cls.entrega,
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.usuario)
+
+    def cronograma(self):
+        resposta = self.client.get(f'/projetos/projetos/{self.projeto.uuid}/cronograma/')
+        self.assertEqual(resposta.status_code, 200)
+        return {tarefa['id']: tarefa for tarefa in resposta.json()['tarefas']}
+
+    def test_api_projeto(self):
+        tarefas = self.cronograma()
+        entrega = tarefas[f'e{self.entrega.pk}']
+        # A entrega só começa depois do fim da fase
+        self.assertEqual((entrega['inicio'], entrega['fim']), ('2025-01-31', '2025-02-05'))
+        self.assertEqual(entrega['dependencias'], [{'id': f'f{self.fase.pk}', 'defasagem': 0}])
+        self.assertTrue(all(tarefa['critica'] for tarefa in tarefas.values()))
+
+    def test_mudanca_de_data_atualiza_cronograma_em_cache(self):
+        self.cronograma()
+        self.fase.data_fim_prevista = date(2025, 2, 10)
+        self.fase.save()
+
+        # Sessão, usuário, projeto e os nomes de fases, entregas e marcos; o cronograma vem do cache
+        with self.assertNumQueries(6):
+            tarefas = self.cronograma()
+        self.assertEqual(tarefas[f'e{self.entrega.pk}']['inicio'], '2025-02-10')
+
+    def test_dependencia_em_ciclo(self):
+        dependencia = DependenciaCronograma(
+            projeto=self.projeto, entrega_predecessora=self.entrega, fase_sucessora=self.fase,
+        )
+        with self.assertRaisesMessage(ValidationError, 'ciclo'):
+            dependencia.full_clean()
+
+
+class AlocacaoTests(SimpleTestCase):
+    """Varredura dos intervalos de alocação (projetos.alocacao)"""
+
+    def test_sobreposicao_acima_do_limite(self):
+        conflitos = alocacao.encontrar_conflitos([
+            (1, 10, 60, date(2025, 1, 1), date(2025, 3, 31)),
+            (1, 20, 50, date(2025, 2, 1), None),
+            (1, 30, 30, date(2025, 3, 1), date(2025, 3, 10)),
+            # Outro membro, sem conflito
+            (2, 10, 100, date(2025, 1, 1), None),
+        ])
+        self.assertEqual(
+            [(c['inicio'], c['fim'], c['dedicacao']) for c in conflitos],
+            [
+                (date(2025, 2, 1), date(2025, 2, 28), 110),
+                (date(2025, 3, 1), date(2025, 3, 10), 140),
+                (date(2025, 3, 11), date(2025, 3, 31), 110),
+            ],
+        )
+        self.assertEqual(conflitos[1]['projetos'], {10: 60, 20: 50, 30: 30})
+
+    def test_saida_e_entrada_no_mesmo_dia(self):
+        # Sai em 31/01 e entra em outro projeto em 01/02: não há sobreposição
+        self.assertEqual(alocacao.encontrar_conflitos([
+            (1, 10, 100, date(2025, 1, 1), date(2025, 1, 31)),
+            (1, 20, 100, date(2025, 2, 1), None),
+        ]), [])
+
+    def test_conflito_em_aberto(self):
+        [conflito] = alocacao.encontrar_conflitos([
+            (1, 10, 80, date(2025, 1, 1), None),
+            (1, 20, 80, date(2025, 1, 15), None),
+        ])
+        self.assertEqual((conflito['inicio'], conflito['fim']), (date(2025, 1, 15), None))
+
+
+class RelatorioAlocacaoTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = User.objects.create_user('staff', is_staff=True)
+        cls.membro = User.objects.create_user('membro', first_name='Ana', last_name='Souza')
+        tipo = TipoProjeto.objects.create(nome='Pesquisa', prefixo='PES', metodologia_sugerida='agil')
+        cls.projetos = [
+            Projeto.objects.create(
+                nome=f'Projeto {numero}', descricao='-', codigo=f'PES-{numero:03}', tipo_projeto=tipo,
+                gerente_projeto=cls.staff, patrocinador=cls.staff,
+                objetivos='-', escopo_produto='-', escopo_trabalho='-',
+                data_inicio_prevista=date(2025, 1, 1), data_fim_prevista=date(2025, 12, 31),
+            )
+            for numero in range(2)
+        ]
+        EquipeProjeto.objects.create(
+            projeto=cls.projetos[0], membro=cls.membro, papel='analista',
+            dedicacao_percentual=70, data_entrada=date(2025, 1, 1),
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def test_somente_staff(self):
+        self.client.force_login(self.membro)
+        resposta = self.client.get('/projetos/relatorios/alocacao/')
+        self.assertEqual(resposta.status_code, 302)
+
+    def test_cache_invalidado_ao_salvar_equipe(self):
+        self.client.force_login(self.staff)
+        self.assertEqual(self.client.get('/projetos/relatorios/alocacao/').context['conflitos'], [])
+
+        EquipeProjeto.objects.create(
+            projeto=self.projetos[1], membro=self.membro, papel='analista',
+            dedicacao_percentual=50, data_entrada=date(2025, 6, 1),
+        )
+        resposta = self.client.get('/projetos/relatorios/alocacao/')
+        [conflito] = resposta.context['conflitos']
+        self.assertEqual((conflito['membro'], conflito['dedicacao']), (self.membro, 120))
+        self.assertContains(resposta, 'Ana Souza')
+
+
+class HierarquiaUnidadeTests(TestCase):
+    """Tabela de fechamento das unidades e totais por subárvore"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.usuario = User.objects.create_user('gestor')
+        cls.secretaria = UnidadeOrganizacional.objects.create(nome='Secretaria', sigla='SEC')
+        cls.diretoria = UnidadeOrganizacional.objects.create(nome='Diretoria', sigla='DIR', unidade_pai=cls.secretaria)
+        cls.nucleo = UnidadeOrganizacional.objects.create(nome='Núcleo', sigla='NUC', unidade_pai=cls.diretoria)
+        cls.outra = UnidadeOrganizacional.objects.create(nome='Outra', sigla='OUT')
+
+        categoria = CategoriaEstrategica.objects.create(nome='Inovação')
+        tipo = TipoProjeto.objects.create(nome='Pesquisa', prefixo='PES', metodologia_sugerida='agil')
+        for numero, unidade in enumerate((cls.diretoria, cls.nucleo, cls.outra)):
+            portfolio = Portfolio.objects.create(
+                nome=f'Portfólio {numero}', descricao='-', codigo=f'P{numero}',
+                gestor_portfolio=cls.usuario, patrocinador=cls.usuario,
+                unidade_organizacional=unidade, categoria_estrategica=categoria,
+                orcamento_total=1000, data_inicio=date(2025, 1, 1), data_fim_prevista=date(2025, 12, 31),
+            )
+            Projeto.objects.create(
+                nome=f'Projeto {numero}', descricao='-', codigo=f'PES-{numero:03}', tipo_projeto=tipo,
+                portfolio=portfolio, gerente_projeto=cls.usuario, patrocinador=cls.usuario,
+                objetivos='-', escopo_produto='-', escopo_trabalho='-', orcamento_total=100,
+                data_inicio_prevista=date(2025, 1, 1), data_fim_prevista=date(2025, 12, 31),
+            )
+
+    def test_subarvore(self):
+        self.assertCountEqual(
+            UnidadeOrganizacional.objects.subarvore(self.secretaria),
+            [self.secretaria, self.diretoria, self.nucleo],
+        )
+        self.assertEqual(
+            list(UnidadeOrganizacional.objects.ancestrais_de(self.nucleo)),
+            [self.secretaria, self.diretoria, self.nucleo],
+        )
+        self.assertEqual(unidades.projetos_da_subarvore(self.diretoria).count(), 2)
+
+    def test_mover_subarvore(self):
+        self.diretoria.unidade_pai = self.outra
+        self.diretoria.save()
+
+        self.assertEqual(
+            HierarquiaUnidade.objects.get(ancestral=self.outra, descendente=self.nucleo).profundidade, 2,
+        )
+        self.assertFalse(HierarquiaUnidade.objects.filter(ancestral=self.secretaria, descendente=self.nucleo).exists())
+        self.assertEqual(UnidadeOrganizacional.objects.subarvore(self.secretaria).count(), 1)
+
+    def test_ciclo(self):
+        self.secretaria.unidade_pai = self.nucleo
+        with self.assertRaises(ValidationError):
+            self.secretaria.full_clean()
+
+    def test_totais_por_subarvore(self):
+        totais = unidades.totais_por_unidade()
+        self.assertEqual(totais[self.secretaria.id]['portfolios'], 2)
+        self.assertEqual(totais[self.secretaria.id]['projetos'], 2)
+        self.assertEqual(totais[self.secretaria.id]['orcamento_portfolios'], 2000)
+        self.assertEqual(totais[self.nucleo.id]['orcamento_projetos'], 100)
+        self.assertEqual(totais[self.outra.id]['projetos'], 1)
+
+    def test_api_unidades(self):
+        self.client.force_login(self.usuario)
+        resposta = self.client.get('/projetos/api/unidades/', {'unidade': 'nao-e-uuid'})
+        self.assertEqual(resposta.status_code, 400)
+
+        resposta = self.client.get('/projetos/api/unidades/', {'unidade': str(self.diretoria.uuid)})
+        self.assertEqual(
+            sorted(unidade['sigla'] for unidade in resposta.json()['unidades']), ['DIR', 'NUC'],
+        )
+
+
+    def test_listar_projetos_por_unidade(self):
+        self.client.force_login(self.usuario)
+        resposta = self.client.get('/projetos/projetos/', {'unidade': str(self.diretoria.uuid)})
+        self.assertEqual(sorted(projeto.codigo for projeto in resposta.context['projetos']), ['PES-000', 'PES-001'])
+        self.assertContains(resposta, f'value="{self.diretoria.uuid}" selected')
+
+        # UUID malformado: o filtro é ignorado em vez de um erro 500
+        resposta = self.client.get('/projetos/projetos/', {'unidade': 'abc', 'portfolio': 'abc'})
+        self.assertEqual(resposta.status_code, 200)
+        self.assertEqual(len(resposta.context['projetos']), 3)
+
+class RelatoriosTests(TestCase):
+    """Relatórios de portfólio, programa e projeto em streaming"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.usuario = User.objects.create_user('gestor', first_name='Ana', last_name='Souza')
+        unidade = UnidadeOrganizacional.objects.create(nome='Secretaria', sigla='SEC')
+        categoria = CategoriaEstrategica.objects.create(nome='Inovação')
+        cls.portfolio = Portfolio.objects.create(
+            nome='Portfólio', descricao='-', codigo='P1',
+            gestor_portfolio=cls.usuario, patrocinador=cls.usuario,
+            unidade_organizacional=unidade, categoria_estrategica=categoria,
+            data_inicio=date(2025, 1, 1), data_fim_prevista=date(2025, 12, 31),
+        )
+        cls.programa = Programa.objects.create(
+            nome='Programa', descricao='-', codigo='PR1', portfolio=cls.portfolio,
+            gerente_programa=cls.usuario, objetivos='-', beneficios_esperados='-',
+            data_inicio=date(2025, 1, 1), data_fim_prevista=date(2025, 12, 31),
+        )
+        tipo = TipoProjeto.objects.create(nome='Pesquisa', prefixo='PES', metodologia_sugerida='agil')
+        # Um projeto ligado direto ao portfólio e quatro ao programa
+        for numero in range(5):
+            projeto = Projeto.objects.create(
+                nome=f'Projeto {numero}', descricao='-', codigo=f'PES-{numero:03}', tipo_projeto=tipo,
+                portfolio=cls.portfolio if numero == 0 else None,
+                programa=None if numero == 0 else cls.programa,
+                gerente_projeto=cls.usuario, patrocinador=cls.usuario,
+                objetivos='-', escopo_produto='-', escopo_trabalho='-', orcamento_total=1000,
+                data_inicio_prevista=date(2025, 1, 1), data_fim_prevista=date(2025, 12, 31),
+            )
+            Entrega.objects.create(
+                projeto=projeto, nome=f'Entrega {numero}', descricao='-',
+                responsavel=cls.usuario, data_prevista=date(2025, 3, 1),
+            )
+            RiscoProjeto.objects.create(
+                projeto=projeto, titulo='Risco', descricao='-', categoria='tecnico',
+                probabilidade='muito_alta', impacto='muito_alto', estrategia_resposta='mitigar',
+                responsavel=cls.usuario, data_identificacao=date(2025, 1, 1),
+            )
+        cls.projeto = projeto
+
+    def setUp(self):
+        self.client.force_login(self.usuario)
+        diretorio = tempfile.TemporaryDirectory()
+        self.addCleanup(diretorio.cleanup)
+        configuracao = self.settings(RELATORIOS_DIR=diretorio.name)
+        configuracao.enable()
+        self.addCleanup(configuracao.disable)
+
+    def baixar(self, url):
+        resposta = self.client.get(url)
+        self.assertEqual(resposta.status_code, 200)
+        self.assertTrue(resposta.streaming)
+        return resposta, b''.join(resposta.streaming_content)
+
+    def test_lotes_com_prefetch(self):
+        projetos = relatorios.projetos_do_relatorio('portfolio', self.portfolio)
+        # Cada lote: projetos, entregas e riscos; a última consulta encontra a página vazia
+        with self.assertNumQueries(3 * 3 + 1):
+            lotes = list(relatorios.lotes(projetos, date(2025, 6, 1), tamanho_lote=2))
+        self.assertEqual([len(lote) for lote in lotes], [2, 2, 1])
+
+        linha = relatorios.linha_projeto(lotes[0][0])
+        self.assertEqual(linha['gerente'], 'Ana Souza')
+        self.assertEqual((linha['entregas'], linha['entregas_atrasadas']), (1, 1))
+        self.assertEqual((linha['riscos_abertos'], linha['riscos_altos']), (1, 1))
+
+    def test_csv(self):
+        resposta, conteudo = self.baixar(f'/projetos/relatorios/programa/{self.programa.uuid}/?formato=csv')
+        self.assertIn('attachment; filename="relatorio-programa-PR1-', resposta['Content-Disposition'])
+        linhas = list(csv.reader(io.StringIO(conteudo.decode('utf-8-sig')), delimiter=';'))
+        self.assertEqual(linhas[0][0], 'Código')
+        self.assertEqual([linha[0] for linha in linhas[1:]], ['PES-001', 'PES-002', 'PES-003', 'PES-004'])
+
+    def test_csv_neutraliza_formulas(self):
+        Projeto.objects.filter(codigo='PES-001').update(nome='=HYPERLINK("http://exemplo.com")')
+        _, conteudo = self.baixar(f'/projetos/relatorios/programa/{self.programa.uuid}/?formato=csv')
+        linhas = list(csv.reader(io.StringIO(conteudo.decode('utf-8-sig')), delimiter=';'))
+        self.assertEqual(linhas[1][1], '\'=HYPERLINK("http://exemplo.com")')
+
+    def test_xlsx(self):
+        _, conteudo = self.baixar(f'/projetos/relatorios/portfolio/{self.portfolio.uuid}/?formato=xlsx')
+        with zipfile.ZipFile(io.BytesIO(conteudo)) as pacote:
+            self.assertIsNone(pacote.testzip())
+            planilha = pacote.read('xl/worksheets/sheet1.xml').decode('utf-8')
+        self.assertEqual(planilha.count('<row>'), 6)
+        self.assertIn('<t>PES-000</t>', planilha)
+
+    def test_html(self):
+        _, conteudo = self.baixar(f'/projetos/relatorios/projeto/{self.projeto.uuid}/')
+        pagina = conteudo.decode('utf-8')
+        self.assertIn('Relatório do Projeto', pagina)
+        self.assertIn('Entrega 4', pagina)
+        self.assertNotIn(relatorios.MARCADOR_LINHAS, pagina)
+        self.assertTrue(pagina.rstrip().endswith('</html>'))
+
+    def test_formato_invalido(self):
+        resposta = self.client.get(f'/projetos/relatorios/projeto/{self.projeto.uuid}/?formato=pdf')
+        self.assertEqual(resposta.status_code, 400)
+
+    def test_arquivo_gerado_e_reaproveitado(self):
+        url = f'/projetos/relatorios/programa/{self.programa.uuid}/?formato=csv'
+        primeira, conteudo = self.baixar(url)
+        versao = primeira['X-Relatorio-Versao']
+        self.assertTrue(artefatos.caminho('programa', self.programa, 'csv', versao).exists())
+
+        segunda, repetido = self.baixar(url)
+        self.assertEqual(segunda['X-Relatorio-Versao'], versao)
+        self.assertIn('attachment', segunda['Content-Disposition'])
+        self.assertEqual(repetido, conteudo)
+
+    def test_arquivo_desatualizado_servido_enquanto_regenera(self):
+        url = f'/projetos/relatorios/projeto/{self.projeto.uuid}/'
+        versao = self.baixar(url)[0]['X-Relatorio-Versao']
+
+        Entrega.objects.create(
+            projeto=self.projeto, nome='Entrega nova', descricao='-',
+            responsavel=self.usuario, data_prevista=date(2025, 9, 1),
+        )
+        with mock.patch.object(artefatos, 'agendar') as agendar:
+            resposta, conteudo = self.baixar(url)
+        agendar.assert_called_once_with('projeto', self.projeto, 'html')
+        self.assertEqual(resposta['X-Relatorio-Versao'], versao)
+        self.assertEqual(resposta['X-Relatorio-Desatualizado'], '1')
+        self.assertNotIn(b'Entrega nova', conteudo)
+
+        # O que o worker em segundo plano executa
+        novo = artefatos.gerar('projeto', self.projeto, 'html')
+        self.assertIn(b'Entrega nova', novo.read_bytes())
+        self.assertEqual(artefatos.versoes_em_disco('projeto', self.projeto, 'html'), [novo])
+
+    def test_arquivo_apagado_antes_de_abrir(self):
+        # A versão antiga listada some antes do open (apagada por _gravando)
+        apagado = artefatos.diretorio() / 'projeto' / f'{self.projeto.uuid}-antiga.html'
+        with mock.patch.object(artefatos, 'versoes_em_disco', return_value=[apagado]), \
+                mock.patch.object(artefatos, 'agendar'):
+            resposta, conteudo = self.baixar(f'/projetos/relatorios/projeto/{self.projeto.uuid}/')
+        self.assertNotIn('X-Relatorio-Desatualizado', resposta)
+        self.assertIn(b'Entrega 4', conteudo)
+
+    def test_versao_acompanha_nomes_exibidos(self):
+        hoje = date(2025, 6, 1)
+        projeto = Projeto.objects.get(codigo='PES-000')
+        versoes = {artefatos.versao('projeto', projeto, hoje)}
+
+        self.usuario.first_name = 'Ana Maria'
+        self.usuario.save()
+        versoes.add(artefatos.versao('projeto', projeto, hoje))
+
+        self.portfolio.nome = 'Portfólio renomeado'
+        self.portfolio.save()
+        versoes.add(artefatos.versao('projeto', projeto, hoje))
+        self.assertEqual(len(versoes), 3)
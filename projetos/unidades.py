@@ -0,0 +1,71 @@
+"""
+Consultas e totais por subárvore de unidades organizacionais.
+
+O portfólio pertence a uma unidade; programas e projetos herdam a unidade
+do portfólio (o projeto ligado só a um programa usa o portfólio do
+programa). As subárvores vêm da tabela HierarquiaUnidade com um único join.
+"""
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import Coalesce
+
+from .models import HierarquiaUnidade, Portfolio, Projeto, UnidadeOrganizacional
+
+CAMPO_UNIDADE_PROJETO = Coalesce(
+    'portfolio__unidade_organizacional_id', 'programa__portfolio__unidade_organizacional_id',
+)
+
+
+def portfolios_da_subarvore(unidade):
+    return Portfolio.objects.filter(unidade_organizacional__ancestrais__ancestral=unidade)
+
+
+def projetos_da_subarvore(unidade):
+    return Projeto.objects.annotate(unidade_id=CAMPO_UNIDADE_PROJETO).filter(
+        unidade_id__in=HierarquiaUnidade.objects.filter(ancestral=unidade).values('descendente_id'),
+    )
+
+
+def _somar(destino, origem):
+    for campo, valor in origem.items():
+        destino[campo] = destino.get(campo, 0) + (valor or 0)
+
+
+def totais_por_unidade():
+    """
+    {unidade_id: totais da subárvore}. Os totais diretos de cada unidade saem
+    de duas consultas agrupadas e são somados a cada ancestral percorrendo a
+    tabela de fechamento uma vez.
+    """
+    diretos = {}
+    portfolios = Portfolio.objects.filter(ativo=True).values('unidade_organizacional_id').annotate(
+        portfolios=Count('id'),
+        orcamento_portfolios=Sum('orcamento_total'),
+    ).order_by()
+    for linha in portfolios:
+        _somar(diretos.setdefault(linha.pop('unidade_organizacional_id'), {}), linha)
+
+    projetos = Projeto.objects.filter(ativo=True).annotate(
+        unidade_id=CAMPO_UNIDADE_PROJETO,
+    ).exclude(unidade_id=None).values('unidade_id').annotate(
+        projetos=Count('id'),
+        projetos_em_execucao=Count('id', filter=Q(status='em_execucao')),
+        orcamento_projetos=Sum('orcamento_total'),
+        orcamento_consumido=Sum('orcamento_consumido'),
+    ).order_by()
+    for linha in projetos:
+        _somar(diretos.setdefault(linha.pop('unidade_id'), {}), linha)
+
+    campos = (
+        'portfolios', 'orcamento_portfolios', 'projetos', 'projetos_em_execucao',
+        'orcamento_projetos', 'orcamento_consumido',
+    )
+    totais = {
+        unidade_id: dict.fromkeys(campos, 0)
+        for unidade_id in UnidadeOrganizacional.objects.values_list('id', flat=True)
+    }
+    ligacoes = HierarquiaUnidade.objects.filter(descendente_id__in=list(diretos)).values_list(
+        'ancestral_id', 'descendente_id',
+    )
+    for ancestral_id, descendente_id in ligacoes:
+        _somar(totais[ancestral_id], diretos[descendente_id])
+    return totais
@@ -21,18 +21,26 @@ urlpatterns = [
     path('programas/<uuid:uuid>/', views.detalhar_programa, name='detalhar_programa'),
     path('programas/<uuid:uuid>/editar/', views.editar_programa, name='editar_programa'),
     path('programas/<uuid:uuid>/excluir/', views.excluir_programa, name='excluir_programa'),
+    path('programas/<uuid:uuid>/cronograma/', views.api_cronograma_programa, name='cronograma_programa'),
     
     # Projetos
     path('projetos/', views.listar_projetos, name='listar_projetos'),
     path('projetos/<uuid:uuid>/', views.detalhar_projeto, name='detalhar_projeto'),
+    path('projetos/<uuid:uuid>/cronograma/', views.api_cronograma_projeto, name='cronograma_projeto'),
     
     # Relatórios
     path('relatorios/', views.relatorios, name='relatorios'),
+    path('relatorios/alocacao/', views.relatorio_alocacao, name='relatorio_alocacao'),
     path('relatorios/portfolio/<uuid:uuid>/', views.relatorio_portfolio, name='relatorio_portfolio'),
     path('relatorios/programa/<uuid:uuid>/', views.relatorio_programa, name='relatorio_programa'),
     path('relatorios/projeto/<uuid:uuid>/', views.relatorio_projeto, name='relatorio_projeto'),
+    path('relatorios/projeto/<uuid:uuid>/pdf/', views.relatorio_projeto_pdf, name='relatorio_projeto_pdf'),
     
     # APIs para dashboard
     path('api/estatisticas/', views.api_estatisticas, name='api_estatisticas'),
     path('api/graficos/', views.api_graficos, name='api_graficos'),
+    path('api/evm/', views.api_evm, name='api_evm'),
+    path('api/tendencias/', views.api_tendencias, name='api_tendencias'),
+    path('api/matriz-riscos/', views.api_matriz_riscos, name='api_matriz_riscos'),
+    path('api/unidades/', views.api_unidades, name='api_unidades'),
 ]
\ No newline at end of file
@@ -1,13 +1,27 @@
 from django.shortcuts import render, get_object_or_404, redirect
-from django.contrib.auth.decorators import login_required
+from django.contrib.auth.decorators import login_required, user_passes_test
+from django.contrib.auth.models import User
 from django.contrib import messages
 from django.http import JsonResponse
 from django.db.models import Count, Sum, Avg, Q
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from django.views.decorators.http import require_POST
 from datetime import date, timedelta
-from .models import *
+from uuid import UUID
+from .models import (
+    STATUS_PRAZO, STATUS_RISCO_ABERTO, NIVEIS_PROBABILIDADE, NIVEIS_IMPACTO,
+    StatusChoices, NivelRiscoChoices, Portfolio, Programa, Projeto, RiscoProjeto,
+    UnidadeOrganizacional,
+)
+from core import fila_pdf
 from .forms import PortfolioForm, ProgramaForm
+from . import alocacao, artefatos, caminho_critico, evm, snapshots, unidades
+from . import relatorios as relatorios_projetos
+
+
+def staff_required(user):
+    return user.is_staff
 
 # =============================================================================
 # DASHBOARD PRINCIPAL
@@ -39,11 +53,12 @@ def dashboard(request):
         status__in=['em_execucao', 'em_planejamento', 'em_monitoramento']
     ).count()
     
-    # Riscos altos
+    # Riscos altos ainda em aberto (índice risco_ativo_nivel_idx)
     riscos_altos = RiscoProjeto.objects.filter(
         ativo=True,
         projeto__ativo=True,
-        status__in=['identificado', 'em_analise', 'em_tratamento', 'monitorando']
+        nivel=NivelRiscoChoices.ALTO,
+        status__in=STATUS_RISCO_ABERTO,
     ).count()
     
     context = {
@@ -223,10 +238,19 @@ def detalhar_programa(request, uuid):
 # PROJETOS
 # =============================================================================
 
+def _uuid_ou_none(valor):
+    """O UUID do parâmetro, ou None se vier vazio ou malformado"""
+    try:
+        return UUID(valor) if valor else None
+    except ValueError:
+        return None
+
+
 @login_required
 def listar_projetos(request):
     """Lista todos os projetos"""
-    projetos = Projeto.objects.filter(ativo=True).select_related(
+    hoje = date.today()
+    projetos = Projeto.objects.filter(ativo=True).com_status_prazo(hoje).select_related(
         'portfolio', 'programa', 'tipo_projeto', 'gerente_projeto'
     ).order_by('-prioridade', 'nome')
     
@@ -235,16 +259,36 @@ def listar_projetos(request):
     if status_filter:
         projetos = projetos.filter(status=status_filter)
     
-    portfolio_filter = request.GET.get('portfolio')
+    # Filtros por UUID: um valor malformado na URL é ignorado
+    portfolio_filter = _uuid_ou_none(request.GET.get('portfolio'))
     if portfolio_filter:
         projetos = projetos.filter(portfolio__uuid=portfolio_filter)
     
+    # Projetos da unidade e de todas as suas subunidades
+    unidade_filter = _uuid_ou_none(request.GET.get('unidade'))
+    if unidade_filter:
+        unidade = get_object_or_404(UnidadeOrganizacional, uuid=unidade_filter)
+        projetos = projetos.filter(pk__in=unidades.projetos_da_subarvore(unidade).values('pk'))
+    
+    prazo_filter = request.GET.get('prazo')
+    if prazo_filter in dict(STATUS_PRAZO):
+        projetos = projetos.por_status_prazo(prazo_filter, hoje)
+    
+    ordem = request.GET.get('ordem')
+    if ordem == 'prazo':
+        projetos = projetos.order_by('data_fim_prevista', 'nome')
+    
     context = {
         'projetos': projetos,
         'portfolios': Portfolio.objects.filter(ativo=True),
+        'unidades': UnidadeOrganizacional.objects.filter(ativo=True),
         'status_choices': StatusChoices.choices,
+        'prazo_choices': STATUS_PRAZO,
         'status_filter': status_filter,
         'portfolio_filter': portfolio_filter,
+        'unidade_filter': unidade_filter,
+        'prazo_filter': prazo_filter,
+        'ordem': ordem,
     }
     
     return render(request, 'projetos/projetos/listar.html', context)
@@ -289,26 +333,79 @@ def relatorios(request):
     """Página principal de relatórios"""
     return render(request, 'projetos/relatorios/index.html')
 
+def _resposta_relatorio(request, tipo, objeto):
+    """Relatório no formato de ?formato= (html, csv ou xlsx), servido do arquivo gerado"""
+    formato = request.GET.get('formato', 'html')
+    if formato not in relatorios_projetos.FORMATOS:
+        return JsonResponse({'error': 'Formato inválido'}, status=400)
+    return artefatos.resposta(tipo, objeto, formato)
+
 @login_required
 def relatorio_portfolio(request, uuid):
     """Relatório detalhado do portfólio"""
     portfolio = get_object_or_404(Portfolio, uuid=uuid)
-    # TODO: Implementar relatório detalhado
-    return render(request, 'projetos/relatorios/portfolio.html', {'portfolio': portfolio})
+    return _resposta_relatorio(request, 'portfolio', portfolio)
 
 @login_required
 def relatorio_programa(request, uuid):
     """Relatório detalhado do programa"""
     programa = get_object_or_404(Programa, uuid=uuid)
-    # TODO: Implementar relatório detalhado
-    return render(request, 'projetos/relatorios/programa.html', {'programa': programa})
+    return _resposta_relatorio(request, 'programa', programa)
 
 @login_required
 def relatorio_projeto(request, uuid):
     """Relatório detalhado do projeto"""
     projeto = get_object_or_404(Projeto, uuid=uuid)
-    # TODO: Implementar relatório detalhado
-    return render(request, 'projetos/relatorios/projeto.html', {'projeto': projeto})
+    return _resposta_relatorio(request, 'projeto', projeto)
+
+@login_required
+def relatorio_projeto_pdf(request, uuid):
+    """
+    Relatório de status do projeto em PDF, gerado pelo worker processar_pdfs.
+    O conteúdo só é montado (e a tarefa enfileirada) quando o PDF é pedido.
+    """
+    projeto = get_object_or_404(Projeto, uuid=uuid)
+    tarefa = fila_pdf.preparar('projeto', projeto, refazer_erro=True)
+    if tarefa.pronta:
+        response = fila_pdf.resposta(tarefa, projeto, f'projeto-{projeto.codigo}.pdf')
+        if response is not None:
+            return response
+    if tarefa.erro:
+        messages.warning(request, 'A geração do PDF deste projeto falhou e foi reiniciada. Tente novamente em instantes.')
+    else:
+        messages.info(request, 'O PDF deste projeto ainda está sendo gerado. Tente novamente em instantes.')
+    return redirect('projetos:detalhar_projeto', uuid=projeto.uuid)
+
+@login_required
+@user_passes_test(staff_required)
+def relatorio_alocacao(request):
+    """Períodos em que membros da equipe estão alocados acima de 100% somando os projetos"""
+    conflitos = alocacao.conflitos()
+
+    membros = User.objects.in_bulk({conflito['membro_id'] for conflito in conflitos})
+    projetos = Projeto.objects.only('uuid', 'codigo', 'nome').in_bulk(
+        {projeto_id for conflito in conflitos for projeto_id in conflito['projetos']}
+    )
+
+    linhas = [
+        {
+            **conflito,
+            'membro': membros.get(conflito['membro_id']),
+            'alocacoes': sorted(
+                [(projetos.get(projeto_id), dedicacao) for projeto_id, dedicacao in conflito['projetos'].items()],
+                key=lambda item: -item[1],
+            ),
+        }
+        for conflito in conflitos
+    ]
+
+    context = {
+        'conflitos': linhas,
+        'total_membros': len(membros),
+        'limite': alocacao.LIMITE_DEDICACAO,
+    }
+
+    return render(request, 'projetos/relatorios/alocacao.html', context)
 
 # =============================================================================
 # APIs PARA DASHBOARD
@@ -353,7 +450,8 @@ def api_estatisticas(request):
             'altos': RiscoProjeto.objects.filter(
                 ativo=True,
                 projeto__ativo=True,
-                status__in=['identificado', 'em_analise', 'em_tratamento']
+                nivel=NivelRiscoChoices.ALTO,
+                status__in=STATUS_RISCO_ABERTO,
             ).count(),
         }
     }
@@ -411,6 +509,201 @@ def api_graficos(request):
     return JsonResponse(data)
 
 
+@login_required
+def api_evm(request):
+    """API com os indicadores de valor agregado consolidados por portfólio e programa"""
+    portfolios, programas = evm.indicadores_consolidados()
+
+    nomes_portfolios = dict(Portfolio.objects.filter(id__in=portfolios).values_list('id', 'nome'))
+    nomes_programas = dict(Programa.objects.filter(id__in=programas).values_list('id', 'nome'))
+
+    data = {
+        'data_referencia': date.today().isoformat(),
+        'portfolios': [
+            {'id': chave, 'nome': nomes_portfolios.get(chave), **valores}
+            for chave, valores in portfolios.items()
+        ],
+        'programas': [
+            {'id': chave, 'nome': nomes_programas.get(chave), **valores}
+            for chave, valores in programas.items()
+        ],
+    }
+
+    return JsonResponse(data)
+
+
+@login_required
+def api_tendencias(request):
+    """API com as séries diárias gravadas pelo comando registrar_snapshots"""
+    fim = date.today()
+    inicio = fim - timedelta(days=90)
+    try:
+        if request.GET.get('inicio'):
+            inicio = date.fromisoformat(request.GET['inicio'])
+        if request.GET.get('fim'):
+            fim = date.fromisoformat(request.GET['fim'])
+    except ValueError:
+        return JsonResponse({'error': 'Datas devem estar no formato AAAA-MM-DD'}, status=400)
+
+    if inicio > fim:
+        return JsonResponse({'error': 'A data inicial deve ser anterior à final'}, status=400)
+
+    filtros = {}
+    for parametro, modelo in (('portfolio', Portfolio), ('programa', Programa), ('projeto', Projeto)):
+        if request.GET.get(parametro):
+            try:
+                chave = UUID(request.GET[parametro])
+            except ValueError:
+                return JsonResponse({'error': f'{parametro} deve ser um UUID'}, status=400)
+            filtros[parametro] = get_object_or_404(modelo, uuid=chave)
+
+    data = {
+        'inicio': inicio.isoformat(),
+        'fim': fim.isoformat(),
+        'serie': snapshots.serie_tendencias(inicio, fim, **filtros),
+    }
+
+    return JsonResponse(data)
+
+
+@login_required
+def api_matriz_riscos(request):
+    """
+    API com a matriz probabilidade x impacto (6 x 5) dos riscos em aberto
+    de cada portfólio, montada a partir de uma única consulta agrupada.
+    Projetos ligados apenas a um programa contam no portfólio do programa.
+    """
+    riscos = RiscoProjeto.objects.filter(
+        ativo=True,
+        projeto__ativo=True,
+        status__in=STATUS_RISCO_ABERTO,
+    ).annotate(
+        portfolio_id=Coalesce('projeto__portfolio_id', 'projeto__programa__portfolio_id'),
+    )
+
+    if request.GET.get('portfolio'):
+        try:
+            chave = UUID(request.GET['portfolio'])
+        except ValueError:
+            return JsonResponse({'error': 'portfolio deve ser um UUID'}, status=400)
+        portfolio = get_object_or_404(Portfolio, uuid=chave)
+        riscos = riscos.filter(portfolio_id=portfolio.id)
+
+    contagens = riscos.values('portfolio_id', 'probabilidade', 'impacto').annotate(
+        total=Count('id'),
+    ).order_by()
+
+    probabilidades = list(NIVEIS_PROBABILIDADE)
+    impactos = list(NIVEIS_IMPACTO)
+    linha_da_probabilidade = {nivel: posicao for posicao, nivel in enumerate(probabilidades)}
+    coluna_do_impacto = {nivel: posicao for posicao, nivel in enumerate(impactos)}
+    matrizes = {}
+    for linha in contagens:
+        # Valores fora das escolhas (dados antigos ou importados) não têm célula
+        posicao_probabilidade = linha_da_probabilidade.get(linha['probabilidade'])
+        posicao_impacto = coluna_do_impacto.get(linha['impacto'])
+        if posicao_probabilidade is None or posicao_impacto is None:
+            continue
+        matriz = matrizes.setdefault(
+            linha['portfolio_id'], [[0] * len(impactos) for _ in probabilidades]
+        )
+        matriz[posicao_probabilidade][posicao_impacto] = linha['total']
+
+    portfolios = Portfolio.objects.filter(id__in=[chave for chave in matrizes if chave is not None])
+    nomes = {portfolio.id: (str(portfolio.uuid), portfolio.nome) for portfolio in portfolios}
+
+    data = {
+        'probabilidades': probabilidades,
+        'impactos': impactos,
+        'pontuacao': [
+            [NIVEIS_PROBABILIDADE[probabilidade] * NIVEIS_IMPACTO[impacto] for impacto in impactos]
+            for probabilidade in probabilidades
+        ],
+        'portfolios': [
+            {
+                'uuid': nomes.get(chave, (None, None))[0],
+                'nome': nomes.get(chave, (None, 'Sem portfólio'))[1],
+                'matriz': matriz,
+                'total': sum(map(sum, matriz)),
+            }
+            for chave, matriz in matrizes.items()
+        ],
+    }
+
+    return JsonResponse(data)
+
+
+@login_required
+def api_cronograma_projeto(request, uuid):
+    """Cronograma do projeto (datas mais cedo/mais tarde, folgas e caminho crítico) para o Gantt"""
+    projeto = get_object_or_404(Projeto, uuid=uuid)
+    try:
+        [cronograma] = caminho_critico.gantt([projeto])
+    except caminho_critico.CicloDependencias as e:
+        return JsonResponse({'error': str(e)}, status=409)
+
+    return JsonResponse(cronograma)
+
+
+@login_required
+def api_cronograma_programa(request, uuid):
+    """Cronogramas de todos os projetos ativos do programa"""
+    programa = get_object_or_404(Programa, uuid=uuid)
+    projetos = programa.projetos.filter(ativo=True).order_by('data_inicio_prevista', 'nome')
+    try:
+        cronogramas = caminho_critico.gantt(projetos)
+    except caminho_critico.CicloDependencias as e:
+        return JsonResponse({'error': str(e)}, status=409)
+
+    data = {
+        'uuid': str(programa.uuid),
+        'codigo': programa.codigo,
+        'nome': programa.nome,
+        'inicio': min((c['inicio'] for c in cronogramas if c['inicio']), default=None),
+        'fim': max((c['fim'] for c in cronogramas if c['fim']), default=None),
+        'projetos': cronogramas,
+    }
+
+    return JsonResponse(data)
+
+
+@login_required
+def api_unidades(request):
+    """
+    API com a árvore de unidades organizacionais e os totais de cada
+    subárvore (portfólios, projetos e orçamentos), opcionalmente a partir
+    de uma unidade.
+    """
+    unidades_qs = UnidadeOrganizacional.objects.filter(ativo=True)
+    if request.GET.get('unidade'):
+        try:
+            chave = UUID(request.GET['unidade'])
+        except ValueError:
+            return JsonResponse({'error': 'unidade deve ser um UUID'}, status=400)
+        raiz = get_object_or_404(UnidadeOrganizacional, uuid=chave)
+        unidades_qs = unidades_qs.subarvore(raiz)
+
+    totais = unidades.totais_por_unidade()
+    lista = list(unidades_qs.values('id', 'uuid', 'sigla', 'nome', 'unidade_pai_id'))
+    uuids = {unidade['id']: str(unidade['uuid']) for unidade in lista}
+
+    data = {
+        'unidades': [
+            {
+                'uuid': uuids[unidade['id']],
+                'sigla': unidade['sigla'],
+                'nome': unidade['nome'],
+                'unidade_pai': uuids.get(unidade['unidade_pai_id']),
+                **{campo: float(valor) if campo.startswith('orcamento') else valor
+                   for campo, valor in totais[unidade['id']].items()},
+            }
+            for unidade in lista
+        ],
+    }
+
+    return JsonResponse(data)
+
+
 # =============================================================================
 # VIEWS CRUD - PROGRAMA
 # =============================================================================
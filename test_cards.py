@@ -1,15 +1,24 @@
 #!/usr/bin/env python
 import os
 import sys
+
 import django
 
-# Setup Django
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ponti_hub_inovacao.settings')
-django.setup()
 
-from core.models import CardQuemSomos
+def main():
+    # Setup Django
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ponti_hub_inovacao.settings')
+    django.setup()
+
+    from core.models import CardQuemSomos
+
+    print('Cards existentes:', CardQuemSomos.objects.count())
+    for card in CardQuemSomos.objects.all():
+        print(f'ID: {card.id}, Título: {card.titulo}')
+
 
-print('Cards existentes:', CardQuemSomos.objects.count())
-for card in CardQuemSomos.objects.all():
-    print(f'ID: {card.id}, Título: {card.titulo}')
\ No newline at end of file
+# Script avulso: o `manage.py test` importa este módulo na descoberta de
+# testes, e não deve consultar o banco real
+if __name__ == '__main__':
+    main()